@@ -0,0 +1,200 @@
+import math
+import threading
+
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+from linked_lists.rope import RopeList
+
+# Backends an AdaptiveList can move between. Any class with the shared API,
+# extend_from() and _text() can be added here together with a cost model.
+BACKENDS = {
+    'array': ArrayBasedList,
+    'indexed': lambda: ArrayBasedList(indexed=True),
+    'circular': CircularLinkedList,
+    'rope': RopeList,
+}
+
+# Calls are sampled by kind: 'get' and 'edit' (insert/delete) by index,
+# 'end' for O(1)-everywhere calls at the end of the list (append, get of the
+# last element), 'search' for findFirst/findLast/deleteAll and 'reverse'.
+KINDS = ('get', 'edit', 'end', 'search', 'reverse')
+
+# Estimated microseconds spent by `calls` calls of one kind on a list of
+# `size` elements, where `offsets` is the sum of the indices they touched.
+# The constants come from timing each backend at 1e3 to 1e6 elements (see
+# python -m linked_lists.bench) and assume the list is not reversed.
+COST_MODELS = {
+    'array': {
+        'get': lambda size, calls, offsets: 0.3 * calls,
+        'edit': lambda size, calls, offsets: 0.5 * calls + 0.00065 * (size * calls - offsets),
+        'end': lambda size, calls, offsets: 0.4 * calls,
+        'search': lambda size, calls, offsets: 0.02 * size * calls,
+        'reverse': lambda size, calls, offsets: 0.2 * calls,
+    },
+    'indexed': {
+        'get': lambda size, calls, offsets: 0.3 * calls,
+        'edit': lambda size, calls, offsets: 0.5 * calls + 0.1 * (size * calls - offsets),
+        'end': lambda size, calls, offsets: 0.5 * calls,
+        'search': lambda size, calls, offsets: 2.0 * calls,
+        'reverse': lambda size, calls, offsets: 0.2 * calls,
+    },
+    'circular': {
+        'get': lambda size, calls, offsets: 0.3 * calls + 0.02 * offsets,
+        'edit': lambda size, calls, offsets: 0.5 * calls + 0.02 * offsets,
+        'end': lambda size, calls, offsets: 0.5 * calls,
+        'search': lambda size, calls, offsets: 0.045 * size * calls,
+        'reverse': lambda size, calls, offsets: 0.2 * calls,
+    },
+    'rope': {
+        'get': lambda size, calls, offsets: 1.0 * calls,
+        'edit': lambda size, calls, offsets: (1.0 + math.log2(size + 2)) * calls,
+        'end': lambda size, calls, offsets: (1.0 + math.log2(size + 2)) * calls,
+        'search': lambda size, calls, offsets: (1.0 + 0.0025 * size) * calls,
+        'reverse': lambda size, calls, offsets: 0.05 * size * calls,
+    },
+}
+
+# The workload is reviewed after every REVIEW_INTERVAL recorded calls, using
+# only the calls since the previous review.
+REVIEW_INTERVAL = 1024
+# Hysteresis: a backend must be estimated this much cheaper than the current
+# one (0.5 = half the cost), and the time saved over one interval must pay
+# for copying the elements at MIGRATION_COST microseconds each.
+HYSTERESIS = 0.5
+MIGRATION_COST = 0.2
+
+
+class AdaptiveList:
+    # The shared list API on top of whichever backend suits the recent
+    # workload. Contents move between backends as the mix of calls changes;
+    # stats() reports the estimates and every migration.
+    def __init__(self, backend: str = 'array', candidates=None):
+        self.candidates = list(candidates or BACKENDS)
+        for name in self.candidates + [backend]:
+            if name not in BACKENDS:
+                raise ValueError(f"Unknown backend {name!r}")
+        if backend not in self.candidates:
+            self.candidates.append(backend)
+        self.backend = backend
+        self.list = BACKENDS[backend]()
+        self.operations = 0
+        self.migrations = []
+        self.estimates = {}
+        # Reads also record calls and may migrate, and ConcurrentList runs
+        # reads in parallel, so the bookkeeping has its own lock.
+        self.lock = threading.Lock()
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self.calls = dict.fromkeys(KINDS, 0)
+        self.offsets = dict.fromkeys(KINDS, 0)
+        self.countdown = REVIEW_INTERVAL
+
+    def _record(self, kind: str, index: int = 0) -> None:
+        with self.lock:
+            self.calls[kind] += 1
+            self.offsets[kind] += index
+            self.operations += 1
+            self.countdown -= 1
+            if self.countdown <= 0:
+                self._review()
+
+    def _review(self) -> None:
+        size = self.list.length()
+        self.estimates = {
+            name: sum(COST_MODELS[name][kind](size, self.calls[kind], self.offsets[kind]) for kind in KINDS)
+            for name in self.candidates
+        }
+        self._reset_window()
+        best = min(self.estimates, key=self.estimates.get)
+        current = self.estimates[self.backend]
+        if (best != self.backend and self.estimates[best] < current * (1 - HYSTERESIS)
+                and current - self.estimates[best] > MIGRATION_COST * size):
+            self._migrate(best)
+
+    def _migrate(self, backend: str) -> None:
+        replacement = BACKENDS[backend]()
+        replacement.extend_from(self.list._text())
+        self.migrations.append({
+            'operation': self.operations,
+            'from': self.backend,
+            'to': backend,
+            'size': replacement.length(),
+            'estimates': dict(self.estimates),
+        })
+        self.list = replacement
+        self.backend = backend
+
+    def stats(self) -> dict:
+        return {
+            'backend': self.backend,
+            'operations': self.operations,
+            'size': self.list.length(),
+            'estimates': dict(self.estimates),
+            'migrations': list(self.migrations),
+        }
+
+    def _text(self) -> str:
+        return self.list._text()
+
+    def append(self, element: str) -> None:
+        self._record('end')
+        self.list.append(element)
+
+    def length(self) -> int:
+        return self.list.length()
+
+    def insert(self, element: str, index: int) -> None:
+        if index == self.list.length():
+            self._record('end')
+        else:
+            self._record('edit', index)
+        self.list.insert(element, index)
+
+    def delete(self, index: int) -> str:
+        self._record('edit', index)
+        return self.list.delete(index)
+
+    def get(self, index: int) -> str:
+        if index == self.list.length() - 1:
+            self._record('end')
+        else:
+            self._record('get', index)
+        return self.list.get(index)
+
+    def deleteAll(self, element: str) -> None:
+        self._record('search')
+        self.list.deleteAll(element)
+
+    def clone(self) -> 'AdaptiveList':
+        # The clone starts on the same backend with no recorded calls.
+        cloned = AdaptiveList(self.backend, self.candidates)
+        cloned.list = self.list.clone()
+        return cloned
+
+    def reverse(self) -> None:
+        self._record('reverse')
+        self.list.reverse()
+
+    def findFirst(self, element: str) -> int:
+        self._record('search')
+        return self.list.findFirst(element)
+
+    def findLast(self, element: str) -> int:
+        self._record('search')
+        return self.list.findLast(element)
+
+    def clear(self) -> None:
+        self.list.clear()
+
+    def extend(self, other: 'AdaptiveList') -> None:
+        self.list.extend_from(other._text())
+
+    def extend_from(self, elements) -> None:
+        self.list.extend_from(elements)
+
+    def __len__(self) -> int:
+        return self.list.length()
+
+    def __iter__(self):
+        return iter(self.list._text())
@@ -1,6 +1,60 @@
+from array import array, typecodes
+from bisect import bisect_left, insort
+from itertools import islice
+from operator import indexOf
+
+from linked_lists import edits, snapshot, streaming, views
+
+# 'u' is deprecated in newer Pythons in favour of the equivalent 'w' code.
+WIDE_TYPECODE = 'w' if 'w' in typecodes else 'u'
+
+
 class ArrayBasedList:
-    def __init__(self):
-        self.items = []
+    def __init__(self, compact: bool = False, indexed: bool = False):
+        # Compact lists keep characters in a contiguous buffer: one byte per
+        # element while everything is Latin-1, and a wide array of code
+        # points once a character outside that range shows up.
+        self.compact = compact
+        self.items = bytearray() if compact else []
+        # Indexed lists also keep, for every character, the sorted list of
+        # positions where it occurs. Searches and counts become lookups;
+        # every mutation pays to keep the positions up to date.
+        self.indexed = indexed
+        self.positions = {} if indexed else None
+        # Clones share items (and positions) until one side mutates. All
+        # lists sharing the same storage hold the same one-element list
+        # counting them; None means the storage is not shared.
+        self.shared = None
+        # reverse() only flips this flag. While it is set, logical index i
+        # lives at physical index length() - 1 - i; items and positions
+        # always describe the physical order.
+        self.flipped = False
+        # Bumped by every change to the contents, so that slice views can
+        # tell they are stale.
+        self.version = 0
+    
+    def __del__(self):
+        if self.shared is not None:
+            self.shared[0] -= 1
+    
+    def _detach(self) -> bool:
+        # Stops sharing without copying; True if other lists still use the
+        # storage, so it must not be modified in place. Every mutation passes
+        # through here.
+        self.version += 1
+        if self.shared is None:
+            return False
+        self.shared[0] -= 1
+        still_shared = self.shared[0] > 0
+        self.shared = None
+        return still_shared
+    
+    def _own(self) -> None:
+        # Called before every in-place mutation: copies shared storage.
+        if self._detach():
+            self.items = self.items[:]
+            if self.positions is not None:
+                self.positions = {element: entries.copy() for element, entries in self.positions.items()}
     
     def _validate_character(self, element: str) -> None:
         if not isinstance(element, str):
@@ -8,9 +62,117 @@ class ArrayBasedList:
         if len(element) != 1:
             raise ValueError("Element must be a single character")
     
+    def _validate_characters(self, elements) -> str:
+        # Validates a whole batch at once and returns it as a string. A str
+        # is already a sequence of single characters, so it needs no scan.
+        if isinstance(elements, str):
+            return elements
+        elements = list(elements)
+        if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+            raise ValueError("Elements must be single characters")
+        return ''.join(elements)
+    
+    def _widen(self) -> None:
+        self.items = array(WIDE_TYPECODE, self.items.decode('latin-1'))
+    
+    def _prepare(self, element: str):
+        # Converts an element into the representation the storage expects,
+        # widening the storage first if a byte can no longer hold it.
+        if isinstance(self.items, bytearray):
+            if ord(element) < 256:
+                return ord(element)
+            self._widen()
+        return element
+    
+    def _decode(self, value) -> str:
+        return chr(value) if isinstance(value, int) else value
+    
+    def _physical_text(self) -> str:
+        if isinstance(self.items, list):
+            return ''.join(self.items)
+        if isinstance(self.items, bytearray):
+            return self.items.decode('latin-1')
+        return self.items.tounicode()
+    
+    def _text(self) -> str:
+        text = self._physical_text()
+        return text[::-1] if self.flipped else text
+    
+    def _materialize(self) -> None:
+        # Applies a pending reverse() to the storage itself.
+        if not self.flipped:
+            return
+        # The logical order is unchanged, so views stay valid.
+        version = self.version
+        self._own()
+        self.version = version
+        self.items.reverse()
+        if self.positions is not None:
+            last = len(self.items) - 1
+            for entries in self.positions.values():
+                entries.reverse()
+                entries[:] = [last - position for position in entries]
+        self.flipped = False
+    
+    def _extend_text(self, text: str) -> None:
+        if isinstance(self.items, list):
+            self.items.extend(text)
+            return
+        if isinstance(self.items, bytearray):
+            try:
+                self.items += text.encode('latin-1')
+                return
+            except UnicodeEncodeError:
+                self._widen()
+        self.items.fromunicode(text)
+    
+    def _index_shift(self, start: int, delta: int) -> None:
+        # Moves every indexed position >= start by delta.
+        for entries in self.positions.values():
+            first = bisect_left(entries, start)
+            if first < len(entries):
+                entries[first:] = [position + delta for position in entries[first:]]
+    
+    def _index_append_text(self, text: str, offset: int) -> None:
+        for position, element in enumerate(text, offset):
+            entries = self.positions.get(element)
+            if entries is None:
+                self.positions[element] = [position]
+            else:
+                entries.append(position)
+    
+    def _index_remove_range(self, start: int, stop: int) -> None:
+        for element in list(self.positions):
+            entries = self.positions[element]
+            del entries[bisect_left(entries, start):bisect_left(entries, stop)]
+            if not entries:
+                del self.positions[element]
+        self._index_shift(stop, start - stop)
+    
+    def _splice_text(self, index: int, text: str) -> None:
+        if isinstance(self.items, bytearray):
+            try:
+                self.items[index:index] = text.encode('latin-1')
+                return
+            except UnicodeEncodeError:
+                self._widen()
+        if isinstance(self.items, list):
+            self.items[index:index] = text
+        else:
+            self.items[index:index] = array(WIDE_TYPECODE, text)
+    
     def append(self, element: str) -> None:
         self._validate_character(element)
-        self.items.append(element)
+        # Appending to a flipped list would mean inserting at the physical
+        # front, so the reversal is applied once instead.
+        self._materialize()
+        self._own()
+        value = self._prepare(element)
+        # The index is updated only once the storage has accepted the
+        # element: a held buffer() makes a bytearray refuse to grow.
+        self.items.append(value)
+        if self.positions is not None:
+            self.positions.setdefault(element, []).append(len(self.items) - 1)
     
     def length(self) -> int:
         return len(self.items)
@@ -19,49 +181,312 @@ class ArrayBasedList:
         self._validate_character(element)
         if index < 0 or index > self.length():
             raise ValueError("Wrong index value.")
-        self.items.insert(index, element)
+        self._own()
+        if self.flipped:
+            index = self.length() - index
+        value = self._prepare(element)
+        self.items.insert(index, value)
+        if self.positions is not None:
+            self._index_shift(index, 1)
+            insort(self.positions.setdefault(element, []), index)
     
     def delete(self, index: int) -> str:
         if index < 0 or index >= self.length():
             raise ValueError("Wrong index value.")
-        return self.items.pop(index)
+        self._own()
+        if self.flipped:
+            index = self.length() - 1 - index
+        element = self._decode(self.items.pop(index))
+        if self.positions is not None:
+            self._index_remove_range(index, index + 1)
+        return element
     
     def get(self, index: int) -> str:
         if index < 0 or index >= self.length():
             raise ValueError("Wrong index value.")
-        return self.items[index]
+        if self.flipped:
+            index = self.length() - 1 - index
+        return self._decode(self.items[index])
     
     def deleteAll(self, element: str) -> None:
         self._validate_character(element)
-        self.items = [item for item in self.items if item != element]
+        if self.positions is not None:
+            self._own()
+            self._delete_indexed(element)
+            return
+        if isinstance(self.items, list):
+            remaining = [item for item in self.items if item != element]
+        elif isinstance(self.items, bytearray):
+            if ord(element) >= 256:
+                return
+            remaining = self.items.replace(element.encode('latin-1'), b'')
+        else:
+            remaining = array(WIDE_TYPECODE, self.items.tounicode().replace(element, ''))
+        # The result is new storage, so shared storage is left to the other
+        # lists without a copy.
+        self._detach()
+        self.items = remaining
+    
+    def _delete_indexed(self, element: str) -> None:
+        # Copies only the runs between occurrences, then moves every other
+        # position back by the number of occurrences in front of it.
+        occurrences = self.positions.pop(element, None)
+        if not occurrences:
+            return
+        compacted = self.items[:0]
+        previous = 0
+        for position in occurrences:
+            compacted += self.items[previous:position]
+            previous = position + 1
+        compacted += self.items[previous:]
+        self.items = compacted
+        for entries in self.positions.values():
+            entries[:] = [position - bisect_left(occurrences, position) for position in entries]
     
     def clone(self) -> 'ArrayBasedList':
-        cloned = ArrayBasedList()
-        cloned.items = self.items.copy()
+        # O(1): the clone shares storage until either list is mutated.
+        cloned = ArrayBasedList(compact=self.compact, indexed=self.indexed)
+        if self.shared is None:
+            self.shared = [1]
+        self.shared[0] += 1
+        cloned.shared = self.shared
+        cloned.items = self.items
+        cloned.positions = self.positions
+        cloned.flipped = self.flipped
         return cloned
     
     def reverse(self) -> None:
-        self.items.reverse()
+        # O(1): storage is left alone, see _materialize.
+        self.flipped = not self.flipped
+        self.version += 1
+    
+    def _search_bounds(self, start: int, stop) -> tuple:
+        # Search bounds follow str.find: negative values count from the end
+        # and out-of-range values are clamped rather than rejected.
+        start, stop, _ = slice(start, stop).indices(self.length())
+        return start, stop
     
-    def findFirst(self, element: str) -> int:
+    def _flip_bounds(self, start: int, stop: int) -> tuple:
+        # Physical range holding the logical range [start, stop) of a
+        # flipped list.
+        length = self.length()
+        return length - stop, length - start
+    
+    def findFirst(self, element: str, start: int = 0, stop: int = None) -> int:
         self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        if self.flipped:
+            # The first logical match is the last physical one.
+            position = self._find_last(element, *self._flip_bounds(start, stop))
+            return self.length() - 1 - position if position != -1 else -1
+        return self._find_first(element, start, stop)
+    
+    def findLast(self, element: str, start: int = 0, stop: int = None) -> int:
+        self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        if self.flipped:
+            position = self._find_first(element, *self._flip_bounds(start, stop))
+            return self.length() - 1 - position if position != -1 else -1
+        return self._find_last(element, start, stop)
+    
+    def _find_first(self, element: str, start: int, stop: int) -> int:
+        if self.positions is not None:
+            entries = self.positions.get(element, ())
+            first = bisect_left(entries, start)
+            return entries[first] if first < len(entries) and entries[first] < stop else -1
+        if isinstance(self.items, bytearray):
+            return self.items.find(ord(element), start, stop) if ord(element) < 256 else -1
+        try:
+            return self.items.index(element, start, stop)
+        except ValueError:
+            return -1
+    
+    def _find_last(self, element: str, start: int, stop: int) -> int:
+        if self.positions is not None:
+            entries = self.positions.get(element, ())
+            last = bisect_left(entries, stop) - 1
+            return entries[last] if last >= 0 and entries[last] >= start else -1
+        if isinstance(self.items, bytearray):
+            return self.items.rfind(ord(element), start, stop) if ord(element) < 256 else -1
+        # Scan the range backwards without copying it; both the reversed
+        # iterator and indexOf run entirely in C.
+        length = self.length()
+        backwards = islice(reversed(self.items), length - stop, length - start)
         try:
-            return self.items.index(element)
+            return stop - 1 - indexOf(backwards, element)
         except ValueError:
             return -1
     
-    def findLast(self, element: str) -> int:
+    def count(self, element: str) -> int:
         self._validate_character(element)
-        for i in range(self.length() - 1, -1, -1):
-            if self.items[i] == element:
-                return i
-        return -1
+        if self.positions is not None:
+            return len(self.positions.get(element, ()))
+        if isinstance(self.items, bytearray):
+            return self.items.count(ord(element)) if ord(element) < 256 else 0
+        return self.items.count(element)
+    
+    def findSubsequence(self, pattern) -> int:
+        text = self._validate_characters(pattern)
+        if self.flipped:
+            # The first logical match is the last physical match of the
+            # reversed pattern.
+            position = self._find_physical(text[::-1], last=True)
+            return self.length() - position - len(text) if position != -1 else -1
+        return self._find_physical(text)
+    
+    def _find_physical(self, text: str, last: bool = False) -> int:
+        if isinstance(self.items, bytearray):
+            try:
+                encoded = text.encode('latin-1')
+            except UnicodeEncodeError:
+                return -1
+            return self.items.rfind(encoded) if last else self.items.find(encoded)
+        physical = self._physical_text()
+        return physical.rfind(text) if last else physical.find(text)
     
     def clear(self) -> None:
-        self.items = []
+        self._detach()
+        self.flipped = False
+        self.items = bytearray() if self.compact else []
+        if self.positions is not None:
+            self.positions = {}
     
     def extend(self, other: 'ArrayBasedList') -> None:
-        self.items.extend(other.items.copy())
+        self._materialize()
+        self._own()
+        start = len(self.items)
+        # Read before extending, as other may be this list.
+        text = other._text() if self.positions is not None else None
+        if type(self.items) is type(other.items):
+            self.items.extend(other.items[::-1] if other.flipped else other.items[:])
+        else:
+            self._extend_text(other._text())
+        if text is not None:
+            self._index_append_text(text, start)
+    
+    def extend_from(self, elements) -> None:
+        text = self._validate_characters(elements)
+        self._materialize()
+        self._own()
+        start = len(self.items)
+        self._extend_text(text)
+        if self.positions is not None:
+            self._index_append_text(text, start)
+    
+    def insert_many(self, index: int, elements) -> None:
+        text = self._validate_characters(elements)
+        if index < 0 or index > self.length():
+            raise ValueError("Wrong index value.")
+        self._own()
+        if self.flipped:
+            # Logical order is read backwards, so the text goes in reversed.
+            index = self.length() - index
+            text = text[::-1]
+        self._splice_text(index, text)
+        if self.positions is not None:
+            self._index_shift(index, len(text))
+            for position, element in enumerate(text, index):
+                insort(self.positions.setdefault(element, []), position)
+    
+    def delete_range(self, start: int, stop: int) -> None:
+        if start < 0 or stop < start or stop > self.length():
+            raise ValueError("Wrong index value.")
+        self._own()
+        if self.flipped:
+            start, stop = self._flip_bounds(start, stop)
+        del self.items[start:stop]
+        if self.positions is not None:
+            self._index_remove_range(start, stop)
+    
+    def _range_data(self, positions: range):
+        # Elements at the given logical positions, read in place.
+        items = self.items
+        if self.flipped:
+            last = len(items) - 1
+            positions = range(last - positions.start, last - positions.stop, -positions.step)
+        values = map(items.__getitem__, positions)
+        return map(chr, values) if isinstance(items, bytearray) else values
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def __iter__(self):
+        return self._range_data(range(len(self.items)))
+    
+    def __getitem__(self, key):
+        # Slices are views over this list's storage; see views.py.
+        positions = views.positions(key, self.length())
+        if isinstance(key, slice):
+            return views.ListView(self, positions)
+        return self.get(positions.start)
+    
+    def __setitem__(self, key, value) -> None:
+        views.assign(self, key, value)
+    
+    def __delitem__(self, key) -> None:
+        views.delete(self, key)
+    
+    def batch(self) -> edits.Batch:
+        return edits.Batch(self)
+    
+    def apply_edits(self, ops) -> None:
+        # Applies a whole edit script (see edits.py) with one copy of the
+        # list instead of shifting elements once per edit.
+        events = edits.plan(ops, self.length())
+        if not events:
+            return
+        text = edits.apply_to_text(self._text(), events)
+        self.clear()
+        self.extend_from(text)
+    
+    def buffer(self) -> memoryview:
+        # Zero-copy view of compact storage. While a view is alive the list
+        # cannot change size, so release it before mutating the list again.
+        # The view is writable, so shared storage is copied first, and it is
+        # in list order, so a pending reverse() is applied.
+        if not self.compact:
+            raise ValueError("Only compact lists expose a buffer")
+        self._materialize()
+        self._own()
+        return memoryview(self.items)
+    
+    def _payload(self) -> tuple:
+        # Snapshots store the list in order, so a pending reverse() is
+        # applied. Latin-1 compact storage already is a 1-byte payload.
+        self._materialize()
+        if isinstance(self.items, bytearray):
+            return 1, self.items
+        return snapshot.encode(self._physical_text())
+    
+    def to_bytes(self, checksum: bool = True) -> bytes:
+        return snapshot.pack(*self._payload(), checksum)
+    
+    def save(self, path: str, checksum: bool = True) -> None:
+        # The file can also be opened in place with mapped.MappedList(path).
+        snapshot.save(path, *self._payload(), checksum)
+    
+    async def aextend(self, elements, batch_size: int = streaming.BATCH_SIZE) -> None:
+        await streaming.aextend(self, elements, batch_size)
+    
+    def __aiter__(self):
+        # Iterates over the contents as they were when iteration started.
+        return streaming.aiterate(self._text())
+    
+    @classmethod
+    def from_bytes(cls, data, compact: bool = False, indexed: bool = False) -> 'ArrayBasedList':
+        width, payload = snapshot.unpack(data)
+        lst = cls(compact=compact, indexed=indexed)
+        if compact and width == 1:
+            lst.items = bytearray(payload)
+            if indexed:
+                lst._index_append_text(lst._physical_text(), 0)
+        else:
+            lst.extend_from(snapshot.decode(width, payload))
+        return lst
+    
+    @classmethod
+    def load(cls, path: str, compact: bool = False, indexed: bool = False) -> 'ArrayBasedList':
+        return cls.from_bytes(snapshot.load(path), compact, indexed)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,249 @@
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+
+from linked_lists.adaptive import AdaptiveList
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+from linked_lists.gap_buffer import GapBufferList
+from linked_lists.mapped import MappedList
+from linked_lists.rope import RopeList
+from linked_lists.skip_list import IndexableSkipList
+from linked_lists.unrolled import UnrolledCircularList
+
+BACKENDS = {
+    'adaptive': AdaptiveList,
+    'array': ArrayBasedList,
+    'array-compact': lambda: ArrayBasedList(compact=True),
+    'circular': CircularLinkedList,
+    'gap-buffer': GapBufferList,
+    'mapped': MappedList,
+    'rope': RopeList,
+    'skip-list': IndexableSkipList,
+    'unrolled': UnrolledCircularList,
+}
+
+# Lists are filled with this alphabet and searched for a character that is
+# never present, so find* and deleteAll always scan the whole list.
+ALPHABET = 'abcdefghijklmnopqrstuvwxy'
+MISSING = 'z'
+
+# Each operation performs one call. All operations of one size share a
+# single list, so calls that change its length are capped (see
+# size_changing_calls) to keep it within about 10% of the benchmark size.
+OPERATIONS = {
+    'append': lambda lst, other: lst.append('a'),
+    'insert_head': lambda lst, other: lst.insert('a', 0),
+    'insert_middle': lambda lst, other: lst.insert('a', lst.length() // 2),
+    'insert_tail': lambda lst, other: lst.insert('a', lst.length()),
+    'get': lambda lst, other: lst.get(lst.length() // 2),
+    'delete': lambda lst, other: lst.delete(lst.length() // 2),
+    'deleteAll': lambda lst, other: lst.deleteAll(MISSING),
+    'findFirst': lambda lst, other: lst.findFirst(MISSING),
+    'findLast': lambda lst, other: lst.findLast(MISSING),
+    'clone': lambda lst, other: lst.clone(),
+    'reverse': lambda lst, other: lst.reverse(),
+    'extend': lambda lst, other: lst.extend(other),
+}
+
+SIZE_CHANGING = {'append', 'insert_head', 'insert_middle', 'insert_tail', 'delete'}
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+EXTEND_SIZE = 100
+
+
+def build(factory, size: int):
+    lst = factory()
+    text = (ALPHABET * (size // len(ALPHABET) + 1))[:size]
+    if hasattr(lst, 'extend_from'):
+        lst.extend_from(text)
+    else:
+        for char in text:
+            lst.append(char)
+    return lst
+
+
+def size_changing_calls(name: str, size: int, max_calls: int) -> int:
+    if name == 'extend':
+        return max(1, min(max_calls, size // (10 * EXTEND_SIZE)))
+    if name in SIZE_CHANGING:
+        return max(1, min(max_calls, size // 10))
+    return max_calls
+
+
+def close(lst) -> None:
+    if hasattr(lst, 'close'):
+        lst.close()
+
+
+def measure(operation, lst, other, min_time: float, max_calls: int) -> tuple:
+    # Repeats the call until min_time has passed and returns
+    # (seconds per call, number of calls).
+    # Lists an operation returns (clones) are closed outside the timed
+    # part if they hold resources, as MappedList does.
+    calls = 0
+    elapsed = 0.0
+    while calls < max_calls and (calls == 0 or elapsed < min_time):
+        start = time.perf_counter()
+        result = operation(lst, other)
+        elapsed += time.perf_counter() - start
+        calls += 1
+        close(result)
+    return elapsed / calls, calls
+
+
+def run(backends=None, operations=None, sizes=None, min_time: float = 0.05,
+        max_calls: int = 1000, max_call_time: float = 1.0, max_build_time: float = 60.0,
+        log=None) -> list:
+    # Sweeps sizes in increasing order. Once a call would take longer than
+    # max_call_time at the next size, or building the list longer than
+    # max_build_time (assuming at least linear growth), larger sizes are
+    # skipped for that operation or backend.
+    backends = backends or list(BACKENDS)
+    operations = operations or list(OPERATIONS)
+    sizes = sorted(sizes or DEFAULT_SIZES)
+    results = []
+    for backend in backends:
+        factory = BACKENDS[backend]
+        skipped = set()
+        build_time = 0.0
+        previous_size = None
+        for size in sizes:
+            growth = size / previous_size if previous_size else 1
+            if build_time * growth > max_build_time:
+                break
+            start = time.perf_counter()
+            lst = build(factory, size)
+            build_time = time.perf_counter() - start
+            previous_size = size
+            other = build(factory, EXTEND_SIZE)
+            for name in operations:
+                if name in skipped:
+                    continue
+                calls_allowed = size_changing_calls(name, size, max_calls)
+                seconds, calls = measure(OPERATIONS[name], lst, other, min_time, calls_allowed)
+                results.append({'backend': backend, 'operation': name, 'size': size,
+                                'seconds': seconds, 'calls': calls})
+                if log:
+                    log(f"{backend:>14} {name:>14} {size:>10}: {seconds * 1e6:12.2f} us/call")
+                next_sizes = [s for s in sizes if s > size]
+                if next_sizes and seconds * next_sizes[0] / size > max_call_time:
+                    skipped.add(name)
+            close(lst)
+            close(other)
+    return results
+
+
+def ring_throughput(maxlen: int = 1000, operations: int = 1_000_000) -> float:
+    # Appends to a full bounded CircularLinkedList, so every call evicts the
+    # oldest element, and returns the sustained rate in operations per
+    # second.
+    lst = CircularLinkedList(maxlen=maxlen)
+    lst.extend_from((ALPHABET * (maxlen // len(ALPHABET) + 1))[:maxlen])
+    append = lst.append
+    chars = ALPHABET * (operations // len(ALPHABET) + 1)
+    start = time.perf_counter()
+    for char in chars[:operations]:
+        append(char)
+    return operations / (time.perf_counter() - start)
+
+
+def fit_exponents(results: list) -> dict:
+    # Least-squares slope of log(time) against log(size) for every
+    # (backend, operation) pair measured at two or more sizes.
+    series = {}
+    for row in results:
+        if row['seconds'] > 0:
+            series.setdefault((row['backend'], row['operation']), []).append(
+                (math.log(row['size']), math.log(row['seconds'])))
+    exponents = {}
+    for key, points in series.items():
+        if len(points) < 2:
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        spread = sum((x - mean_x) ** 2 for x, _ in points)
+        exponents[key] = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return exponents
+
+
+def find_regressions(results: list, baseline: list, threshold: float) -> list:
+    # Rows that got slower than the baseline by more than `threshold`
+    # (0.25 means 25%), as (row, baseline seconds) pairs.
+    expected = {(row['backend'], row['operation'], row['size']): row['seconds'] for row in baseline}
+    regressions = []
+    for row in results:
+        previous = expected.get((row['backend'], row['operation'], row['size']))
+        if previous and row['seconds'] > previous * (1 + threshold):
+            regressions.append((row, previous))
+    return regressions
+
+
+def write_json(path: str, results: list) -> None:
+    with open(path, 'w') as handle:
+        json.dump(results, handle, indent=2)
+
+
+def write_csv(path: str, results: list) -> None:
+    with open(path, 'w', newline='') as handle:
+        writer = csv.DictWriter(handle, fieldnames=['backend', 'operation', 'size', 'seconds', 'calls'])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m linked_lists.bench',
+                                     description="Benchmark every list backend across sizes.")
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), help="backends to run (default: all)")
+    parser.add_argument('--operations', nargs='+', choices=list(OPERATIONS), help="operations to run (default: all)")
+    parser.add_argument('--sizes', nargs='+', type=int, help="list sizes (default: 1e2 to 1e7)")
+    parser.add_argument('--min-time', type=float, default=0.05, help="minimum seconds spent per measurement")
+    parser.add_argument('--max-calls', type=int, default=1000, help="maximum calls per measurement")
+    parser.add_argument('--max-call-time', type=float, default=1.0,
+                        help="skip larger sizes once one call is expected to exceed this many seconds")
+    parser.add_argument('--max-build-time', type=float, default=60.0,
+                        help="skip larger sizes once building a list is expected to exceed this many seconds")
+    parser.add_argument('--json', help="write results to this JSON file")
+    parser.add_argument('--csv', help="write results to this CSV file")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument('--ring', type=int, metavar='MAXLEN',
+                        help="only measure append throughput of a full CircularLinkedList(maxlen=MAXLEN)")
+    args = parser.parse_args(argv)
+
+    if args.ring:
+        rate = ring_throughput(args.ring)
+        print(f"circular maxlen={args.ring} append-evict: {rate / 1e6:.2f}M ops/s")
+        return 0
+
+    results = run(args.backends, args.operations, args.sizes, args.min_time,
+                  args.max_calls, args.max_call_time, args.max_build_time, log=print)
+
+    print("\nEmpirical complexity exponents (time ~ size^k):")
+    for (backend, operation), exponent in sorted(fit_exponents(results).items()):
+        print(f"{backend:>14} {operation:>14}: k = {exponent:.2f}")
+
+    if args.json:
+        write_json(args.json, results)
+    if args.csv:
+        write_csv(args.csv, results)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for row, previous in regressions:
+            print(f"REGRESSION {row['backend']} {row['operation']} size={row['size']}: "
+                  f"{previous * 1e6:.2f} -> {row['seconds'] * 1e6:.2f} us/call")
+        if regressions:
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of the baseline.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
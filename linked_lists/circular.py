@@ -1,197 +1,671 @@
+from itertools import islice
+from operator import countOf, indexOf
+
+from linked_lists import edits, snapshot, streaming, views
+
+
 class Node:
+    __slots__ = ('data', 'next')
+
     def __init__(self, data: str):
         self.data = data
         self.next = None
 
 
+class Cursor:
+    # A position in the ring. It keeps the predecessor of the current node so
+    # that removing the current node is a single pointer rewrite. Changes
+    # made to the list other than through this cursor invalidate it.
+    def __init__(self, owner: 'CircularLinkedList', index: int = 0):
+        self.owner = owner
+        self.index = index
+        self.prev = owner._node_before(index) if owner.size else None
+
+    def _current(self) -> Node:
+        if not self.owner.size:
+            raise ValueError("List is empty")
+        return self.prev.next
+
+    def peek(self) -> str:
+        return self._current().data
+
+    def next(self) -> str:
+        current = self._current()
+        self.prev = current
+        self.index = (self.index + 1) % self.owner.size
+        return current.data
+
+    def insert_after(self, element: str) -> None:
+        owner = self.owner
+        owner._validate_character(element)
+        owner._check_room()
+        if owner._own():
+            self.prev = owner._node_before(self.index)
+        if not owner.size:
+            owner.append(element)
+            self.prev = owner.tail
+            self.index = 0
+            return
+
+        current = self.prev.next
+        new_node = owner._new_node(element)
+        new_node.next = current.next
+        current.next = new_node
+        if self.prev is current:
+            # A one-element ring: the current node was its own predecessor.
+            self.prev = new_node
+        if current is owner.tail:
+            owner.tail = new_node
+        owner.size += 1
+
+    def remove(self) -> str:
+        owner = self.owner
+        if owner._own():
+            self.prev = owner._node_before(self.index)
+        current = self._current()
+        data = current.data
+        if owner.size == 1:
+            owner.clear()
+            self.prev = None
+            self.index = 0
+            return data
+
+        self.prev.next = current.next
+        if current is owner.tail:
+            owner.tail = self.prev
+            self.index = 0
+        owner.size -= 1
+        owner._release(current)
+        return data
+
+
 class CircularLinkedList:
-    def __init__(self):
-        self.head = None
-    
+    def __init__(self, pool_size: int = 0, maxlen: int = None):
+        # The ring is anchored at its last node: head is always tail.next,
+        # so both ends are reachable in O(1).
+        self.tail = None
+        self.size = 0
+        # Up to pool_size unlinked nodes are kept for reuse by later inserts.
+        # Pooled nodes are wiped, so callers must not hold on to a node after
+        # removing it from the list.
+        self.pool_size = pool_size
+        self.pool = []
+        # Clones share nodes until one side mutates. All lists sharing the
+        # same ring hold the same one-element list counting them; None means
+        # the ring is not shared.
+        self.shared = None
+        # reverse() only flips this flag. While it is set, the list reads the
+        # ring backwards: logical index i is the node at physical position
+        # size - 1 - i.
+        self.flipped = False
+        # With maxlen set the list is a ring buffer: appending to a full list
+        # overwrites the oldest element, and other inserts into a full list
+        # are rejected.
+        if maxlen is not None and (not isinstance(maxlen, int) or maxlen < 1):
+            raise ValueError("maxlen must be a positive integer")
+        self.maxlen = maxlen
+        # Bumped by every change to the contents, so that slice views can
+        # tell they are stale.
+        self.version = 0
+        # The last position walked to, as (version, physical position, node).
+        # Walks to a later position resume from it instead of the tail. It
+        # is only trusted while the version is unchanged; insert and delete
+        # keep it valid themselves.
+        self.finger = None
+        # Links followed by _node_before, counted only while instrumentation
+        # sets this to a number (see instrumentation.py).
+        self.walked = None
+
+    def __del__(self):
+        if self.shared is not None:
+            self.shared[0] -= 1
+
+    def _detach(self) -> bool:
+        # Stops sharing without copying; True if other lists still use the
+        # ring, so it must not be modified in place. Every mutation passes
+        # through here.
+        self.version += 1
+        if self.shared is None:
+            return False
+        self.shared[0] -= 1
+        still_shared = self.shared[0] > 0
+        self.shared = None
+        return still_shared
+
+    def _own(self) -> bool:
+        # Called before every in-place mutation: copies a shared ring.
+        # Returns True if the nodes were replaced.
+        if not self._detach():
+            return False
+        if self.tail:
+            first, last = self._chain(''.join(self._data()))
+            last.next = first
+            self.tail = last
+        return True
+
+    def _own_keeping_finger(self) -> None:
+        # _own() for edits that do not move any node before the one they
+        # walk to, so a valid finger stays usable unless the ring is copied.
+        valid = self.finger is not None and self.finger[0] == self.version
+        if not self._own() and valid:
+            self.finger = (self.version,) + self.finger[1:]
+
+    def _drop_finger_from(self, index: int) -> None:
+        # After an insert or delete at `index`, later nodes have moved.
+        if self.finger is not None and self.finger[1] >= index:
+            self.finger = None
+
+    def _materialize(self) -> None:
+        # Applies a pending reverse() to the links themselves.
+        if not self.flipped:
+            return
+        self.flipped = False
+        self.finger = None
+        if self.size < 2:
+            return
+        # The logical order is unchanged, so views stay valid.
+        version = self.version
+        self._own()
+        self.version = version
+        old_head = self.tail.next
+        prev = self.tail
+        current = old_head
+        for _ in range(self.size):
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+        self.tail = old_head
+
+    @property
+    def head(self):
+        if not self.tail:
+            return None
+        return self.tail.next
+
     def _validate_character(self, element: str) -> None:
         if not isinstance(element, str):
             raise ValueError("Element must be a string")
         if len(element) != 1:
             raise ValueError("Element must be a single character")
 
+    def _validate_characters(self, elements) -> str:
+        # Validates a whole batch at once and returns it as a string. A str
+        # is already a sequence of single characters, so it needs no scan.
+        if isinstance(elements, str):
+            return elements
+        elements = list(elements)
+        if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+            raise ValueError("Elements must be single characters")
+        return ''.join(elements)
+
+    def _new_node(self, element: str) -> Node:
+        if self.pool:
+            node = self.pool.pop()
+            node.data = element
+            return node
+        return Node(element)
+
+    def _release(self, node: Node) -> None:
+        if len(self.pool) < self.pool_size:
+            node.data = None
+            node.next = None
+            self.pool.append(node)
+
+    def _chain(self, text: str):
+        # Links the characters into a detached run of nodes: (first, last).
+        first = last = self._new_node(text[0])
+        for char in text[1:]:
+            last.next = self._new_node(char)
+            last = last.next
+        return first, last
+
+    def _node_before(self, index: int) -> Node:
+        # Returns the predecessor of the node at `index`; the tail precedes
+        # index 0 and is also the predecessor of the end position.
+        # Walks from the finger when it lies before `index`, which is never
+        # longer than walking from the tail. The finger is left one node
+        # behind the result, so the next call may also step back by one.
+        if index == self.size:
+            return self.tail
+        current = self.tail
+        steps = index
+        finger = self.finger
+        if finger is not None and finger[1] < index and finger[0] == self.version:
+            current = finger[2]
+            steps = index - 1 - finger[1]
+        if steps:
+            if self.walked is not None:
+                self.walked += steps
+            for _ in range(steps - 1):
+                current = current.next
+            if index >= 2:
+                self.finger = (self.version, index - 2, current)
+            current = current.next
+        return current
+
+    def _check_room(self, count: int = 1) -> None:
+        if self.maxlen is not None and self.size + count > self.maxlen:
+            raise ValueError("List is full")
+
     def append(self, element: str) -> None:
         self._validate_character(element)
-        new_node = Node(element)
-        if not self.head:
-            self.head = new_node
+        if self.size == self.maxlen:
+            # O(1) eviction: the head becomes the new tail in place.
+            if self.flipped:
+                self._materialize()
+            if self.shared is not None:
+                self._own()
+            self.version += 1
+            head = self.tail.next
+            head.data = element
+            self.tail = head
+            return
+        # Appending after the tail moves no node unless the list is flipped,
+        # when the new node becomes the physical head.
+        if self.flipped:
+            self._own()
+        else:
+            self._own_keeping_finger()
+        new_node = self._new_node(element)
+        if not self.tail:
             new_node.next = new_node
+            self.tail = new_node
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
-            new_node.next = self.head
+            new_node.next = self.tail.next
+            self.tail.next = new_node
+            # The logical end of a flipped list is the physical head.
+            if not self.flipped:
+                self.tail = new_node
+        self.size += 1
 
     def length(self) -> int:
-        if not self.head:
-            return 0
-        count = 1
-        current = self.head
-        while current.next != self.head:
-            count += 1
-            current = current.next
-        return count
+        return self.size
 
     def insert(self, element: str, index: int) -> None:
         self._validate_character(element)
-        if index < 0 or index > self.length():
+        if index < 0 or index > self.size:
             raise ValueError("Wrong index value.")
 
-        new_node = Node(element)
-        if index == 0:
-            if not self.head:
-                self.head = new_node
-                new_node.next = new_node
-            else:
-                current = self.head
-                while current.next != self.head:
-                    current = current.next
-                new_node.next = self.head
-                self.head = new_node
-                current.next = self.head
-        else:
-            current = self.head
-            for _ in range(index - 1):
-                current = current.next
-            new_node.next = current.next
-            current.next = new_node
+        if index == self.size:
+            self.append(element)
+            return
+        self._check_room()
+        if self.flipped and index == 0:
+            self.flipped = False
+            self.append(element)
+            self.flipped = True
+            return
+
+        self._own_keeping_finger()
+        if self.flipped:
+            index = self.size - index
+        new_node = self._new_node(element)
+        prev = self._node_before(index)
+        new_node.next = prev.next
+        prev.next = new_node
+        self.size += 1
+        self._drop_finger_from(index)
 
     def get(self, index: int) -> str:
-        if index < 0 or index >= self.length():
+        if index < 0 or index >= self.size:
             raise ValueError("Wrong index value.")
 
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        return current.data
+        if self.flipped:
+            index = self.size - 1 - index
+        if index == self.size - 1:
+            return self.tail.data
+        return self._node_before(index).next.data
 
     def delete(self, index: int) -> str:
-        if index < 0 or index >= self.length():
+        if index < 0 or index >= self.size:
             raise ValueError("Wrong index value.")
 
-        if self.length() == 1:
-            data = self.head.data
-            self.head = None
+        if self.size == 1:
+            data = self.tail.data
+            self.clear()
             return data
 
-        if index == 0:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            data = self.head.data
-            self.head = self.head.next
-            current.next = self.head
-            return data
-        else:
-            prev = self.head
-            for _ in range(index - 1):
-                prev = prev.next
-            data = prev.next.data
-            prev.next = prev.next.next
-            return data
+        self._own_keeping_finger()
+        if self.flipped:
+            index = self.size - 1 - index
+        # Links only go forwards, so removing the tail still walks to its
+        # predecessor; only the head end is O(1).
+        prev = self._node_before(index)
+        removed = prev.next
+        data = removed.data
+        prev.next = removed.next
+        if removed is self.tail:
+            self.tail = prev
+        self.size -= 1
+        self._release(removed)
+        self._drop_finger_from(index)
+        return data
 
     def deleteAll(self, element: str) -> None:
         self._validate_character(element)
-        if not self.head:
+        if not self.tail:
             return
 
-        while self.head and self.head.data == element:
-            if self.head.next == self.head:
-                self.head = None
-                return
+        self._own()
+        prev = self.tail
+        current = self.tail.next
+        for _ in range(self.size):
+            next_node = current.next
+            if current.data == element:
+                prev.next = next_node
+                self.size -= 1
+                self._release(current)
             else:
-                current = self.head
-                while current.next != self.head:
-                    current = current.next
-                self.head = self.head.next
-                current.next = self.head
+                prev = current
+            current = next_node
 
-        current = self.head
-        while current.next != self.head:
-            if current.next.data == element:
-                current.next = current.next.next
-            else:
-                current = current.next
+        if self.size == 0:
+            self.tail = None
+        else:
+            # `prev` is the last surviving node, which becomes the new tail.
+            self.tail = prev
 
     def clone(self) -> 'CircularLinkedList':
-        cloned_list = CircularLinkedList()
-        if not self.head:
-            return cloned_list
-
-        current = self.head
-        cloned_list.append(current.data)
-        while current.next != self.head:
-            current = current.next
-            cloned_list.append(current.data)
+        # O(1): the clone shares the ring until either list is mutated.
+        cloned_list = CircularLinkedList(self.pool_size, self.maxlen)
+        if self.shared is None:
+            self.shared = [1]
+        self.shared[0] += 1
+        cloned_list.shared = self.shared
+        cloned_list.tail = self.tail
+        cloned_list.size = self.size
+        cloned_list.flipped = self.flipped
         return cloned_list
 
     def reverse(self) -> None:
-        if not self.head or self.head.next == self.head:
+        # O(1): no links change until _materialize is needed.
+        self.flipped = not self.flipped
+        self.version += 1
+
+    def rotate(self, k: int = 1) -> None:
+        # Like deque.rotate: k > 0 moves the last k elements to the front.
+        # Only the tail anchor moves, so no node is relinked or copied. Links
+        # only go forwards, so this walks (-k) % size nodes (k % size while
+        # flipped): rotate(-1) is O(1), rotate(1) a full lap.
+        if self.size < 2:
+            return
+        steps = (k if self.flipped else -k) % self.size
+        tail = self.tail
+        for _ in range(steps):
+            tail = tail.next
+        self.tail = tail
+        self.version += 1
+
+    def _search_bounds(self, start: int, stop) -> tuple:
+        # Search bounds follow str.find: negative values count from the end
+        # and out-of-range values are clamped rather than rejected.
+        start, stop, _ = slice(start, stop).indices(self.size)
+        return start, stop
+
+    def _data(self, start: int = 0, stop: int = None):
+        # Yields node data for positions [start, stop) in a single walk.
+        if stop is None:
+            stop = self.size
+        if start >= stop:
             return
+        current = self._node_before(start).next
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
 
-        prev = None
-        current = self.head
-        start = self.head
+    def _text(self) -> str:
+        text = ''.join(self._data())
+        return text[::-1] if self.flipped else text
 
-        while True:
-            next_node = current.next
-            current.next = prev
-            prev = current
-            current = next_node
-            if current == self.head:
-                break
-        self.head.next = prev
-        self.head = prev
-
-    def findFirst(self, element: str) -> int:
+    def findFirst(self, element: str, start: int = 0, stop: int = None) -> int:
         self._validate_character(element)
-        if not self.head:
+        start, stop = self._search_bounds(start, stop)
+        if self.flipped:
+            # The first logical match is the last physical one.
+            position = ''.join(self._data(self.size - stop, self.size - start)).rfind(element)
+            return stop - 1 - position if position != -1 else -1
+        try:
+            return start + indexOf(self._data(start, stop), element)
+        except ValueError:
             return -1
-        index = 0
-        current = self.head
-        while True:
-            if current.data == element:
-                return index
-            current = current.next
-            index += 1
-            if current == self.head:
-                break
-        return -1
 
-    def findLast(self, element: str) -> int:
+    def findLast(self, element: str, start: int = 0, stop: int = None) -> int:
         self._validate_character(element)
-        if not self.head:
-            return -1
-        index = 0
-        last_index = -1
+        start, stop = self._search_bounds(start, stop)
+        if self.flipped:
+            try:
+                return stop - 1 - indexOf(self._data(self.size - stop, self.size - start), element)
+            except ValueError:
+                return -1
+        position = ''.join(self._data(start, stop)).rfind(element)
+        return start + position if position != -1 else -1
+
+    def count(self, element: str) -> int:
+        self._validate_character(element)
+        return countOf(self._data(), element)
+
+    def findSubsequence(self, pattern) -> int:
+        text = self._validate_characters(pattern)
+        return self._text().find(text)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        if self.flipped:
+            # Nodes only link forwards, so walk once and replay the buffer.
+            return reversed(list(self._data()))
+        return self._data()
+
+    def __reversed__(self):
+        if self.flipped:
+            return self._data()
+        return reversed(list(self._data()))
+
+    def _range_data(self, positions: range):
+        # Elements at the given logical positions in one walk over the
+        # nodes they span.
+        if not positions:
+            return iter(())
+        if self.flipped:
+            last = self.size - 1
+            positions = range(last - positions.start, last - positions.stop, -positions.step)
+        if positions.step > 0:
+            return islice(self._data(positions.start, positions[-1] + 1), 0, None, positions.step)
+        # Links only go forwards: walk the span once and replay it backwards.
+        forward = positions[::-1]
+        return reversed(list(islice(self._data(forward.start, forward[-1] + 1), 0, None, forward.step)))
+
+    def __getitem__(self, key):
+        # Slices are views over this list's nodes; see views.py.
+        positions = views.positions(key, self.size)
+        if isinstance(key, slice):
+            return views.ListView(self, positions)
+        return self.get(positions.start)
+
+    def __setitem__(self, key, value) -> None:
+        views.assign(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        views.delete(self, key)
+
+    def cursor(self, index: int = 0) -> Cursor:
+        # An empty list still gets a cursor at 0 so it can insert_after().
+        # Cursors step along the links, so a pending reverse() is applied.
+        if index < 0 or index >= max(self.size, 1):
+            raise ValueError("Wrong index value.")
+        self._materialize()
+        return Cursor(self, index)
+
+    def cycle(self):
+        # Endless round-robin over the ring; stops once the list is emptied.
+        # The successor is read before each element is handed out, so the
+        # caller may delete that element (its node may go back to the pool).
+        self._materialize()
         current = self.head
-        while True:
-            if current.data == element:
-                last_index = index
-            current = current.next
-            index += 1
-            if current == self.head:
-                break
-        return last_index
+        while self.tail:
+            following = current.next
+            yield current.data
+            current = following
 
     def clear(self) -> None:
-        self.head = None
+        if self.tail and not self._detach():
+            head = self.tail.next
+            # Opening the ring lets reference counting free the nodes right
+            # away instead of leaving a cycle for the garbage collector.
+            self.tail.next = None
+            while head is not None and len(self.pool) < self.pool_size:
+                next_node = head.next
+                self._release(head)
+                head = next_node
+        self.tail = None
+        self.size = 0
+        self.flipped = False
 
     def extend(self, elements: 'CircularLinkedList') -> None:
-        if not elements.head:
+        if elements.tail:
+            self.insert_many(self.size, elements._text())
+
+    def extend_from(self, elements) -> None:
+        self.insert_many(self.size, elements)
+
+    def insert_many(self, index: int, elements) -> None:
+        text = self._validate_characters(elements)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+        if not text:
+            return
+        if self.maxlen is not None and self.size + len(text) > self.maxlen:
+            if index != self.size:
+                raise ValueError("List is full")
+            # Appending evicts the oldest elements, as append() does.
+            if len(text) >= self.maxlen:
+                self.clear()
+                text = text[-self.maxlen:]
+            else:
+                self.delete_range(0, self.size + len(text) - self.maxlen)
+            index = self.size
+
+        self._own()
+        if self.flipped:
+            # Logical order is read backwards, so the text goes in reversed.
+            index = self.size - index
+            text = text[::-1]
+        first, last = self._chain(text)
+        if not self.tail:
+            last.next = first
+            self.tail = last
+        else:
+            prev = self._node_before(index)
+            last.next = prev.next
+            prev.next = first
+            if index == self.size:
+                self.tail = last
+        self.size += len(text)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if start < 0 or stop < start or stop > self.size:
+            raise ValueError("Wrong index value.")
+        if start == stop:
+            return
+        if stop - start == self.size:
+            self.clear()
             return
 
-        current = elements.head
-        while True:
-            self.append(current.data)
-            current = current.next
-            if current == elements.head:
-                break
+        self._own()
+        if self.flipped:
+            start, stop = self.size - stop, self.size - start
+        prev = self._node_before(start)
+        last = prev
+        for _ in range(stop - start):
+            last = last.next
+        removed = prev.next
+        prev.next = last.next
+        if stop == self.size:
+            self.tail = prev
+        self.size -= stop - start
+
+        last.next = None
+        while removed is not None and len(self.pool) < self.pool_size:
+            next_node = removed.next
+            self._release(removed)
+            removed = next_node
+
+    def batch(self) -> edits.Batch:
+        return edits.Batch(self)
+
+    def apply_edits(self, ops) -> None:
+        # Applies a whole edit script (see edits.py) in one walk that stops
+        # at the last edited index, instead of one walk from the head per
+        # edit.
+        events = edits.plan(ops, self.size)
+        if not events:
+            return
+        deleted = sum(1 for _, kind, _ in events if kind == edits.DELETE)
+        self._check_room(sum(len(run) for _, kind, run in events if kind == edits.INSERT) - deleted)
+        if deleted == self.size:
+            # Nothing survives, so only the inserted runs remain.
+            text = ''.join(run for _, kind, run in events if kind == edits.INSERT)
+            self.clear()
+            self.extend_from(text)
+            return
+
+        self._materialize()
+        self._own()
+        size = self.size
+        prev = self.tail
+        position = 0
+        walked = 0
+        for index, kind, run in events:
+            # prev precedes the original element at `index`.
+            walked += index - position
+            for _ in range(index - position):
+                prev = prev.next
+            position = index
+            if kind == edits.INSERT:
+                first, last = self._chain(run)
+                last.next = prev.next
+                prev.next = first
+                prev = last
+                if index == size:
+                    self.tail = last
+                self.size += len(run)
+            else:
+                removed = prev.next
+                prev.next = removed.next
+                if removed is self.tail:
+                    self.tail = prev
+                self._release(removed)
+                position = index + 1
+                self.size -= 1
+        if self.walked is not None:
+            self.walked += walked
+
+    async def aextend(self, elements, batch_size: int = streaming.BATCH_SIZE) -> None:
+        await streaming.aextend(self, elements, batch_size)
+
+    def __aiter__(self):
+        # Iterates over the contents as they were when iteration started, so
+        # other tasks may edit the list between batches.
+        return streaming.aiterate(self._text())
+
+    def to_bytes(self, checksum: bool = True) -> bytes:
+        return snapshot.pack(*snapshot.encode(self._text()), checksum)
+
+    def save(self, path: str, checksum: bool = True) -> None:
+        snapshot.save(path, *snapshot.encode(self._text()), checksum)
+
+    @classmethod
+    def from_bytes(cls, data, pool_size: int = 0) -> 'CircularLinkedList':
+        # Decodes the payload in one go and links it in a single pass.
+        lst = cls(pool_size)
+        lst.extend_from(snapshot.decode(*snapshot.unpack(data)))
+        return lst
+
+    @classmethod
+    def load(cls, path: str, pool_size: int = 0) -> 'CircularLinkedList':
+        return cls.from_bytes(snapshot.load(path), pool_size)
 
 
 if __name__ == '__main__':
@@ -238,4 +712,4 @@ if __name__ == '__main__':
     list2 = CircularLinkedList()
     list2.append('Z')
     list1.extend(list2)
-    print("Length after extend (expected 3):", list1.length())
\ No newline at end of file
+    print("Length after extend (expected 3):", list1.length())
@@ -0,0 +1,72 @@
+from heapq import merge
+
+# Edit scripts are sequences of ('insert', element, index) and
+# ('delete', index) tuples. Every index refers to the list as it was before
+# the script, so edits do not shift each other: inserts at the same index
+# keep their order and come before the original element there.
+INSERT = 0
+DELETE = 1
+
+
+def plan(ops, size: int) -> list:
+    # Validates a whole script before anything is changed and returns its
+    # events sorted by index: (index, INSERT, text) with all characters
+    # inserted there, or (index, DELETE, None).
+    inserts = {}
+    deleted = set()
+    for op in ops:
+        if op[0] == 'insert':
+            _, element, index = op
+            if not isinstance(element, str):
+                raise ValueError("Element must be a string")
+            if len(element) != 1:
+                raise ValueError("Element must be a single character")
+            if index < 0 or index > size:
+                raise ValueError("Wrong index value.")
+            inserts.setdefault(index, []).append(element)
+        elif op[0] == 'delete':
+            _, index = op
+            if index < 0 or index >= size or index in deleted:
+                raise ValueError("Wrong index value.")
+            deleted.add(index)
+        else:
+            raise ValueError(f"Unknown edit {op[0]!r}")
+    return list(merge(sorted((index, INSERT, ''.join(chars)) for index, chars in inserts.items()),
+                      ((index, DELETE, None) for index in sorted(deleted))))
+
+
+def apply_to_text(text: str, events: list) -> str:
+    # Copies the untouched runs between events once each.
+    pieces = []
+    previous = 0
+    for index, kind, run in events:
+        pieces.append(text[previous:index])
+        if kind == INSERT:
+            pieces.append(run)
+            previous = index
+        else:
+            previous = index + 1
+    pieces.append(text[previous:])
+    return ''.join(pieces)
+
+
+class Batch:
+    # Collects edits inside a with block and applies them all when it exits
+    # normally. If the block raises, or the script turns out to be invalid,
+    # the list is left untouched.
+    def __init__(self, lst):
+        self.lst = lst
+        self.ops = []
+
+    def __enter__(self) -> 'Batch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.lst.apply_edits(self.ops)
+
+    def insert(self, element: str, index: int) -> None:
+        self.ops.append(('insert', element, index))
+
+    def delete(self, index: int) -> None:
+        self.ops.append(('delete', index))
@@ -0,0 +1,182 @@
+class GapBufferList:
+    MIN_GAP = 16
+
+    def __init__(self):
+        # Characters live in `buffer` around an unused gap
+        # [gap_start, gap_end). The gap sits at the cursor, so edits there
+        # only move the gap boundaries instead of shifting the whole tail.
+        self.buffer = []
+        self.gap_start = 0
+        self.gap_end = 0
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _gap_size(self) -> int:
+        return self.gap_end - self.gap_start
+
+    def _contents(self) -> list:
+        return self.buffer[:self.gap_start] + self.buffer[self.gap_end:]
+
+    def _reset(self, contents: list, cursor: int) -> None:
+        self.buffer = contents[:cursor] + [None] * self.MIN_GAP + contents[cursor:]
+        self.gap_start = cursor
+        self.gap_end = cursor + self.MIN_GAP
+
+    def _grow(self) -> None:
+        extra = max(len(self.buffer), self.MIN_GAP)
+        self.buffer[self.gap_end:self.gap_end] = [None] * extra
+        self.gap_end += extra
+
+    def _move_gap(self, index: int) -> None:
+        if index < self.gap_start:
+            count = self.gap_start - index
+            self.buffer[self.gap_end - count:self.gap_end] = self.buffer[index:self.gap_start]
+            self.gap_start = index
+            self.gap_end -= count
+        elif index > self.gap_start:
+            count = index - self.gap_start
+            self.buffer[self.gap_start:index] = self.buffer[self.gap_end:self.gap_end + count]
+            self.gap_start = index
+            self.gap_end += count
+
+    def cursor(self) -> int:
+        return self.gap_start
+
+    def move_cursor(self, index: int) -> None:
+        if index < 0 or index > self.length():
+            raise ValueError("Wrong index value.")
+        self._move_gap(index)
+
+    def move_left(self, count: int = 1) -> None:
+        self.move_cursor(self.gap_start - count)
+
+    def move_right(self, count: int = 1) -> None:
+        self.move_cursor(self.gap_start + count)
+
+    def append(self, element: str) -> None:
+        self.insert(element, self.length())
+
+    def length(self) -> int:
+        return len(self.buffer) - self._gap_size()
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0 or index > self.length():
+            raise ValueError("Wrong index value.")
+        self._move_gap(index)
+        if self.gap_start == self.gap_end:
+            self._grow()
+        self.buffer[self.gap_start] = element
+        self.gap_start += 1
+
+    def delete(self, index: int) -> str:
+        if index < 0 or index >= self.length():
+            raise ValueError("Wrong index value.")
+        self._move_gap(index)
+        element = self.buffer[self.gap_end]
+        self.buffer[self.gap_end] = None
+        self.gap_end += 1
+        return element
+
+    def get(self, index: int) -> str:
+        if index < 0 or index >= self.length():
+            raise ValueError("Wrong index value.")
+        if index < self.gap_start:
+            return self.buffer[index]
+        return self.buffer[index + self._gap_size()]
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_character(element)
+        before = [item for item in self.buffer[:self.gap_start] if item != element]
+        after = [item for item in self.buffer[self.gap_end:] if item != element]
+        self._reset(before + after, len(before))
+
+    def clone(self) -> 'GapBufferList':
+        cloned = GapBufferList()
+        cloned.buffer = self.buffer.copy()
+        cloned.gap_start = self.gap_start
+        cloned.gap_end = self.gap_end
+        return cloned
+
+    def reverse(self) -> None:
+        contents = self._contents()
+        contents.reverse()
+        self._reset(contents, len(contents) - self.gap_start)
+
+    def findFirst(self, element: str) -> int:
+        self._validate_character(element)
+        try:
+            return self.buffer.index(element, 0, self.gap_start)
+        except ValueError:
+            pass
+        try:
+            return self.buffer.index(element, self.gap_end) - self._gap_size()
+        except ValueError:
+            return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_character(element)
+        for i in range(self.length() - 1, -1, -1):
+            if self.get(i) == element:
+                return i
+        return -1
+
+    def clear(self) -> None:
+        self.buffer = []
+        self.gap_start = 0
+        self.gap_end = 0
+
+    def extend(self, other: 'GapBufferList') -> None:
+        contents = other._contents()
+        self._move_gap(self.length())
+        self.buffer[self.gap_start:self.gap_start] = contents
+        self.gap_start += len(contents)
+        self.gap_end += len(contents)
+
+
+def random_walk_trace(size: int, edits: int, seed: int = 0) -> list:
+    import random
+
+    rng = random.Random(seed)
+    cursor = size // 2
+    length = size
+    trace = []
+    for _ in range(edits):
+        cursor = min(max(cursor + rng.randint(-8, 8), 0), length)
+        if length and cursor < length and rng.random() < 0.4:
+            trace.append(('delete', cursor))
+            length -= 1
+        else:
+            trace.append(('insert', cursor))
+            cursor += 1
+            length += 1
+    return trace
+
+
+def run_trace(lst, trace: list) -> None:
+    for operation, index in trace:
+        if operation == 'insert':
+            lst.insert('x', index)
+        else:
+            lst.delete(index)
+
+
+if __name__ == '__main__':
+    import time
+    from linked_lists.array_based import ArrayBasedList
+
+    size = 1_000_000
+    trace = random_walk_trace(size, 50_000)
+    print(f"Random-walk edit trace: {len(trace)} edits on {size} characters")
+    for factory in (ArrayBasedList, GapBufferList):
+        lst = factory()
+        for _ in range(size):
+            lst.append('a')
+        start = time.perf_counter()
+        run_trace(lst, trace)
+        elapsed = time.perf_counter() - start
+        print(f"{factory.__name__:>15}: {elapsed:.3f}s")
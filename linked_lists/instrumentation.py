@@ -0,0 +1,195 @@
+import inspect
+import time
+from collections import deque
+
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+
+# Latency percentiles are computed over this many most recent calls.
+SAMPLE_SIZE = 1024
+
+
+def _scanned(size, args, result):
+    # Elements a forward search looked at: up to the match, or the range.
+    start, stop, _ = slice(args[1], args[2]).indices(size)
+    if result == -1:
+        return max(stop - start, 0)
+    return result - start + 1
+
+
+def _scanned_backwards(size, args, result):
+    start, stop, _ = slice(args[1], args[2]).indices(size)
+    if result == -1:
+        return max(stop - start, 0)
+    return stop - result
+
+
+# Methods whose work is the walk CircularLinkedList counts itself in its
+# `walked` attribute. Where such a walk starts depends on the finger and on a
+# pending reverse, which the arguments do not show, and an edit script may
+# be a generator that the call has already consumed.
+WALKED = 'walked'
+
+# Work models estimate the backend work done by a call from the list size
+# before the call, its positional arguments (defaults filled in) and its
+# result. CircularLinkedList counts nodes traversed; ArrayBasedList counts
+# elements shifted or copied.
+CIRCULAR_WORK = {
+    'append': lambda size, args, result: 0,
+    'insert': WALKED,
+    'get': WALKED,
+    'delete': WALKED,
+    'deleteAll': lambda size, args, result: size,
+    'clone': lambda size, args, result: 0,
+    'reverse': lambda size, args, result: 0,
+    'rotate': lambda size, args, result: -args[0] % size if size else 0,
+    'findFirst': _scanned,
+    'findLast': lambda size, args, result: size,
+    'count': lambda size, args, result: size,
+    'findSubsequence': lambda size, args, result: size,
+    'extend': lambda size, args, result: args[0].length(),
+    'extend_from': lambda size, args, result: 0,
+    'insert_many': WALKED,
+    'delete_range': lambda size, args, result: args[1],
+    'apply_edits': WALKED,
+}
+
+ARRAY_WORK = {
+    'append': lambda size, args, result: 0,
+    'insert': lambda size, args, result: size - args[1],
+    'get': lambda size, args, result: 0,
+    'delete': lambda size, args, result: size - args[0] - 1,
+    'deleteAll': lambda size, args, result: size,
+    'clone': lambda size, args, result: 0,
+    'reverse': lambda size, args, result: 0,
+    'findFirst': _scanned,
+    'findLast': _scanned_backwards,
+    'count': lambda size, args, result: size,
+    'findSubsequence': lambda size, args, result: size,
+    'extend': lambda size, args, result: args[0].length(),
+    'extend_from': lambda size, args, result: 0,
+    'insert_many': lambda size, args, result: size - args[0],
+    'delete_range': lambda size, args, result: size - args[1],
+    'apply_edits': lambda size, args, result: size,
+}
+
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.work = 0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+class Instrumentation:
+    def __init__(self, work_models: dict):
+        self.work_models = work_models
+        self.methods = {}
+        self.callbacks = []
+        # Methods call each other internally (insert calls append, extend
+        # calls insert_many); only the outermost call is recorded.
+        self.depth = 0
+
+    def add_callback(self, callback) -> None:
+        # callback(method_name, seconds, work) runs after every recorded call.
+        self.callbacks.append(callback)
+
+    def record(self, name: str, seconds: float, work: int) -> None:
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+        stats.calls += 1
+        stats.total_seconds += seconds
+        stats.work += work
+        stats.samples.append(seconds)
+        for callback in self.callbacks:
+            callback(name, seconds, work)
+
+    def snapshot(self) -> dict:
+        return {
+            name: {
+                'calls': stats.calls,
+                'total_seconds': stats.total_seconds,
+                'p50': stats.percentile(0.5),
+                'p90': stats.percentile(0.9),
+                'p99': stats.percentile(0.99),
+                'work': stats.work,
+            }
+            for name, stats in self.methods.items()
+        }
+
+    def reset(self) -> None:
+        self.methods = {}
+
+
+def _wrap(lst, instrumentation: Instrumentation, name: str, method, work_model):
+    length = type(lst).length
+    signature = inspect.signature(method)
+    counted = work_model == WALKED
+
+    def wrapper(*args, **kwargs):
+        if instrumentation.depth:
+            return method(*args, **kwargs)
+        size = length(lst)
+        walked = lst.walked if counted else 0
+        instrumentation.depth += 1
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            instrumentation.depth -= 1
+        if counted:
+            work = lst.walked - walked
+        else:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            work = work_model(size, bound.args, result)
+        instrumentation.record(name, elapsed, work)
+        return result
+
+    return wrapper
+
+
+def enable_instrumentation(lst, callback=None) -> Instrumentation:
+    # Shadows the list's methods with timing wrappers on this instance only.
+    # Lists that were never instrumented keep calling the plain methods, so
+    # instrumentation costs nothing while it is off.
+    if getattr(lst, 'instrumentation', None) is not None:
+        instrumentation = lst.instrumentation
+    else:
+        # The work models describe these two classes' methods and costs.
+        if isinstance(lst, CircularLinkedList):
+            work_models = CIRCULAR_WORK
+            lst.walked = 0
+        elif isinstance(lst, ArrayBasedList):
+            work_models = ARRAY_WORK
+        else:
+            raise ValueError("Only ArrayBasedList and CircularLinkedList can be instrumented")
+        instrumentation = Instrumentation(work_models)
+        for name, work_model in work_models.items():
+            method = getattr(lst, name, None)
+            if method is not None:
+                setattr(lst, name, _wrap(lst, instrumentation, name, method, work_model))
+        lst.instrumentation = instrumentation
+    if callback is not None:
+        instrumentation.add_callback(callback)
+    return instrumentation
+
+
+def disable_instrumentation(lst) -> None:
+    instrumentation = getattr(lst, 'instrumentation', None)
+    if instrumentation is None:
+        return
+    for name in instrumentation.work_models:
+        lst.__dict__.pop(name, None)
+    if isinstance(lst, CircularLinkedList):
+        lst.walked = None
+    lst.instrumentation = None
@@ -0,0 +1,334 @@
+import mmap
+import os
+import tempfile
+
+from linked_lists.snapshot import ENCODINGS, HEADER, MAGIC, VERSION
+
+# Files use the snapshot layout (see snapshot.py) followed by unused
+# capacity. Closing the list trims the capacity, so a closed file is a valid
+# snapshot. Writes clear the checksum flag, since keeping a CRC of the whole
+# payload current would cost a full pass per edit; opening a file does not
+# verify it either, as that would read every page.
+UNIT_FORMATS = {1: 'B', 2: 'H', 4: 'I'}
+
+# Growth doubles the capacity for amortized O(1) appends, but by at most
+# MAX_GROWTH bytes at a time so huge files do not reserve gigabytes of slack.
+MIN_CAPACITY = 4096
+MAX_GROWTH = 1 << 30
+# Whole-list passes (count, deleteAll, reverse, ...) decode this many code
+# units at a time, so they never hold more than one chunk in memory.
+CHUNK_UNITS = 1 << 20
+
+
+class MappedList:
+    def __init__(self, path: str = None, width: int = 4):
+        # Storage is a memory-mapped file of fixed-width code units: 1 byte
+        # holds Latin-1, 2 bytes the Basic Multilingual Plane, 4 bytes any
+        # character. Pages are read in by the OS only when touched, so opening
+        # a large file costs nothing until it is read. Without a path the
+        # list lives in an anonymous temporary file.
+        if width not in ENCODINGS:
+            raise ValueError("Code unit width must be 1, 2 or 4")
+        self.path = path
+        if path is None:
+            self.file = tempfile.TemporaryFile()
+        else:
+            self.file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        if os.fstat(self.file.fileno()).st_size:
+            magic, version, width, _, self.size, _ = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or width not in ENCODINGS:
+                self.file.close()
+                raise ValueError("Not a character list file")
+        else:
+            self.size = 0
+            self.file.write(HEADER.pack(MAGIC, VERSION, width, 0, 0, 0))
+            self.file.truncate(HEADER.size + MIN_CAPACITY)
+        self.width = width
+        self.encoding = ENCODINGS[width]
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.units = self._view()
+
+    def _view(self) -> memoryview:
+        # Zero-copy view of the code units after the header, in native byte
+        # order (the file is little-endian, as are the supported hosts). It
+        # pins the mapping, so it is released before every resize.
+        return memoryview(self.map)[HEADER.size:].cast(UNIT_FORMATS[self.width])
+
+    def _capacity(self) -> int:
+        return (len(self.map) - HEADER.size) // self.width
+
+    def _resize(self, units: int) -> None:
+        # The resize raises BufferError while a buffer() view is alive; the
+        # list then keeps a fresh view of the unchanged mapping.
+        self.units.release()
+        try:
+            self.map.resize(HEADER.size + units * self.width)
+        finally:
+            self.units = self._view()
+
+    def _reserve(self, extra: int) -> None:
+        needed = self.size + extra
+        capacity = self._capacity()
+        if needed > capacity:
+            grown = capacity + min(capacity, MAX_GROWTH // self.width)
+            self._resize(max(needed, grown))
+
+    def _set_size(self, size: int) -> None:
+        self.size = size
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, self.width, 0, size, 0)
+
+    def _offset(self, index: int) -> int:
+        return HEADER.size + index * self.width
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _validate_characters(self, elements) -> str:
+        if isinstance(elements, str):
+            return elements
+        elements = list(elements)
+        if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+            raise ValueError("Elements must be single characters")
+        return ''.join(elements)
+
+    def _encode(self, text: str) -> bytes:
+        try:
+            encoded = text.encode(self.encoding)
+        except UnicodeEncodeError:
+            encoded = b''
+        # UTF-16 would silently use two units for characters outside the BMP.
+        if len(encoded) != len(text) * self.width:
+            raise ValueError(f"Characters must fit in {self.width}-byte code units")
+        return encoded
+
+    def _decode(self, start: int, stop: int) -> str:
+        return self.map[self._offset(start):self._offset(stop)].decode(self.encoding)
+
+    def _chunks(self, start: int = 0, stop: int = None):
+        if stop is None:
+            stop = self.size
+        for chunk_start in range(start, stop, CHUNK_UNITS):
+            yield self._decode(chunk_start, min(chunk_start + CHUNK_UNITS, stop))
+
+    def _text(self) -> str:
+        return self._decode(0, self.size)
+
+    def _find(self, pattern: bytes, start: int, stop: int, last: bool = False) -> int:
+        # Searches the mapping directly. A match must start on a code unit
+        # boundary; misaligned hits are skipped.
+        low = self._offset(start)
+        high = self._offset(stop)
+        while True:
+            position = self.map.rfind(pattern, low, high) if last else self.map.find(pattern, low, high)
+            if position == -1:
+                return -1
+            if (position - HEADER.size) % self.width == 0:
+                return (position - HEADER.size) // self.width
+            if last:
+                high = position + len(pattern) - 1
+            else:
+                low = position + 1
+
+    def _search_bounds(self, start: int, stop) -> tuple:
+        start, stop, _ = slice(start, stop).indices(self.size)
+        return start, stop
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for chunk in self._chunks():
+            yield from chunk
+
+    def __del__(self):
+        # A list that is dropped without close() still releases its view,
+        # mapping and file. A failed __init__ may leave no mapping behind.
+        if getattr(self, 'map', None) is not None:
+            self.close()
+
+    def __enter__(self) -> 'MappedList':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        # Writes dirty pages back to the file.
+        self.map.flush()
+
+    def close(self) -> None:
+        # Trims unused capacity so the file holds exactly the list.
+        if self.map.closed:
+            return
+        self._resize(self.size)
+        self.units.release()
+        self.map.flush()
+        self.map.close()
+        self.file.close()
+
+    def append(self, element: str) -> None:
+        self._validate_character(element)
+        encoded = self._encode(element)
+        self._reserve(1)
+        offset = self._offset(self.size)
+        self.map[offset:offset + self.width] = encoded
+        self._set_size(self.size + 1)
+
+    def length(self) -> int:
+        return self.size
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+        self.insert_many(index, element)
+
+    def delete(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+        element = chr(self.units[index])
+        self.delete_range(index, index + 1)
+        return element
+
+    def get(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+        return chr(self.units[index])
+
+    def deleteAll(self, element: str) -> None:
+        # Compacts in place one chunk at a time; the write position never
+        # overtakes the read position.
+        self._validate_character(element)
+        try:
+            self._encode(element)
+        except ValueError:
+            return
+        write = 0
+        for chunk in self._chunks():
+            kept = chunk.replace(element, '')
+            self.map[self._offset(write):self._offset(write + len(kept))] = kept.encode(self.encoding)
+            write += len(kept)
+        self._set_size(write)
+
+    def clone(self, path: str = None) -> 'MappedList':
+        cloned = MappedList(path, self.width)
+        cloned.delete_range(0, cloned.size)
+        cloned.extend(self)
+        return cloned
+
+    def reverse(self) -> None:
+        # Swaps reversed chunks from both ends towards the middle.
+        low, high = 0, self.size
+        while high - low > 1:
+            count = min(CHUNK_UNITS, (high - low) // 2)
+            front = self._decode(low, low + count)
+            back = self._decode(high - count, high)
+            self.map[self._offset(low):self._offset(low + count)] = back[::-1].encode(self.encoding)
+            self.map[self._offset(high - count):self._offset(high)] = front[::-1].encode(self.encoding)
+            low += count
+            high -= count
+
+    def findFirst(self, element: str, start: int = 0, stop: int = None) -> int:
+        self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        try:
+            return self._find(self._encode(element), start, stop)
+        except ValueError:
+            return -1
+
+    def findLast(self, element: str, start: int = 0, stop: int = None) -> int:
+        self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        try:
+            return self._find(self._encode(element), start, stop, last=True)
+        except ValueError:
+            return -1
+
+    def count(self, element: str) -> int:
+        self._validate_character(element)
+        return sum(chunk.count(element) for chunk in self._chunks())
+
+    def findSubsequence(self, pattern) -> int:
+        text = self._validate_characters(pattern)
+        try:
+            return self._find(self._encode(text), 0, self.size)
+        except ValueError:
+            return -1
+
+    def clear(self) -> None:
+        self._set_size(0)
+        self._resize(MIN_CAPACITY // self.width)
+
+    def extend(self, other) -> None:
+        # Another mapped list of the same width is copied as raw bytes, one
+        # chunk at a time; anything else goes through its text.
+        if not isinstance(other, MappedList) or other.width != self.width:
+            self.extend_from(other._text())
+            return
+        count = other.size
+        self._reserve(count)
+        for start in range(0, count, CHUNK_UNITS):
+            stop = min(start + CHUNK_UNITS, count)
+            self.map[self._offset(self.size + start):self._offset(self.size + stop)] = \
+                other.map[other._offset(start):other._offset(stop)]
+        self._set_size(self.size + count)
+
+    def extend_from(self, elements) -> None:
+        self.insert_many(self.size, elements)
+
+    def insert_many(self, index: int, elements) -> None:
+        text = self._validate_characters(elements)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+        encoded = self._encode(text)
+        if not text:
+            return
+        self._reserve(len(text))
+        offset = self._offset(index)
+        self.map.move(offset + len(encoded), offset, self._offset(self.size) - offset)
+        self.map[offset:offset + len(encoded)] = encoded
+        self._set_size(self.size + len(text))
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if start < 0 or stop < start or stop > self.size:
+            raise ValueError("Wrong index value.")
+        if start == stop:
+            return
+        end = self._offset(self.size)
+        self.map.move(self._offset(start), self._offset(stop), end - self._offset(stop))
+        self._set_size(self.size - (stop - start))
+
+    def buffer(self) -> memoryview:
+        # Zero-copy view of the code units. While a view is alive the list
+        # cannot grow or shrink its file, so release it before mutating.
+        return self.units[:self.size]
+
+
+if __name__ == '__main__':
+    import time
+
+    size = 100_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'log.chrl')
+        start = time.perf_counter()
+        with MappedList(path, width=1) as lst:
+            chunk = 'abcdefghij' * (CHUNK_UNITS // 10)
+            while lst.length() < size:
+                lst.extend_from(chunk[:size - lst.length()])
+            lst.append('!')
+        print(f"Wrote {size + 1} characters: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        lst = MappedList(path)
+        print(f"Opened: {(time.perf_counter() - start) * 1e3:.2f} ms, length {lst.length()}")
+        for name, operation in (("get(middle)", lambda: lst.get(size // 2)),
+                                ("findFirst('!')", lambda: lst.findFirst('!')),
+                                ("findLast('a')", lambda: lst.findLast('a')),
+                                ("count('a')", lambda: lst.count('a'))):
+            start = time.perf_counter()
+            operation()
+            print(f"{name:>15}: {time.perf_counter() - start:.4f}s")
+        lst.close()
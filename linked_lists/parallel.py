@@ -0,0 +1,205 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from linked_lists import snapshot
+
+# Below this many elements the cost of copying into shared memory and
+# starting the work outweighs the gain, so scans run serially.
+PARALLEL_THRESHOLD = 1 << 22
+# Work is split into this many chunks per worker to even out the load.
+CHUNKS_PER_WORKER = 4
+
+
+def _scan(name: str, width: int, start: int, stop: int, operation: str, element: str) -> int:
+    # Runs in a worker on code units [start, stop) of the shared block. Pool
+    # workers share the parent's resource tracker, so attaching does not make
+    # them owners of the block.
+    shm = SharedMemory(name=name)
+    region = shm.buf[start * width:stop * width]
+    try:
+        text = snapshot.decode(width, region)
+        if operation == 'find':
+            position = text.find(element)
+        elif operation == 'rfind':
+            position = text.rfind(element)
+        elif operation == 'count':
+            return text.count(element)
+        else:
+            # Compacts the survivors to the front of the chunk and returns
+            # how many there are.
+            kept = text.replace(element, '')
+            region[:len(kept) * width] = kept.encode(snapshot.ENCODINGS[width], 'surrogatepass')
+            return len(kept)
+        return start + position if position != -1 else -1
+    finally:
+        del region
+        shm.close()
+
+
+class ParallelScanner:
+    # Runs findFirst/findLast/count/deleteAll for an ArrayBasedList across a
+    # process pool. The storage is copied into shared memory, which the
+    # workers attach to by name, so no element is pickled. The copy is kept
+    # and reused by later scans until the list's version changes. Small
+    # lists and indexed lists, whose searches are already lookups, use the
+    # list's own methods.
+    def __init__(self, max_workers: int = None, threshold: int = PARALLEL_THRESHOLD):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.executor = None
+        # (list, (version, flipped), block, width) for the last list copied.
+        # The flag is part of the key because materializing a pending
+        # reverse rewrites the storage without bumping the version.
+        self.block = None
+
+    def __del__(self):
+        self._drop_block()
+
+    def __enter__(self) -> 'ParallelScanner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._drop_block()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def _serial(self, lst) -> bool:
+        return lst.length() < self.threshold or lst.positions is not None
+
+    def _drop_block(self) -> None:
+        if self.block is not None:
+            shm = self.block[2]
+            self.block = None
+            shm.close()
+            shm.unlink()
+
+    def _share(self, lst) -> tuple:
+        # Returns (block, width) holding the physical storage of lst,
+        # copying it only if lst is not the list in the current block or
+        # has changed since it was copied.
+        key = (lst.version, lst.flipped)
+        if self.block is not None:
+            owner, shared_key, shm, width = self.block
+            if owner() is lst and shared_key == key:
+                return shm, width
+            self._drop_block()
+        if isinstance(lst.items, bytearray):
+            width, payload = 1, lst.items
+        else:
+            width, payload = snapshot.encode(lst._physical_text())
+        shm = SharedMemory(create=True, size=max(len(payload), 1))
+        shm.buf[:len(payload)] = payload
+        self.block = (weakref.ref(lst), key, shm, width)
+        return shm, width
+
+    def _run(self, lst, operation: str, element: str) -> tuple:
+        # Returns (per-chunk results, chunk bounds, shared block, width).
+        shm, width = self._share(lst)
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.max_workers)
+        length = lst.length()
+        chunks = min(self.max_workers * CHUNKS_PER_WORKER, length)
+        bounds = [(length * i // chunks, length * (i + 1) // chunks) for i in range(chunks)]
+        try:
+            futures = [self.executor.submit(_scan, shm.name, width, start, stop, operation, element)
+                       for start, stop in bounds]
+            return [future.result() for future in futures], bounds, shm, width
+        except BaseException:
+            # A failed compaction may have left the block half rewritten.
+            self._drop_block()
+            raise
+
+    def _find(self, lst, element: str, last: bool) -> int:
+        # Physical search; the earliest or latest hit over all chunks.
+        results, _, _, _ = self._run(lst, 'rfind' if last else 'find', element)
+        hits = [position for position in results if position != -1]
+        if not hits:
+            return -1
+        return max(hits) if last else min(hits)
+
+    def findFirst(self, lst, element: str) -> int:
+        lst._validate_character(element)
+        if self._serial(lst):
+            return lst.findFirst(element)
+        if lst.flipped:
+            position = self._find(lst, element, last=True)
+            return lst.length() - 1 - position if position != -1 else -1
+        return self._find(lst, element, last=False)
+
+    def findLast(self, lst, element: str) -> int:
+        lst._validate_character(element)
+        if self._serial(lst):
+            return lst.findLast(element)
+        if lst.flipped:
+            position = self._find(lst, element, last=False)
+            return lst.length() - 1 - position if position != -1 else -1
+        return self._find(lst, element, last=True)
+
+    def count(self, lst, element: str) -> int:
+        lst._validate_character(element)
+        if self._serial(lst):
+            return lst.count(element)
+        results, _, _, _ = self._run(lst, 'count', element)
+        return sum(results)
+
+    def deleteAll(self, lst, element: str) -> None:
+        lst._validate_character(element)
+        if self._serial(lst):
+            lst.deleteAll(element)
+            return
+        results, bounds, shm, width = self._run(lst, 'compact', element)
+        if sum(results) == lst.length():
+            # Nothing was removed, so the block still matches the list.
+            return
+        try:
+            # Each chunk now starts with its survivors; join them in order.
+            payload = b''.join(shm.buf[start * width:(start + kept) * width]
+                               for (start, _), kept in zip(bounds, results))
+        finally:
+            self._drop_block()
+        flipped = lst.flipped
+        if width == 1 and isinstance(lst.items, bytearray):
+            lst._detach()
+            lst.items = bytearray(payload)
+        else:
+            text = snapshot.decode(width, payload)
+            lst.clear()
+            lst.extend_from(text)
+            if flipped:
+                # The survivors were joined in physical order.
+                lst.flipped = True
+
+
+if __name__ == '__main__':
+    import time
+    from linked_lists.array_based import ArrayBasedList
+
+    size = 20_000_000
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    operations = (("findFirst", 'z'), ("findLast", 'z'), ("count", 'a'), ("deleteAll", 'z'))
+    print(f"{size} elements, {cores} cores")
+    for compact in (False, True):
+        lst = ArrayBasedList(compact=compact)
+        lst.extend_from('abcdefghij' * (size // 10))
+        for name, element in operations:
+            start = time.perf_counter()
+            getattr(lst, name)(element)
+            serial = time.perf_counter() - start
+            line = f"{'compact' if compact else 'list':>7} {name:>9}: serial {serial:.3f}s"
+            for workers in worker_counts:
+                with ParallelScanner(workers, threshold=0) as scanner:
+                    # The first scan copies the list into shared memory and
+                    # starts the workers; the timed scan reuses both.
+                    scanner.count(lst, 'a')
+                    start = time.perf_counter()
+                    getattr(scanner, name)(lst, element)
+                    elapsed = time.perf_counter() - start
+                line += f", {workers} workers {elapsed:.3f}s ({serial / elapsed:.1f}x)"
+            print(line)
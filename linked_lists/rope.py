@@ -0,0 +1,206 @@
+class Leaf:
+    def __init__(self, text: str):
+        self.text = text
+        self.size = len(text)
+        self.height = 0
+
+
+class Branch:
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.size = left.size + right.size
+        self.height = max(left.height, right.height) + 1
+
+
+# Nodes are never mutated after construction, so any subtree can be shared
+# between ropes. Every edit rebuilds only the O(log n) nodes on its path.
+CHUNK_SIZE = 128
+
+
+def _rotate(left, right):
+    # Builds a branch from two subtrees whose heights differ by at most two.
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return Branch(left.left, Branch(left.right, right))
+        return Branch(Branch(left.left, left.right.left), Branch(left.right.right, right))
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return Branch(Branch(left, right.left), right.right)
+        return Branch(Branch(left, right.left.left), Branch(right.left.right, right.right))
+    return Branch(left, right)
+
+
+def _join(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if isinstance(left, Leaf) and isinstance(right, Leaf) and left.size + right.size <= CHUNK_SIZE:
+        return Leaf(left.text + right.text)
+    if left.height > right.height + 1:
+        return _rotate(left.left, _join(left.right, right))
+    if right.height > left.height + 1:
+        return _rotate(_join(left, right.left), right.right)
+    return Branch(left, right)
+
+
+def _split(node, index: int):
+    if node is None:
+        return None, None
+    if index <= 0:
+        return None, node
+    if index >= node.size:
+        return node, None
+    if isinstance(node, Leaf):
+        return Leaf(node.text[:index]), Leaf(node.text[index:])
+    if index < node.left.size:
+        left, right = _split(node.left, index)
+        return left, _join(right, node.right)
+    if index > node.left.size:
+        left, right = _split(node.right, index - node.left.size)
+        return _join(node.left, left), right
+    return node.left, node.right
+
+
+def _build_balanced(leaves: list, start: int, stop: int):
+    if stop - start == 1:
+        return leaves[start]
+    middle = (start + stop) // 2
+    return Branch(_build_balanced(leaves, start, middle), _build_balanced(leaves, middle, stop))
+
+
+def _build(text: str):
+    if not text:
+        return None
+    leaves = [Leaf(text[i:i + CHUNK_SIZE]) for i in range(0, len(text), CHUNK_SIZE)]
+    return _build_balanced(leaves, 0, len(leaves))
+
+
+def _leaves(node, backwards: bool = False):
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Leaf):
+            yield current
+        elif backwards:
+            stack.append(current.left)
+            stack.append(current.right)
+        else:
+            stack.append(current.right)
+            stack.append(current.left)
+
+
+class RopeList:
+    def __init__(self):
+        self.root = None
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _text(self) -> str:
+        return ''.join(leaf.text for leaf in _leaves(self.root))
+
+    def append(self, element: str) -> None:
+        self._validate_character(element)
+        self.root = _join(self.root, Leaf(element))
+
+    def length(self) -> int:
+        return self.root.size if self.root else 0
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0 or index > self.length():
+            raise ValueError("Wrong index value.")
+        left, right = _split(self.root, index)
+        self.root = _join(_join(left, Leaf(element)), right)
+
+    def delete(self, index: int) -> str:
+        if index < 0 or index >= self.length():
+            raise ValueError("Wrong index value.")
+        left, rest = _split(self.root, index)
+        removed, right = _split(rest, 1)
+        self.root = _join(left, right)
+        return removed.text
+
+    def get(self, index: int) -> str:
+        if index < 0 or index >= self.length():
+            raise ValueError("Wrong index value.")
+        node = self.root
+        while isinstance(node, Branch):
+            if index < node.left.size:
+                node = node.left
+            else:
+                index -= node.left.size
+                node = node.right
+        return node.text[index]
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_character(element)
+        self.root = _build(self._text().replace(element, ''))
+
+    def clone(self) -> 'RopeList':
+        cloned = RopeList()
+        cloned.root = self.root
+        return cloned
+
+    def reverse(self) -> None:
+        self.root = _build(self._text()[::-1])
+
+    def findFirst(self, element: str) -> int:
+        self._validate_character(element)
+        offset = 0
+        for leaf in _leaves(self.root):
+            position = leaf.text.find(element)
+            if position != -1:
+                return offset + position
+            offset += leaf.size
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_character(element)
+        offset = self.length()
+        for leaf in _leaves(self.root, backwards=True):
+            offset -= leaf.size
+            position = leaf.text.rfind(element)
+            if position != -1:
+                return offset + position
+        return -1
+
+    def clear(self) -> None:
+        self.root = None
+
+    def extend(self, other: 'RopeList') -> None:
+        self.root = _join(self.root, other.root)
+
+    def extend_from(self, elements) -> None:
+        # Builds the new text into a balanced subtree and joins it once.
+        if not isinstance(elements, str):
+            elements = list(elements)
+            if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+                raise ValueError("Elements must be single characters")
+            elements = ''.join(elements)
+        self.root = _join(self.root, _build(elements))
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    size = 10_000_000
+    rope = RopeList()
+    rope.root = _build('a' * size)
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(10_000):
+        index = rng.randrange(rope.length())
+        rope.insert('b', index)
+        rope.get(index)
+        rope.delete(index)
+    print(f"10k insert/get/delete rounds on {size} characters: {time.perf_counter() - start:.3f}s")
+    snapshot = rope.clone()
+    rope.extend(snapshot)
+    print("Length after extending with its own clone:", rope.length())
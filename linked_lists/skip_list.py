@@ -0,0 +1,188 @@
+import random
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    def __init__(self, data, level: int):
+        self.data = data
+        # next[l] is the following node on level l, and width[l] is how many
+        # positions that link skips. A missing link measures the distance to
+        # the virtual end position length() + 1.
+        self.next = [None] * level
+        self.width = [1] * level
+
+
+class IndexableSkipList:
+    def __init__(self):
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.size = 0
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _random_level(self) -> int:
+        # Each extra level is taken with probability 1/2: count trailing ones.
+        bits = random.getrandbits(MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length()
+
+    def _predecessors(self, index: int):
+        # For every level, the last node strictly before element `index`
+        # together with its position (the head is position 0).
+        update = [None] * MAX_LEVEL
+        positions = [0] * MAX_LEVEL
+        node = self.head
+        position = 0
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def _data(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.data
+            node = node.next[0]
+
+    def _extend_text(self, text: str) -> None:
+        # Appends a run in one linear pass, continuing from the rightmost
+        # node on each level instead of searching from the head every time.
+        last, positions = self._predecessors(self.size)
+        position = self.size
+        for char in text:
+            position += 1
+            node = SkipNode(char, self._random_level())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - positions[level]
+                last[level] = node
+                positions[level] = position
+        self.size = position
+        for level in range(MAX_LEVEL):
+            last[level].width[level] = position + 1 - positions[level]
+
+    def _rebuild(self, text: str) -> None:
+        self.clear()
+        self._extend_text(text)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return self._data()
+
+    def append(self, element: str) -> None:
+        self.insert(element, self.size)
+
+    def length(self) -> int:
+        return self.size
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+
+        update, positions = self._predecessors(index)
+        node = SkipNode(element, self._random_level())
+        for level in range(MAX_LEVEL):
+            prev = update[level]
+            if level < len(node.next):
+                # The new node lands at position index + 1 and splits the link.
+                node.next[level] = prev.next[level]
+                node.width[level] = prev.width[level] - (index - positions[level])
+                prev.next[level] = node
+                prev.width[level] = index + 1 - positions[level]
+            else:
+                prev.width[level] += 1
+        self.size += 1
+
+    def delete(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+
+        update, _ = self._predecessors(index)
+        node = update[0].next[0]
+        for level in range(MAX_LEVEL):
+            prev = update[level]
+            if prev.next[level] is node:
+                prev.width[level] += node.width[level] - 1
+                prev.next[level] = node.next[level]
+            else:
+                prev.width[level] -= 1
+        self.size -= 1
+        return node.data
+
+    def get(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+
+        node = self.head
+        position = 0
+        target = index + 1
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+            if position == target:
+                break
+        return node.data
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_character(element)
+        self._rebuild(''.join(self._data()).replace(element, ''))
+
+    def clone(self) -> 'IndexableSkipList':
+        cloned = IndexableSkipList()
+        cloned._extend_text(''.join(self._data()))
+        return cloned
+
+    def reverse(self) -> None:
+        self._rebuild(''.join(self._data())[::-1])
+
+    def findFirst(self, element: str) -> int:
+        self._validate_character(element)
+        for index, data in enumerate(self._data()):
+            if data == element:
+                return index
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_character(element)
+        return ''.join(self._data()).rfind(element)
+
+    def clear(self) -> None:
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.size = 0
+
+    def extend(self, other: 'IndexableSkipList') -> None:
+        self._extend_text(''.join(other._data()))
+
+
+if __name__ == '__main__':
+    import time
+    from linked_lists.circular import CircularLinkedList
+
+    size = 1_000_000
+    rng = random.Random(0)
+    skip_list = IndexableSkipList()
+    circular = CircularLinkedList()
+    start = time.perf_counter()
+    skip_list._extend_text('a' * size)
+    print(f"Built {size} elements: {time.perf_counter() - start:.3f}s")
+    circular.extend_from('a' * size)
+
+    for name, lst, rounds in (("IndexableSkipList", skip_list, 100_000),
+                              ("CircularLinkedList", circular, 20)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            lst.get(rng.randrange(size))
+            lst.insert('b', rng.randrange(size))
+            lst.delete(rng.randrange(size))
+        per_round = (time.perf_counter() - start) / rounds
+        print(f"{name:>18}: {per_round * 1e6:.1f} us per random get+insert+delete")
@@ -0,0 +1,100 @@
+import struct
+import zlib
+
+# Binary snapshot of a character list: a fixed header followed by `length`
+# code units of `width` bytes each, little-endian. MappedList uses the same
+# layout for its files, so a saved snapshot can be opened in place.
+MAGIC = b'CHRL'
+VERSION = 1
+# magic, version, code unit width, flags, length, CRC-32 of the payload
+HEADER = struct.Struct('<4sBBHQI4x')
+FLAG_CHECKSUM = 1
+
+ENCODINGS = {1: 'latin-1', 2: 'utf-16-le', 4: 'utf-32-le'}
+
+
+def encode(text: str) -> tuple:
+    # Returns (width, payload) using the narrowest width that holds every
+    # character. Lone surrogates only fit the 4-byte form.
+    highest = max(text, default='\x00')
+    if highest < '\u0100':
+        return 1, text.encode('latin-1')
+    if highest < '\U00010000':
+        try:
+            return 2, text.encode('utf-16-le')
+        except UnicodeEncodeError:
+            pass
+    return 4, text.encode('utf-32-le', 'surrogatepass')
+
+
+def decode(width: int, payload) -> str:
+    return str(payload, ENCODINGS[width], 'surrogatepass')
+
+
+def header(width: int, payload, checksum: bool = True) -> bytes:
+    length = len(payload) // width
+    if checksum:
+        return HEADER.pack(MAGIC, VERSION, width, FLAG_CHECKSUM, length, zlib.crc32(payload))
+    return HEADER.pack(MAGIC, VERSION, width, 0, length, 0)
+
+
+def pack(width: int, payload, checksum: bool = True) -> bytes:
+    return header(width, payload, checksum) + payload
+
+
+def unpack(data) -> tuple:
+    # Validates a snapshot and returns (width, payload). The payload is a
+    # memoryview into `data`, so nothing is copied.
+    data = memoryview(data)
+    if len(data) < HEADER.size:
+        raise ValueError("Not a character list snapshot")
+    magic, version, width, flags, length, crc = HEADER.unpack_from(data)
+    if magic != MAGIC or width not in ENCODINGS:
+        raise ValueError("Not a character list snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    payload = data[HEADER.size:]
+    if len(payload) != length * width:
+        raise ValueError("Snapshot is truncated")
+    if flags & FLAG_CHECKSUM and zlib.crc32(payload) != crc:
+        raise ValueError("Snapshot checksum mismatch")
+    return width, payload
+
+
+def save(path: str, width: int, payload, checksum: bool = True) -> None:
+    # Writes the header and payload separately to avoid joining them.
+    with open(path, 'wb') as handle:
+        handle.write(header(width, payload, checksum))
+        handle.write(payload)
+
+
+def load(path: str) -> bytes:
+    with open(path, 'rb') as handle:
+        return handle.read()
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+    import time
+    from linked_lists.array_based import ArrayBasedList
+    from linked_lists.mapped import MappedList
+
+    size = 100_000_000
+    lst = ArrayBasedList(compact=True)
+    lst.extend_from('abcdefghij' * (size // 10))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'list.chrl')
+        for checksum in (True, False):
+            start = time.perf_counter()
+            lst.save(path, checksum=checksum)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            loaded = ArrayBasedList.load(path, compact=True)
+            print(f"{size} characters, checksum={checksum}: save {saved:.3f}s, "
+                  f"load {time.perf_counter() - start:.3f}s")
+        del loaded
+        start = time.perf_counter()
+        with MappedList(path) as mapped:
+            print(f"MappedList open: {(time.perf_counter() - start) * 1e3:.2f} ms, "
+                  f"length {mapped.length()}")
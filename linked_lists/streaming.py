@@ -0,0 +1,62 @@
+import asyncio
+import codecs
+
+# Characters handled per step before control goes back to the event loop.
+BATCH_SIZE = 4096
+
+
+async def aextend(lst, elements, batch_size: int = BATCH_SIZE) -> None:
+    # Appends the items of an async iterable. Items may be single characters
+    # or longer strings; they are gathered into runs of batch_size
+    # characters, each added with one extend_from() call followed by a turn
+    # of the event loop. On a bad item, earlier runs stay appended.
+    pending = []
+    count = 0
+    async for item in elements:
+        if not isinstance(item, str):
+            raise ValueError("Elements must be strings")
+        pending.append(item)
+        count += len(item)
+        if count >= batch_size:
+            text = ''.join(pending)
+            cut = len(text) - len(text) % batch_size
+            for start in range(0, cut, batch_size):
+                lst.extend_from(text[start:start + batch_size])
+                await asyncio.sleep(0)
+            pending = [text[cut:]]
+            count = len(text) - cut
+    if count:
+        lst.extend_from(''.join(pending))
+
+
+async def aiterate(text: str, batch_size: int = BATCH_SIZE):
+    # Yields the characters of a snapshot, giving the event loop a turn
+    # after every batch.
+    for start in range(0, len(text), batch_size):
+        for char in text[start:start + batch_size]:
+            yield char
+        await asyncio.sleep(0)
+
+
+async def decode_stream(reader: asyncio.StreamReader, encoding: str = 'utf-8',
+                        chunk_size: int = BATCH_SIZE):
+    # Yields decoded text from a StreamReader, reading at most chunk_size
+    # bytes at a time. Characters split across reads are reassembled. Since
+    # data is only read when the consumer asks for more, a slow consumer
+    # lets the reader's buffer fill up, which pauses the transport.
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+async def ingest_stream(lst, reader: asyncio.StreamReader, encoding: str = 'utf-8',
+                        batch_size: int = BATCH_SIZE) -> None:
+    await aextend(lst, decode_stream(reader, encoding, batch_size), batch_size)
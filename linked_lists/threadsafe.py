@@ -0,0 +1,405 @@
+import threading
+from contextlib import contextmanager
+
+from linked_lists import edits, streaming
+
+# Methods of the wrapped list that only read it. clone() and to_bytes() are
+# not among them: clone() updates the copy-on-write share count and
+# to_bytes() may apply a pending reverse().
+READ_METHODS = {'length', 'get', 'findFirst', 'findLast', 'count', 'findSubsequence'}
+WRITE_METHODS = {'append', 'insert', 'delete', 'deleteAll', 'reverse', 'clear', 'extend_from',
+                 'insert_many', 'delete_range', 'to_bytes', 'save', 'apply_edits', 'rotate'}
+
+
+class RWLock:
+    # Many readers or one writer. A waiting writer blocks new readers, so a
+    # steady stream of readers cannot starve writers.
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.readers = 0
+        self.writer = False
+        self.waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        with self.condition:
+            while self.writer or self.waiting_writers:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self) -> None:
+        with self.condition:
+            self.readers -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self.condition:
+            self.waiting_writers += 1
+            while self.writer or self.readers:
+                self.condition.wait()
+            self.waiting_writers -= 1
+            self.writer = True
+
+    def release_write(self) -> None:
+        with self.condition:
+            self.writer = False
+            self.condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentList:
+    # Wraps any list of this package so it can be shared between threads:
+    # reads run in parallel under the read lock, writes run alone. Cursors,
+    # cycle() and slice views are not offered, since they would outlive the
+    # lock; slicing returns a list of the elements instead.
+    def __init__(self, lst):
+        self.list = lst
+        self.lock = RWLock()
+
+    def __getattr__(self, name: str):
+        if name in READ_METHODS:
+            guard = self.lock.read
+        elif name in WRITE_METHODS:
+            guard = self.lock.write
+        else:
+            raise AttributeError(name)
+        method = getattr(self.list, name)
+
+        def locked(*args, **kwargs):
+            with guard():
+                return method(*args, **kwargs)
+
+        return locked
+
+    def __len__(self) -> int:
+        with self.lock.read():
+            return self.list.length()
+
+    def __iter__(self):
+        # Iterates over a snapshot, so the lock is not held between items.
+        with self.lock.read():
+            lst = self.list
+            if hasattr(lst, '_text'):
+                return iter(lst._text())
+            return iter([lst.get(i) for i in range(lst.length())])
+
+    def __getitem__(self, key):
+        with self.lock.read():
+            result = self.list[key]
+            return list(result) if isinstance(key, slice) else result
+
+    def __setitem__(self, key, value) -> None:
+        with self.lock.write():
+            self.list[key] = value
+
+    def __delitem__(self, key) -> None:
+        with self.lock.write():
+            del self.list[key]
+
+    def batch(self) -> edits.Batch:
+        # The collected script is applied by one locked apply_edits() call.
+        return edits.Batch(self)
+
+    async def aextend(self, elements, batch_size: int = streaming.BATCH_SIZE) -> None:
+        # Each batch takes the write lock on its own, so readers in other
+        # threads are not held off for the whole stream.
+        await streaming.aextend(self, elements, batch_size)
+
+    def clone(self) -> 'ConcurrentList':
+        with self.lock.write():
+            return ConcurrentList(self.list.clone())
+
+    def extend(self, other) -> None:
+        if isinstance(other, ConcurrentList) and other is not self:
+            other = other.clone().list
+        with self.lock.write():
+            self.list.extend(self.list if other is self else other)
+
+
+class LockedNode:
+    __slots__ = ('data', 'next', 'lock')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.lock = threading.Lock()
+
+
+class ConcurrentCircularList:
+    # A circular list with a lock per node. Operations walk the ring hand
+    # over hand: the next node is locked before the current one is released,
+    # so writers only block each other where their paths overlap and a
+    # writer deep in the list does not stop one working near the front.
+    #
+    # The ring runs through a sentinel node that is always locked first, so
+    # locks are taken in ring order and cannot deadlock. `tail` is the node
+    # whose next is the sentinel; it only changes while that node is locked.
+    # Unlinked nodes get next = None, which tells append() to retry.
+    def __init__(self):
+        self.sentinel = LockedNode(None)
+        self.sentinel.next = self.sentinel
+        self.tail = self.sentinel
+        self.size = 0
+        self.size_lock = threading.Lock()
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _validate_characters(self, elements) -> str:
+        if isinstance(elements, str):
+            return elements
+        elements = list(elements)
+        if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+            raise ValueError("Elements must be single characters")
+        return ''.join(elements)
+
+    def _resize(self, delta: int) -> None:
+        with self.size_lock:
+            self.size += delta
+
+    def _walk(self, steps: int):
+        # Returns the node `steps` positions after the sentinel, locked, or
+        # None with nothing locked if the ring is shorter than that.
+        node = self.sentinel
+        node.lock.acquire()
+        for _ in range(steps):
+            following = node.next
+            if following is self.sentinel:
+                node.lock.release()
+                return None
+            following.lock.acquire()
+            node.lock.release()
+            node = following
+        return node
+
+    @contextmanager
+    def _whole_ring(self):
+        # Holds the sentinel and the last node, locked. Every operation but
+        # append starts at the sentinel and append needs the last node, so
+        # nothing else runs inside the block; operations already under way
+        # further along the ring finish before the walk passes them.
+        sentinel = self.sentinel
+        sentinel.lock.acquire()
+        last = sentinel
+        try:
+            while last.next is not sentinel:
+                following = last.next
+                following.lock.acquire()
+                if last is not sentinel:
+                    last.lock.release()
+                last = following
+            yield last
+        finally:
+            if last is not sentinel:
+                last.lock.release()
+            sentinel.lock.release()
+
+    def _text(self) -> str:
+        # A consistent snapshot of the whole ring.
+        with self._whole_ring():
+            elements = []
+            node = self.sentinel.next
+            while node is not self.sentinel:
+                elements.append(node.data)
+                node = node.next
+            return ''.join(elements)
+
+    def _nodes(self):
+        # Yields every node hand over hand; the yielded node is locked while
+        # the caller looks at it.
+        node = self.sentinel
+        node.lock.acquire()
+        try:
+            while node.next is not self.sentinel:
+                following = node.next
+                following.lock.acquire()
+                node.lock.release()
+                node = following
+                yield node
+        finally:
+            node.lock.release()
+
+    def _link_after(self, prev: LockedNode, first: LockedNode, last: LockedNode) -> None:
+        # prev must be locked.
+        last.next = prev.next
+        prev.next = first
+        if last.next is self.sentinel:
+            self.tail = last
+
+    def _chain(self, text: str):
+        first = last = LockedNode(text[0])
+        for char in text[1:]:
+            last.next = LockedNode(char)
+            last = last.next
+        return first, last
+
+    def append(self, element: str) -> None:
+        self._validate_character(element)
+        self._append_chain(*self._chain(element), 1)
+
+    def _append_chain(self, first: LockedNode, last: LockedNode, count: int) -> None:
+        while True:
+            tail = self.tail
+            with tail.lock:
+                if tail.next is self.sentinel:
+                    self._link_after(tail, first, last)
+                    break
+        self._resize(count)
+
+    def length(self) -> int:
+        return self.size
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0:
+            raise ValueError("Wrong index value.")
+        prev = self._walk(index)
+        if prev is None:
+            raise ValueError("Wrong index value.")
+        node = LockedNode(element)
+        try:
+            self._link_after(prev, node, node)
+        finally:
+            prev.lock.release()
+        self._resize(1)
+
+    def get(self, index: int) -> str:
+        if index < 0:
+            raise ValueError("Wrong index value.")
+        node = self._walk(index + 1)
+        if node is None:
+            raise ValueError("Wrong index value.")
+        data = node.data
+        node.lock.release()
+        return data
+
+    def delete(self, index: int) -> str:
+        if index < 0:
+            raise ValueError("Wrong index value.")
+        prev = self._walk(index)
+        if prev is None:
+            raise ValueError("Wrong index value.")
+        try:
+            removed = prev.next
+            if removed is self.sentinel:
+                raise ValueError("Wrong index value.")
+            with removed.lock:
+                prev.next = removed.next
+                if removed is self.tail:
+                    self.tail = prev
+                removed.next = None
+        finally:
+            prev.lock.release()
+        self._resize(-1)
+        return removed.data
+
+    def deleteAll(self, element: str) -> None:
+        # One hand-over-hand sweep holding the previous and current node.
+        self._validate_character(element)
+        removed = 0
+        prev = self.sentinel
+        prev.lock.acquire()
+        while prev.next is not self.sentinel:
+            current = prev.next
+            current.lock.acquire()
+            if current.data == element:
+                prev.next = current.next
+                if current is self.tail:
+                    self.tail = prev
+                current.next = None
+                current.lock.release()
+                removed += 1
+            else:
+                prev.lock.release()
+                prev = current
+        prev.lock.release()
+        self._resize(-removed)
+
+    def findFirst(self, element: str) -> int:
+        self._validate_character(element)
+        nodes = self._nodes()
+        for index, node in enumerate(nodes):
+            if node.data == element:
+                nodes.close()
+                return index
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_character(element)
+        found = -1
+        for index, node in enumerate(self._nodes()):
+            if node.data == element:
+                found = index
+        return found
+
+    def count(self, element: str) -> int:
+        self._validate_character(element)
+        return sum(1 for node in self._nodes() if node.data == element)
+
+    def findSubsequence(self, pattern) -> int:
+        return self._text().find(self._validate_characters(pattern))
+
+    def extend_from(self, elements) -> None:
+        # The new nodes are linked to each other first and spliced in with a
+        # single locked step at the tail.
+        text = self._validate_characters(elements)
+        if text:
+            self._append_chain(*self._chain(text), len(text))
+
+    def clear(self) -> None:
+        with self._whole_ring() as last:
+            if last is not self.sentinel:
+                # An append waiting on the old last node sees it unlinked
+                # and retries.
+                last.next = None
+            self.sentinel.next = self.sentinel
+            self.tail = self.sentinel
+            with self.size_lock:
+                self.size = 0
+
+    def clone(self) -> 'ConcurrentCircularList':
+        cloned = ConcurrentCircularList()
+        cloned.extend_from(self._text())
+        return cloned
+
+    def reverse(self) -> None:
+        # Relinks every node in place. An append waiting on the old last
+        # node finds it no longer at the end and retries.
+        with self._whole_ring():
+            sentinel = self.sentinel
+            first = sentinel.next
+            prev, node = sentinel, first
+            while node is not sentinel:
+                node.next, prev, node = prev, node, node.next
+            sentinel.next = prev
+            self.tail = first
+
+    def extend(self, other) -> None:
+        # other is read in full first, so it may be this list.
+        self.extend_from(other._text())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        # A consistent snapshot would need the whole ring locked; this one is
+        # taken hand over hand, like every other traversal.
+        return iter([node.data for node in self._nodes()])
@@ -0,0 +1,399 @@
+BLOCK_SIZE = 32
+
+
+class Block:
+    __slots__ = ('text', 'next')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.next = None
+
+
+class UnrolledCursor:
+    # Same interface as circular.Cursor. Positions are tracked by index, so
+    # each step locates its block in O(n / BLOCK_SIZE).
+    def __init__(self, owner: 'UnrolledCircularList', index: int = 0):
+        self.owner = owner
+        self.index = index
+
+    def peek(self) -> str:
+        if not self.owner.size:
+            raise ValueError("List is empty")
+        return self.owner.get(self.index)
+
+    def next(self) -> str:
+        data = self.peek()
+        self.index = (self.index + 1) % self.owner.size
+        return data
+
+    def insert_after(self, element: str) -> None:
+        if not self.owner.size:
+            self.owner.append(element)
+            self.index = 0
+            return
+        self.owner.insert(element, self.index + 1)
+
+    def remove(self) -> str:
+        if not self.owner.size:
+            raise ValueError("List is empty")
+        data = self.owner.delete(self.index)
+        if self.index >= self.owner.size:
+            self.index = 0
+        return data
+
+
+class UnrolledCircularList:
+    def __init__(self):
+        # A ring of blocks, each holding up to BLOCK_SIZE characters as a
+        # string. Like CircularLinkedList it is anchored at its last block.
+        self.tail = None
+        self.size = 0
+        self.blocks = 0
+
+    @property
+    def head(self):
+        if not self.tail:
+            return None
+        return self.tail.next
+
+    def _validate_character(self, element: str) -> None:
+        if not isinstance(element, str):
+            raise ValueError("Element must be a string")
+        if len(element) != 1:
+            raise ValueError("Element must be a single character")
+
+    def _validate_characters(self, elements) -> str:
+        # Validates a whole batch at once and returns it as a string. A str
+        # is already a sequence of single characters, so it needs no scan.
+        if isinstance(elements, str):
+            return elements
+        elements = list(elements)
+        if not all(isinstance(element, str) and len(element) == 1 for element in elements):
+            raise ValueError("Elements must be single characters")
+        return ''.join(elements)
+
+    def _search_bounds(self, start: int, stop) -> tuple:
+        # Search bounds follow str.find: negative values count from the end
+        # and out-of-range values are clamped rather than rejected.
+        start, stop, _ = slice(start, stop).indices(self.size)
+        return start, stop
+
+    def _blocks(self):
+        if not self.tail:
+            return
+        block = self.tail.next
+        for _ in range(self.blocks):
+            yield block
+            block = block.next
+
+    def _text(self) -> str:
+        return ''.join(block.text for block in self._blocks())
+
+    def _locate(self, index: int):
+        # Returns (prev, block, offset) for the element at `index`. The tail
+        # block is found without walking, in which case prev is None.
+        tail_start = self.size - len(self.tail.text)
+        if index >= tail_start:
+            return None, self.tail, index - tail_start
+        prev = self.tail
+        block = self.tail.next
+        while index >= len(block.text):
+            index -= len(block.text)
+            prev = block
+            block = block.next
+        return prev, block, index
+
+    def _block_before(self, target: Block) -> Block:
+        prev = self.tail
+        while prev.next is not target:
+            prev = prev.next
+        return prev
+
+    def _link_after(self, block: Block, text: str) -> Block:
+        # Chops text into full blocks linked after `block`; returns the last.
+        for start in range(0, len(text), BLOCK_SIZE):
+            new_block = Block(text[start:start + BLOCK_SIZE])
+            if block is None:
+                new_block.next = new_block
+            else:
+                new_block.next = block.next
+                block.next = new_block
+            block = new_block
+            self.blocks += 1
+        return block
+
+    def _extend_text(self, text: str) -> None:
+        if not text:
+            return
+        if self.tail and len(self.tail.text) < BLOCK_SIZE:
+            room = BLOCK_SIZE - len(self.tail.text)
+            self.tail.text += text[:room]
+            self.size += len(text[:room])
+            text = text[room:]
+        if text:
+            self.tail = self._link_after(self.tail, text)
+            self.size += len(text)
+
+    def _unlink(self, prev, block: Block) -> None:
+        if self.blocks == 1:
+            self.tail = None
+            self.blocks = 0
+            return
+        if prev is None:
+            prev = self._block_before(block)
+        prev.next = block.next
+        block.next = None
+        if block is self.tail:
+            self.tail = prev
+        self.blocks -= 1
+
+    def _merge(self, first: Block) -> None:
+        # Joins first with its successor, or evens them out if both are too
+        # big to share one block.
+        second = first.next
+        combined = first.text + second.text
+        if len(combined) <= BLOCK_SIZE:
+            first.text = combined
+            self._unlink(first, second)
+        else:
+            half = len(combined) // 2
+            first.text = combined[:half]
+            second.text = combined[half:]
+
+    def _rebalance(self, prev, block: Block) -> None:
+        if not block.text:
+            self._unlink(prev, block)
+        elif len(block.text) < BLOCK_SIZE // 4 and self.blocks > 1:
+            if block is not self.tail:
+                self._merge(block)
+            else:
+                self._merge(prev if prev is not None else self._block_before(block))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for block in self._blocks():
+            yield from block.text
+
+    def __reversed__(self):
+        return iter(self._text()[::-1])
+
+    def append(self, element: str) -> None:
+        self._validate_character(element)
+        self._extend_text(element)
+
+    def length(self) -> int:
+        return self.size
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_character(element)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+        if index == self.size:
+            self._extend_text(element)
+            return
+
+        _, block, offset = self._locate(index)
+        text = block.text[:offset] + element + block.text[offset:]
+        if len(text) <= BLOCK_SIZE:
+            block.text = text
+        else:
+            half = len(text) // 2
+            block.text = text[:half]
+            new_block = self._link_after(block, text[half:])
+            if block is self.tail:
+                self.tail = new_block
+        self.size += 1
+
+    def get(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+        _, block, offset = self._locate(index)
+        return block.text[offset]
+
+    def delete(self, index: int) -> str:
+        if index < 0 or index >= self.size:
+            raise ValueError("Wrong index value.")
+        prev, block, offset = self._locate(index)
+        data = block.text[offset]
+        block.text = block.text[:offset] + block.text[offset + 1:]
+        self.size -= 1
+        self._rebalance(prev, block)
+        return data
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_character(element)
+        text = ''.join(block.text.replace(element, '') for block in self._blocks())
+        if len(text) != self.size:
+            self.clear()
+            self._extend_text(text)
+
+    def clone(self) -> 'UnrolledCircularList':
+        # Block texts are immutable strings, so the copy can share them.
+        cloned = UnrolledCircularList()
+        last = None
+        for block in self._blocks():
+            new_block = Block(block.text)
+            if last is None:
+                new_block.next = new_block
+            else:
+                new_block.next = last.next
+                last.next = new_block
+            last = new_block
+        cloned.tail = last
+        cloned.size = self.size
+        cloned.blocks = self.blocks
+        return cloned
+
+    def reverse(self) -> None:
+        if not self.tail:
+            return
+        old_head = self.tail.next
+        prev = self.tail
+        block = old_head
+        for _ in range(self.blocks):
+            next_block = block.next
+            block.next = prev
+            block.text = block.text[::-1]
+            prev = block
+            block = next_block
+        self.tail = old_head
+
+    def findFirst(self, element: str, start: int = 0, stop: int = None) -> int:
+        self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        offset = 0
+        for block in self._blocks():
+            if offset >= stop:
+                break
+            end = offset + len(block.text)
+            if end > start:
+                # str.find reads negative bounds as counting from the end.
+                position = block.text.find(element, max(start - offset, 0), min(stop - offset, len(block.text)))
+                if position != -1:
+                    return offset + position
+            offset = end
+        return -1
+
+    def findLast(self, element: str, start: int = 0, stop: int = None) -> int:
+        self._validate_character(element)
+        start, stop = self._search_bounds(start, stop)
+        # Blocks only link forwards: one walk up to stop, keeping the last
+        # hit of each block in range.
+        found = -1
+        offset = 0
+        for block in self._blocks():
+            if offset >= stop:
+                break
+            end = offset + len(block.text)
+            if end > start:
+                position = block.text.rfind(element, max(start - offset, 0), min(stop - offset, len(block.text)))
+                if position != -1:
+                    found = offset + position
+            offset = end
+        return found
+
+    def count(self, element: str) -> int:
+        self._validate_character(element)
+        return sum(block.text.count(element) for block in self._blocks())
+
+    def findSubsequence(self, pattern) -> int:
+        text = self._validate_characters(pattern)
+        return self._text().find(text)
+
+    def cursor(self, index: int = 0) -> UnrolledCursor:
+        if index < 0 or index >= max(self.size, 1):
+            raise ValueError("Wrong index value.")
+        return UnrolledCursor(self, index)
+
+    def cycle(self):
+        block = self.head
+        while self.tail:
+            yield from block.text
+            block = block.next
+
+    def clear(self) -> None:
+        if self.tail:
+            self.tail.next = None
+        self.tail = None
+        self.size = 0
+        self.blocks = 0
+
+    def extend(self, elements: 'UnrolledCircularList') -> None:
+        self._extend_text(elements._text())
+
+    def extend_from(self, elements) -> None:
+        self._extend_text(self._validate_characters(elements))
+
+    def insert_many(self, index: int, elements) -> None:
+        text = self._validate_characters(elements)
+        if index < 0 or index > self.size:
+            raise ValueError("Wrong index value.")
+        if index == self.size:
+            self._extend_text(text)
+            return
+        if not text:
+            return
+
+        _, block, offset = self._locate(index)
+        combined = block.text[:offset] + text + block.text[offset:]
+        block.text = combined[:BLOCK_SIZE]
+        last = self._link_after(block, combined[BLOCK_SIZE:])
+        if block is self.tail:
+            self.tail = last
+        self.size += len(text)
+
+    def delete_range(self, start: int, stop: int) -> None:
+        if start < 0 or stop < start or stop > self.size:
+            raise ValueError("Wrong index value.")
+        if start == stop:
+            return
+        if stop - start == self.size:
+            self.clear()
+            return
+
+        prev, block, offset = self._locate(start)
+        if prev is None:
+            prev = self._block_before(block)
+        remaining = stop - start
+        self.size -= remaining
+        while remaining:
+            taken = min(remaining, len(block.text) - offset)
+            block.text = block.text[:offset] + block.text[offset + taken:]
+            remaining -= taken
+            following = block.next
+            if block.text:
+                prev = block
+            else:
+                self._unlink(prev, block)
+            block = following
+            offset = 0
+        self._rebalance(None, prev)
+
+
+if __name__ == '__main__':
+    import time
+    from linked_lists.circular import CircularLinkedList
+
+    size = 1_000_000
+    text = ''.join(chr(ord('a') + i % 26) for i in range(size)) + '!'
+    unrolled = UnrolledCircularList()
+    unrolled.extend_from(text)
+    circular = CircularLinkedList()
+    circular.extend_from(text)
+    print(f"{size + 1} elements: {unrolled.blocks} blocks vs {circular.length()} nodes")
+
+    for name, operation in (("iterate", lambda lst: sum(1 for _ in lst)),
+                            ("findFirst", lambda lst: lst.findFirst('!')),
+                            ("findLast", lambda lst: lst.findLast('a')),
+                            ("get(middle)", lambda lst: lst.get(size // 2)),
+                            ("reverse", lambda lst: lst.reverse()),
+                            ("clone", lambda lst: lst.clone())):
+        timings = []
+        for lst in (circular, unrolled):
+            start = time.perf_counter()
+            operation(lst)
+            timings.append(time.perf_counter() - start)
+        print(f"{name:>12}: circular {timings[0]:.4f}s, unrolled {timings[1]:.4f}s, "
+              f"{timings[0] / max(timings[1], 1e-9):.1f}x")
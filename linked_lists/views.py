@@ -0,0 +1,135 @@
+import operator
+from operator import countOf
+
+
+def positions(key, length: int) -> range:
+    # Positions addressed by an index or a slice. Negative indices count
+    # from the end, as for built-in sequences; a single index must exist.
+    if isinstance(key, slice):
+        addressed = range(length)[key]
+        if addressed.step == 1 and addressed.stop < addressed.start:
+            # lst[5:2] is the empty range at 5, where an assignment inserts.
+            addressed = range(addressed.start, addressed.start)
+        return addressed
+    index = operator.index(key)
+    if index < 0:
+        index += length
+    if index < 0 or index >= length:
+        raise ValueError("Wrong index value.")
+    return range(index, index + 1)
+
+
+def assign(lst, key, value) -> None:
+    # lst[key] = value as a single bulk edit. The new characters are read
+    # before anything changes, so the value may be a view of lst itself.
+    addressed = positions(key, lst.length())
+    if isinstance(key, slice):
+        text = lst._validate_characters(value)
+    else:
+        lst._validate_character(value)
+        text = value
+    if addressed.step == 1:
+        ops = [('delete', index) for index in addressed]
+        ops += [('insert', char, addressed.start) for char in text]
+    else:
+        if len(text) != len(addressed):
+            raise ValueError(f"Cannot assign {len(text)} elements to an extended slice of {len(addressed)}")
+        ops = []
+        for index, char in zip(addressed, text):
+            ops.append(('insert', char, index))
+            ops.append(('delete', index))
+    lst.apply_edits(ops)
+
+
+def delete(lst, key) -> None:
+    # del lst[key]; contiguous ranges are a single delete_range().
+    addressed = positions(key, lst.length())
+    if not addressed:
+        return
+    if addressed.step < 0:
+        addressed = addressed[::-1]
+    if addressed.step == 1 or len(addressed) < 2:
+        lst.delete_range(addressed.start, addressed.start + len(addressed))
+    else:
+        lst.apply_edits([('delete', index) for index in addressed])
+
+
+class ListView:
+    # A read-only window onto range(start, stop, step) of an ArrayBasedList
+    # or CircularLinkedList. Nothing is copied: reads go to the parent's
+    # storage. Every mutation of the parent bumps its version, after which
+    # the view raises instead of returning stale data.
+    def __init__(self, parent, addressed: range):
+        self.parent = parent
+        self.positions = addressed
+        self.version = parent.version
+
+    def _check(self) -> None:
+        if self.parent.version != self.version:
+            raise ValueError("The list has changed since the view was taken")
+
+    def _data(self):
+        # The version is checked before every step of the parent's iterator:
+        # resuming it after a mutation could read freed or moved storage.
+        self._check()
+        elements = self.parent._range_data(self.positions)
+        while True:
+            self._check()
+            try:
+                element = next(elements)
+            except StopIteration:
+                return
+            yield element
+
+    def _text(self) -> str:
+        return ''.join(self._data())
+
+    def length(self) -> int:
+        self._check()
+        return len(self.positions)
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def get(self, index: int) -> str:
+        self._check()
+        if index < 0 or index >= len(self.positions):
+            raise ValueError("Wrong index value.")
+        return self.parent.get(self.positions[index])
+
+    def __getitem__(self, key):
+        self._check()
+        if isinstance(key, slice):
+            return ListView(self.parent, self.positions[key])
+        return self.parent.get(self.positions[positions(key, len(self.positions)).start])
+
+    def __iter__(self):
+        return self._data()
+
+    def findFirst(self, element: str) -> int:
+        self.parent._validate_character(element)
+        self._check()
+        if self.positions.step == 1:
+            # Contiguous views use the parent's bounded search.
+            position = self.parent.findFirst(element, self.positions.start, self.positions.stop)
+            return position - self.positions.start if position != -1 else -1
+        for index, item in enumerate(self._data()):
+            if item == element:
+                return index
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self.parent._validate_character(element)
+        self._check()
+        if self.positions.step == 1:
+            position = self.parent.findLast(element, self.positions.start, self.positions.stop)
+            return position - self.positions.start if position != -1 else -1
+        return self._text().rfind(element)
+
+    def count(self, element: str) -> int:
+        self.parent._validate_character(element)
+        return countOf(self._data(), element)
+
+    def findSubsequence(self, pattern) -> int:
+        text = self.parent._validate_characters(pattern)
+        return self._text().find(text)
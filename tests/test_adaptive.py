@@ -0,0 +1,134 @@
+import random
+import sys
+import threading
+import unittest
+
+from linked_lists import adaptive
+from linked_lists.adaptive import AdaptiveList
+from linked_lists.threadsafe import ConcurrentList
+
+
+class TestAdaptiveList(unittest.TestCase):
+    def setUp(self):
+        self.list = AdaptiveList()
+        self.list.extend_from("ABCDE")
+
+    def contents(self, lst):
+        return ''.join(lst.get(i) for i in range(lst.length()))
+
+    def head_edits(self, lst, rounds):
+        for _ in range(rounds):
+            lst.insert('x', 0)
+            lst.delete(0)
+
+    def test_api_on_every_backend(self):
+        for backend in adaptive.BACKENDS:
+            lst = AdaptiveList(backend)
+            lst.extend_from("ABCDE")
+            lst.append('B')
+            lst.insert('Z', 2)
+            self.assertEqual(lst.delete(0), 'A')
+            self.assertEqual(self.contents(lst), "BZCDEB")
+            self.assertEqual(lst.findFirst('B'), 0)
+            self.assertEqual(lst.findLast('B'), 5)
+            lst.deleteAll('B')
+            clone = lst.clone()
+            lst.reverse()
+            self.assertEqual(''.join(lst), "EDCZ")
+            self.assertEqual(''.join(clone), "ZCDE")
+            lst.extend(clone)
+            self.assertEqual(len(lst), 8)
+            lst.clear()
+            self.assertEqual(lst.length(), 0)
+            with self.assertRaises(ValueError):
+                lst.get(0)
+
+    def test_head_edits_move_to_circular(self):
+        self.list.extend_from("ab" * 5000)
+        self.head_edits(self.list, adaptive.REVIEW_INTERVAL)
+        self.assertEqual(self.list.backend, 'circular')
+        self.assertEqual(self.contents(self.list)[:7], "ABCDEab")
+
+    def test_random_reads_move_off_circular(self):
+        lst = AdaptiveList('circular')
+        lst.extend_from("ab" * 5000)
+        rng = random.Random(1)
+        for _ in range(adaptive.REVIEW_INTERVAL):
+            lst.get(rng.randrange(lst.length()))
+        self.assertIn(lst.backend, ('array', 'indexed'))
+
+    def test_searches_move_to_indexed(self):
+        self.list.extend_from("ab" * 5000)
+        for _ in range(adaptive.REVIEW_INTERVAL):
+            self.list.findFirst('z')
+        self.assertEqual(self.list.backend, 'indexed')
+        self.assertEqual(self.list.findLast('E'), 4)
+
+    def test_small_lists_do_not_migrate(self):
+        # Head edits on five elements cost about the same everywhere.
+        self.head_edits(self.list, 4 * adaptive.REVIEW_INTERVAL)
+        self.assertEqual(self.list.stats()['migrations'], [])
+
+    def test_mixed_workload_does_not_thrash(self):
+        self.list.extend_from("a" * 10000)
+        rng = random.Random(2)
+        for step in range(8 * adaptive.REVIEW_INTERVAL):
+            if step % 2:
+                self.list.get(rng.randrange(self.list.length()))
+            else:
+                self.list.insert('x', 0)
+                self.list.delete(0)
+        self.assertLessEqual(len(self.list.stats()['migrations']), 1)
+
+    def test_candidates_limit_migrations(self):
+        lst = AdaptiveList('array', candidates=['array', 'rope'])
+        lst.extend_from("ab" * 5000)
+        self.head_edits(lst, adaptive.REVIEW_INTERVAL)
+        self.assertNotEqual(lst.backend, 'circular')
+        with self.assertRaises(ValueError):
+            AdaptiveList('vector')
+        with self.assertRaises(ValueError):
+            AdaptiveList(candidates=['array', 'vector'])
+
+    def test_concurrent_readers_keep_reviewing(self):
+        inner = AdaptiveList('circular')
+        inner.extend_from("ab" * 5000)
+        lst = ConcurrentList(inner)
+
+        def reader(seed):
+            rng = random.Random(seed)
+            for _ in range(adaptive.REVIEW_INTERVAL):
+                lst.get(rng.randrange(10000))
+
+        threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        stats = inner.stats()
+        self.assertEqual(stats['operations'], 4 * adaptive.REVIEW_INTERVAL)
+        self.assertEqual(inner.countdown, adaptive.REVIEW_INTERVAL)
+        self.assertIn(stats['backend'], ('array', 'indexed'))
+        self.assertEqual(''.join(lst)[:4], "abab")
+
+    def test_stats(self):
+        self.list.extend_from("ab" * 5000)
+        self.head_edits(self.list, adaptive.REVIEW_INTERVAL)
+        stats = self.list.stats()
+        self.assertEqual(stats['backend'], 'circular')
+        self.assertEqual(stats['operations'], 2 * adaptive.REVIEW_INTERVAL)
+        self.assertEqual(stats['size'], 10005)
+        migration, = stats['migrations']
+        self.assertEqual((migration['from'], migration['to']), ('array', 'circular'))
+        self.assertEqual(migration['operation'], adaptive.REVIEW_INTERVAL)
+        self.assertLess(migration['estimates']['circular'], migration['estimates']['array'])
+        self.assertEqual(set(stats['estimates']), set(adaptive.BACKENDS))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,3 +1,7 @@
+import os
+import random
+import tempfile
+import tracemalloc
 import unittest
 from linked_lists.array_based import ArrayBasedList
 
@@ -91,6 +95,128 @@ class TestArrayBasedList(unittest.TestCase):
         empty_clone = empty_list.clone()
         self.assertEqual(empty_clone.length(), 0)
     
+    def test_clone_shares_storage_until_written(self):
+        clone = self.list.clone()
+        self.assertIs(clone.items, self.list.items)
+        clone.append('F')
+        self.assertIsNot(clone.items, self.list.items)
+        self.assertEqual(self.contents(clone), "ABCDEF")
+        self.assertEqual(self.contents(self.list), "ABCDE")
+    
+    def test_clones_stay_independent(self):
+        first = self.list.clone()
+        second = self.list.clone()
+        self.list.delete(0)
+        first.reverse()
+        second.deleteAll('C')
+        second.insert_many(0, "XY")
+        self.assertEqual(self.contents(self.list), "BCDE")
+        self.assertEqual(self.contents(first), "EDCBA")
+        self.assertEqual(self.contents(second), "XYABDE")
+        self.assertEqual(self.list.findFirst('E'), 3)
+        self.assertEqual(first.findFirst('E'), 0)
+        self.assertEqual(second.findLast('A'), 2)
+    
+    def test_clone_of_clone_and_clear(self):
+        clone = self.list.clone().clone()
+        self.list.clear()
+        self.assertEqual(self.contents(clone), "ABCDE")
+        clone.clear()
+        clone.append('Q')
+        self.assertEqual(self.contents(clone), "Q")
+        self.assertEqual(self.list.length(), 0)
+    
+    def test_snapshots_do_not_copy(self):
+        self.list.extend_from('a' * 10000)
+        snapshots = []
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(1000):
+                snapshots.append(self.list.clone())
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Copying would cost at least 10 MB; sharing costs a few hundred
+        # bytes per snapshot.
+        self.assertLess(after - before, 1_000_000)
+        self.list.append('b')
+        self.assertEqual(snapshots[0].length(), 10005)
+    
+    def test_snapshot_round_trip(self):
+        self.list.insert_many(2, "\u0416\U0001F600")
+        self.list.reverse()
+        data = self.list.to_bytes()
+        restored = ArrayBasedList.from_bytes(data, self.list.compact, self.list.indexed)
+        self.assertEqual(self.contents(restored), self.contents(self.list))
+        self.assertEqual(restored.findFirst('A'), 6)
+        self.assertEqual(restored.compact, self.list.compact)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'list.chrl')
+            self.list.save(path, checksum=False)
+            loaded = ArrayBasedList.load(path, self.list.compact, self.list.indexed)
+        self.assertEqual(self.contents(loaded), "EDC\U0001F600\u0416BA")
+        empty = ArrayBasedList.from_bytes(ArrayBasedList().to_bytes())
+        self.assertEqual(empty.length(), 0)
+    
+    def test_reverse_leaves_storage_alone(self):
+        items = self.list.items
+        snapshot = items[:]
+        clone = self.list.clone()
+        clone.reverse()
+        self.assertIs(clone.items, items)
+        self.assertEqual(items, snapshot)
+        self.assertEqual(self.contents(clone), "EDCBA")
+        clone.append('F')
+        self.assertEqual(self.contents(clone), "EDCBAF")
+        self.assertEqual(self.contents(self.list), "ABCDE")
+    
+    def test_lazy_reverse_matches_python_list(self):
+        rng = random.Random(15)
+        lst = self.list.clone()
+        lst.clear()
+        expected = []
+        for step in range(600):
+            action = rng.random()
+            char = "ABCDE"[step % 5]
+            if action < 0.1:
+                lst.reverse()
+                expected.reverse()
+            elif action < 0.35:
+                index = rng.randint(0, len(expected))
+                lst.insert(char, index)
+                expected.insert(index, char)
+            elif action < 0.45:
+                lst.append(char)
+                expected.append(char)
+            elif action < 0.6 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(lst.delete(index), expected.pop(index))
+            elif action < 0.7:
+                index = rng.randint(0, len(expected))
+                lst.insert_many(index, "xyz")
+                expected[index:index] = "xyz"
+            elif action < 0.75:
+                start = rng.randint(0, len(expected))
+                stop = rng.randint(start, min(start + 4, len(expected)))
+                lst.delete_range(start, stop)
+                del expected[start:stop]
+            elif action < 0.8:
+                lst.deleteAll('x')
+                expected = [item for item in expected if item != 'x']
+            else:
+                text = ''.join(expected)
+                start = rng.randint(0, len(expected))
+                self.assertEqual(lst.findFirst(char, start), text.find(char, start))
+                self.assertEqual(lst.findLast(char, 0, start), text.rfind(char, 0, start))
+                self.assertEqual(lst.findSubsequence("yzA"), text.find("yzA"))
+        self.assertEqual([lst.get(i) for i in range(lst.length())], expected)
+        self.assertEqual(lst.count('A'), expected.count('A'))
+        clone = lst.clone()
+        clone.reverse()
+        clone.extend(lst)
+        self.assertEqual(list(self.contents(clone)), expected[::-1] + expected)
+    
     def test_reverse(self):
         original = [self.list.get(i) for i in range(self.list.length())]
         self.list.reverse()
@@ -220,6 +346,408 @@ class TestArrayBasedList(unittest.TestCase):
         self.assertEqual(test_list.findFirst('A'), -1)
         self.assertEqual(test_list.length(), 3)
 
+    def contents(self, lst):
+        return ''.join(lst.get(i) for i in range(lst.length()))
+
+    def test_extend_from(self):
+        self.list.extend_from("XYZ")
+        self.list.extend_from(['1', '2'])
+        self.list.extend_from(iter("!"))
+        self.list.extend_from("")
+        self.assertEqual(self.contents(self.list), "ABCDEXYZ12!")
+
+        empty_list = ArrayBasedList()
+        empty_list.extend_from("QR")
+        self.assertEqual(self.contents(empty_list), "QR")
+
+    def test_insert_many(self):
+        self.list.insert_many(0, "12")
+        self.list.insert_many(4, ['x', 'y'])
+        self.list.insert_many(self.list.length(), "!")
+        self.assertEqual(self.contents(self.list), "12ABxyCDE!")
+
+        with self.assertRaises(ValueError):
+            self.list.insert_many(-1, "Q")
+        with self.assertRaises(ValueError):
+            self.list.insert_many(100, "Q")
+
+    def test_delete_range(self):
+        self.list.delete_range(1, 3)
+        self.assertEqual(self.contents(self.list), "ADE")
+        self.list.delete_range(2, 3)
+        self.assertEqual(self.contents(self.list), "AD")
+        self.list.delete_range(1, 1)
+        self.assertEqual(self.contents(self.list), "AD")
+        self.list.append('F')
+        self.assertEqual(self.contents(self.list), "ADF")
+        self.list.delete_range(0, 3)
+        self.assertEqual(self.list.length(), 0)
+
+        with self.assertRaises(ValueError):
+            self.list.delete_range(-1, 0)
+        with self.assertRaises(ValueError):
+            self.list.delete_range(1, 0)
+        with self.assertRaises(ValueError):
+            self.list.delete_range(0, 1)
+
+    def test_bulk_validation_rejects_whole_batch(self):
+        for bad in (['X', 'YZ'], ['X', 1], ['X', '']):
+            with self.assertRaises(ValueError):
+                self.list.extend_from(bad)
+            with self.assertRaises(ValueError):
+                self.list.insert_many(0, bad)
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_find_with_bounds(self):
+        self.list.extend_from("ABCDE")
+        self.assertEqual(self.list.findFirst('B', 2), 6)
+        self.assertEqual(self.list.findFirst('B', 2, 6), -1)
+        self.assertEqual(self.list.findFirst('E', -1), 9)
+        self.assertEqual(self.list.findLast('B', 0, 6), 1)
+        self.assertEqual(self.list.findLast('A', 1), 5)
+        self.assertEqual(self.list.findLast('E', 0, -1), 4)
+        self.assertEqual(self.list.findFirst('A', 100), -1)
+        self.assertEqual(self.list.findLast('A', 6, 3), -1)
+
+    def test_count(self):
+        self.list.extend_from("AAB")
+        self.assertEqual(self.list.count('A'), 3)
+        self.assertEqual(self.list.count('E'), 1)
+        self.assertEqual(self.list.count('Z'), 0)
+        with self.assertRaises(ValueError):
+            self.list.count("AB")
+
+    def test_findSubsequence(self):
+        self.list.extend_from("CDX")
+        self.assertEqual(self.list.findSubsequence("CD"), 2)
+        self.assertEqual(self.list.findSubsequence(['D', 'X']), 6)
+        self.assertEqual(self.list.findSubsequence("DC"), -1)
+        self.assertEqual(self.list.findSubsequence("\u20ac"), -1)
+        self.assertEqual(self.list.findSubsequence(""), 0)
+        with self.assertRaises(ValueError):
+            self.list.findSubsequence(['AB'])
+
+    def test_search_on_large_list(self):
+        large_list = ArrayBasedList()
+        large_list.extend_from("a" * 100000 + "b" + "a" * 100000)
+        self.assertEqual(large_list.findFirst('b'), 100000)
+        self.assertEqual(large_list.findLast('b'), 100000)
+        self.assertEqual(large_list.findLast('a'), 200000)
+        self.assertEqual(large_list.count('a'), 200000)
+        self.assertEqual(large_list.findSubsequence("ab"), 99999)
+
+    def test_slice_views(self):
+        self.list.extend_from("FGH")
+        view = self.list[2:7]
+        self.assertEqual(len(view), 5)
+        self.assertEqual(''.join(view), "CDEFG")
+        self.assertEqual(view.get(1), 'D')
+        self.assertEqual(view[-1], 'G')
+        self.assertEqual(''.join(view[::2]), "CEG")
+        self.assertEqual(''.join(self.list[::-3]), "HEB")
+        self.assertEqual(view.findFirst('E'), 2)
+        self.assertEqual(view.findLast('A'), -1)
+        self.assertEqual(self.list[1::2].findFirst('F'), 2)
+        self.assertEqual(view.count('F'), 1)
+        self.assertEqual(view.findSubsequence("EF"), 2)
+        self.assertEqual(self.list[-1], 'H')
+        self.list.reverse()
+        self.assertEqual(''.join(self.list[1:4]), "GFE")
+        with self.assertRaises(ValueError):
+            self.list[8]
+        with self.assertRaises(ValueError):
+            self.list[1:4].get(3)
+
+    def test_views_detect_mutation(self):
+        view = self.list[1:4]
+        self.list.get(0)
+        self.list.findFirst('A')
+        self.assertEqual(''.join(view), "BCD")
+        self.list.append('F')
+        with self.assertRaises(ValueError):
+            view.get(0)
+        with self.assertRaises(ValueError):
+            list(view)
+        view = self.list[:]
+        self.list.reverse()
+        with self.assertRaises(ValueError):
+            len(view)
+        # Changing a clone leaves the original's views valid.
+        view = self.list[:2]
+        self.list.clone().delete(0)
+        self.assertEqual(''.join(view), "FE")
+
+    def test_views_detect_mutation_during_iteration(self):
+        lst = ArrayBasedList()
+        lst.extend_from("ABCDEFGH")
+        elements = iter(lst[3:6])
+        self.assertEqual(next(elements), 'D')
+        lst.delete_range(0, 6)
+        with self.assertRaises(ValueError):
+            next(elements)
+        lst.extend_from("IJKL")
+        elements = iter(lst[1:4])
+        self.assertEqual(next(elements), 'H')
+        lst.delete(1)
+        with self.assertRaises(ValueError):
+            next(elements)
+
+    def test_slice_assignment(self):
+        self.list[1:3] = "xyz"
+        self.assertEqual(self.contents(self.list), "AxyzDE")
+        self.list[4:2] = "!"
+        self.assertEqual(self.contents(self.list), "Axyz!DE")
+        self.list[::2] = "1234"
+        self.assertEqual(self.contents(self.list), "1x2z3D4")
+        self.list[-1] = 'Q'
+        self.list[0] = 'P'
+        self.assertEqual(self.contents(self.list), "Px2z3DQ")
+        self.list[:] = self.list[::-1]
+        self.assertEqual(self.contents(self.list), "QD3z2xP")
+        for key, value in ((slice(None, None, 2), "ab"), (slice(0, 2), ['a', 'bc']), (3, "ab"), (7, 'a')):
+            with self.assertRaises(ValueError):
+                self.list[key] = value
+        self.assertEqual(self.contents(self.list), "QD3z2xP")
+
+    def test_slice_deletion(self):
+        self.list.extend_from("FGH")
+        del self.list[1:3]
+        self.assertEqual(self.contents(self.list), "ADEFGH")
+        del self.list[::-2]
+        self.assertEqual(self.contents(self.list), "AEG")
+        del self.list[-1]
+        del self.list[5:]
+        self.assertEqual(self.contents(self.list), "AE")
+        with self.assertRaises(ValueError):
+            del self.list[2]
+
+    def test_apply_edits(self):
+        # Indices refer to the list before the script.
+        self.list.apply_edits([('delete', 1), ('insert', 'x', 1), ('insert', 'y', 5),
+                               ('insert', 'z', 1), ('delete', 4), ('insert', 'w', 0)])
+        self.assertEqual(self.contents(self.list), "wAxzCDy")
+        self.list.apply_edits([('delete', i) for i in range(7)] + [('insert', 'Q', 7)])
+        self.assertEqual(self.contents(self.list), "Q")
+        self.list.apply_edits([])
+        self.assertEqual(self.contents(self.list), "Q")
+
+    def test_apply_edits_matches_reference(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            text = ''.join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            ops = []
+            deleted = set()
+            for _ in range(rng.randint(0, 8)):
+                if text and rng.random() < 0.5:
+                    index = rng.randrange(len(text))
+                    if index not in deleted:
+                        deleted.add(index)
+                        ops.append(('delete', index))
+                else:
+                    ops.append(('insert', rng.choice("XYZ"), rng.randint(0, len(text))))
+            expected = []
+            for index in range(len(text) + 1):
+                expected += [op[1] for op in ops if op[0] == 'insert' and op[2] == index]
+                if index < len(text) and index not in deleted:
+                    expected.append(text[index])
+            lst = self.list.clone()
+            lst.clear()
+            lst.extend_from(text[::-1])
+            lst.reverse()
+            lst.apply_edits(ops)
+            self.assertEqual(self.contents(lst), ''.join(expected))
+
+    def test_apply_edits_is_atomic(self):
+        for bad in ([('insert', 'X', 0), ('delete', 5)],
+                    [('delete', 0), ('delete', 0)],
+                    [('delete', 1), ('insert', 'XY', 0)],
+                    [('insert', 'X', 6)],
+                    [('move', 0)]):
+            with self.assertRaises(ValueError):
+                self.list.apply_edits(bad)
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_batch(self):
+        clone = self.list.clone()
+        with self.list.batch() as batch:
+            batch.delete(0)
+            batch.insert('Z', 5)
+            batch.insert('Y', 0)
+            # Nothing changes until the block ends.
+            self.assertEqual(self.contents(self.list), "ABCDE")
+        self.assertEqual(self.contents(self.list), "YBCDEZ")
+        self.assertEqual(self.contents(clone), "ABCDE")
+
+        with self.assertRaises(RuntimeError):
+            with self.list.batch() as batch:
+                batch.delete(0)
+                raise RuntimeError
+        self.assertEqual(self.contents(self.list), "YBCDEZ")
+
+
+class TestCompactArrayBasedList(TestArrayBasedList):
+    def setUp(self):
+        self.list = ArrayBasedList(compact=True)
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def test_latin1_content_uses_one_byte_per_element(self):
+        self.assertIsInstance(self.list.items, bytearray)
+        view = self.list.buffer()
+        self.assertEqual(view.itemsize, 1)
+        self.assertEqual(view.tobytes(), b"ABCDE")
+        view.release()
+
+    def test_wide_character_widens_storage(self):
+        self.list.insert('\u20ac', 1)
+        self.assertNotIsInstance(self.list.items, bytearray)
+        self.assertEqual(self.list.buffer().itemsize, self.list.items.itemsize)
+        self.assertEqual(self.contents(self.list), "A\u20acBCDE")
+        self.assertEqual(self.list.findFirst('\u20ac'), 1)
+        self.assertEqual(self.list.findLast('E'), 5)
+        self.list.deleteAll('\u20ac')
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_non_latin1_lookups_on_byte_storage(self):
+        self.assertEqual(self.list.findFirst('\u20ac'), -1)
+        self.assertEqual(self.list.findLast('\u20ac'), -1)
+        self.list.deleteAll('\u20ac')
+        self.assertEqual(self.list.length(), 5)
+
+    def test_clone_keeps_compact_storage(self):
+        clone = self.list.clone()
+        self.assertTrue(clone.compact)
+        self.assertIsInstance(clone.items, bytearray)
+        clone.append('Z')
+        self.assertEqual(self.list.length(), 5)
+
+    def test_extend_across_storage_kinds(self):
+        wide = ArrayBasedList(compact=True)
+        wide.append('\u0416')
+        plain = ArrayBasedList()
+        plain.append('x')
+
+        self.list.extend(plain)
+        self.assertIsInstance(self.list.items, bytearray)
+        self.list.extend(wide)
+        self.assertEqual(self.contents(self.list), "ABCDEx\u0416")
+
+        plain.extend(self.list)
+        self.assertEqual(self.contents(plain), "xABCDEx\u0416")
+
+    def test_clear_keeps_compact_mode(self):
+        self.list.append('\u0416')
+        self.list.clear()
+        self.assertIsInstance(self.list.items, bytearray)
+
+    def test_search_on_wide_storage(self):
+        self.list.extend_from("\u0416BC\u0416")
+        self.assertEqual(self.list.findFirst('\u0416', 6), 8)
+        self.assertEqual(self.list.findLast('B', 0, 7), 6)
+        self.assertEqual(self.list.count('\u0416'), 2)
+        self.assertEqual(self.list.findSubsequence("E\u0416"), 4)
+
+    def test_bulk_insert_widens_storage(self):
+        self.list.insert_many(2, "\u0416\u0417")
+        self.assertNotIsInstance(self.list.items, bytearray)
+        self.list.extend_from("xy")
+        self.assertEqual(self.contents(self.list), "AB\u0416\u0417CDExy")
+
+    def test_plain_list_has_no_buffer(self):
+        with self.assertRaises(ValueError):
+            ArrayBasedList().buffer()
+
+
+
+class LengthOnly:
+    def __init__(self, length):
+        self.size = length
+
+    def __len__(self):
+        return self.size
+
+
+class TestIndexedArrayBasedList(TestArrayBasedList):
+    def setUp(self):
+        self.list = ArrayBasedList(indexed=True)
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def assertIndexConsistent(self, lst):
+        # Positions follow the physical storage, which is in reverse order
+        # while a reverse() is pending.
+        expected = {}
+        for position in range(lst.length()):
+            expected.setdefault(lst._decode(lst.items[position]), []).append(position)
+        self.assertEqual(lst.positions, expected)
+
+    def test_index_tracks_every_mutation(self):
+        lst = self.list
+        lst.insert('A', 2)
+        lst.delete(0)
+        lst.extend_from("ABBA")
+        lst.insert_many(1, "CAB")
+        lst.delete_range(3, 6)
+        self.assertIndexConsistent(lst)
+        lst.reverse()
+        self.assertIndexConsistent(lst)
+        lst.deleteAll('B')
+        self.assertIndexConsistent(lst)
+        lst.extend(lst)
+        self.assertIndexConsistent(lst)
+        clone = lst.clone()
+        clone.append('Q')
+        self.assertIndexConsistent(clone)
+        self.assertIndexConsistent(lst)
+        lst.clear()
+        self.assertEqual(lst.positions, {})
+
+    def test_lookups_use_the_index(self):
+        self.list.extend_from("ABCDE")
+        # Storage that only knows its length: any scan of it would fail.
+        self.list.items = LengthOnly(self.list.length())
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findFirst('C', 3), 7)
+        self.assertEqual(self.list.findLast('A'), 5)
+        self.assertEqual(self.list.findLast('A', 0, 5), 0)
+        self.assertEqual(self.list.findLast('A', 1, 5), -1)
+        self.assertEqual(self.list.count('E'), 2)
+        self.assertEqual(self.list.count('Z'), 0)
+
+    def test_deleteAll_of_absent_character_is_free(self):
+        items = self.list.items
+        self.list.deleteAll('Z')
+        self.assertIs(self.list.items, items)
+
+    def test_compact_indexed_list(self):
+        lst = ArrayBasedList(compact=True, indexed=True)
+        lst.extend_from("ab\u0416ab")
+        lst.deleteAll('a')
+        self.assertEqual(lst._text(), "b\u0416b")
+        self.assertIndexConsistent(lst)
+        self.assertEqual(lst.findLast('b'), 2)
+
+    def test_failed_growth_leaves_the_index_alone(self):
+        lst = ArrayBasedList(compact=True, indexed=True)
+        lst.extend_from("abc")
+        other = ArrayBasedList(compact=True)
+        other.extend_from("aa")
+        view = lst.buffer()
+        with self.assertRaises(BufferError):
+            lst.append('a')
+        with self.assertRaises(BufferError):
+            lst.extend_from("aa")
+        with self.assertRaises(BufferError):
+            lst.extend(other)
+        self.assertEqual(lst.count('a'), 1)
+        self.assertIndexConsistent(lst)
+        view.release()
+        lst.append('a')
+        lst.extend(lst)
+        self.assertEqual(lst._text(), "abcaabca")
+        self.assertEqual(lst.count('a'), 4)
+        self.assertIndexConsistent(lst)
+
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,83 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from linked_lists import bench
+
+
+class TestBench(unittest.TestCase):
+    def test_run_covers_every_backend_and_operation(self):
+        results = bench.run(sizes=[50, 100], min_time=0, max_calls=2)
+        combinations = {(row['backend'], row['operation']) for row in results}
+        self.assertEqual(len(combinations), len(bench.BACKENDS) * len(bench.OPERATIONS))
+        self.assertTrue(all(row['seconds'] >= 0 and row['calls'] >= 1 for row in results))
+
+    def test_size_changing_operations_are_capped(self):
+        results = bench.run(backends=['array'], operations=['append', 'get'], sizes=[30],
+                            min_time=10, max_calls=100)
+        calls = {row['operation']: row['calls'] for row in results}
+        self.assertEqual(calls, {'append': 3, 'get': 100})
+
+    def test_slow_operations_skip_larger_sizes(self):
+        results = bench.run(backends=['circular'], operations=['get'], sizes=[10, 100],
+                            min_time=0, max_calls=1, max_call_time=0)
+        self.assertEqual([row['size'] for row in results], [10])
+
+    def test_fit_exponents(self):
+        results = [{'backend': 'b', 'operation': 'op', 'size': size, 'seconds': 1e-9 * size ** 2}
+                   for size in (100, 1000, 10000)]
+        results.append({'backend': 'b', 'operation': 'single', 'size': 100, 'seconds': 1.0})
+        exponents = bench.fit_exponents(results)
+        self.assertAlmostEqual(exponents[('b', 'op')], 2.0)
+        self.assertNotIn(('b', 'single'), exponents)
+
+    def test_find_regressions(self):
+        baseline = [{'backend': 'b', 'operation': 'op', 'size': 10, 'seconds': 1.0}]
+        slower = [{'backend': 'b', 'operation': 'op', 'size': 10, 'seconds': 1.3}]
+        self.assertEqual(len(bench.find_regressions(slower, baseline, 0.25)), 1)
+        self.assertEqual(bench.find_regressions(slower, baseline, 0.5), [])
+        other_size = [{'backend': 'b', 'operation': 'op', 'size': 20, 'seconds': 9.0}]
+        self.assertEqual(bench.find_regressions(other_size, baseline, 0.25), [])
+
+    def test_main_writes_reports_and_fails_on_regression(self):
+        arguments = ['--backends', 'array', '--operations', 'get', '--sizes', '10', '100',
+                     '--min-time', '0', '--max-calls', '1']
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, 'results.json')
+            csv_path = os.path.join(directory, 'results.csv')
+            baseline_path = os.path.join(directory, 'baseline.json')
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = bench.main(arguments + ['--json', json_path, '--csv', csv_path])
+            self.assertEqual(status, 0)
+
+            with open(json_path) as handle:
+                results = json.load(handle)
+            with open(csv_path, newline='') as handle:
+                rows = list(csv.DictReader(handle))
+            self.assertEqual(len(results), 2)
+            self.assertEqual([row['size'] for row in rows], ['10', '100'])
+
+            for row in results:
+                row['seconds'] = 1e-12
+            with open(baseline_path, 'w') as handle:
+                json.dump(results, handle)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = bench.main(arguments + ['--baseline', baseline_path])
+            self.assertEqual(status, 1)
+            self.assertIn("REGRESSION array get", output.getvalue())
+
+    def test_ring_throughput(self):
+        self.assertGreater(bench.ring_throughput(maxlen=10, operations=1000), 0)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = bench.main(['--ring', '10'])
+        self.assertEqual(status, 0)
+        self.assertIn("append-evict", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,7 +1,30 @@
+import gc
+import os
+import random
+import tempfile
+import tracemalloc
 import unittest
+from itertools import islice
+from unittest import mock
+
+from linked_lists import circular
+
 from linked_lists.circular import CircularLinkedList
 
 
+class CountingNode(circular.Node):
+    reads = 0
+
+    @property
+    def next(self):
+        CountingNode.reads += 1
+        return self._next
+
+    @next.setter
+    def next(self, value):
+        self._next = value
+
+
 class TestCircularLinkedList(unittest.TestCase):
     def setUp(self):
         self.list = CircularLinkedList()
@@ -106,6 +129,109 @@ class TestCircularLinkedList(unittest.TestCase):
         empty_clone = empty_list.clone()
         self.assertEqual(empty_clone.length(), 0)
     
+    def test_clone_shares_nodes_until_written(self):
+        clone = self.list.clone()
+        self.assertIs(clone.tail, self.list.tail)
+        clone.append('F')
+        self.assertIsNot(clone.head, self.list.head)
+        self.assertEqual(''.join(clone), "ABCDEF")
+        self.assertEqual(''.join(self.list), "ABCDE")
+    
+    def test_clones_stay_independent(self):
+        first = self.list.clone()
+        second = self.list.clone()
+        self.list.delete(0)
+        first.reverse()
+        second.deleteAll('C')
+        second.insert_many(0, "XY")
+        second.delete_range(5, 6)
+        self.assertEqual(''.join(self.list), "BCDE")
+        self.assertEqual(''.join(first), "EDCBA")
+        self.assertEqual(''.join(second), "XYABD")
+    
+    def test_clone_clear_keeps_shared_ring(self):
+        lst = CircularLinkedList(pool_size=10)
+        lst.extend_from("ABCDE")
+        clone = lst.clone()
+        lst.clear()
+        self.assertEqual(lst.pool, [])
+        self.assertEqual(list(islice(clone.cycle(), 7)), list("ABCDEAB"))
+        lst.append('Q')
+        self.assertEqual(''.join(clone), "ABCDE")
+    
+    def test_cursor_on_clone_copies_before_writing(self):
+        clone = self.list.clone()
+        cursor = clone.cursor(2)
+        cursor.insert_after('X')
+        self.assertEqual(cursor.remove(), 'C')
+        self.assertEqual(cursor.peek(), 'X')
+        self.assertEqual(''.join(clone), "ABXDE")
+        self.assertEqual(''.join(self.list), "ABCDE")
+        cursor = self.list.clone().cursor(4)
+        self.assertEqual(cursor.remove(), 'E')
+        self.assertEqual(''.join(self.list), "ABCDE")
+    
+    def test_lazy_reverse_matches_python_list(self):
+        rng = random.Random(15)
+        lst = CircularLinkedList()
+        expected = []
+        for step in range(600):
+            action = rng.random()
+            char = "ABCDE"[step % 5]
+            if action < 0.1:
+                lst.reverse()
+                expected.reverse()
+            elif action < 0.35:
+                index = rng.randint(0, len(expected))
+                lst.insert(char, index)
+                expected.insert(index, char)
+            elif action < 0.45:
+                lst.append(char)
+                expected.append(char)
+            elif action < 0.6 and expected:
+                index = rng.randrange(len(expected))
+                self.assertEqual(lst.delete(index), expected.pop(index))
+            elif action < 0.7:
+                index = rng.randint(0, len(expected))
+                lst.insert_many(index, "xyz")
+                expected[index:index] = "xyz"
+            elif action < 0.75:
+                start = rng.randint(0, len(expected))
+                stop = rng.randint(start, min(start + 4, len(expected)))
+                lst.delete_range(start, stop)
+                del expected[start:stop]
+            elif action < 0.8:
+                lst.deleteAll('x')
+                expected = [item for item in expected if item != 'x']
+            else:
+                text = ''.join(expected)
+                start = rng.randint(0, len(expected))
+                self.assertEqual(lst.findFirst(char, start), text.find(char, start))
+                self.assertEqual(lst.findLast(char, 0, start), text.rfind(char, 0, start))
+                self.assertEqual(lst.findSubsequence("yzA"), text.find("yzA"))
+        self.assertEqual(list(lst), expected)
+        self.assertEqual(lst.count('A'), expected.count('A'))
+        clone = lst.clone()
+        clone.reverse()
+        clone.extend(lst)
+        self.assertEqual(list(clone), expected[::-1] + expected)
+    
+    def test_snapshot_round_trip(self):
+        self.list.insert_many(2, "\u0416\U0001F600")
+        self.list.reverse()
+        restored = CircularLinkedList.from_bytes(self.list.to_bytes(), pool_size=4)
+        self.assertEqual(list(restored), list(self.list))
+        self.assertEqual(restored.pool_size, 4)
+        self.assertIs(restored.tail.next, restored.head)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'list.chrl')
+            self.list.save(path)
+            loaded = CircularLinkedList.load(path)
+        self.assertEqual(''.join(loaded), "EDC\U0001F600\u0416BA")
+        self.assertEqual(CircularLinkedList.from_bytes(CircularLinkedList().to_bytes()).length(), 0)
+        with self.assertRaises(ValueError):
+            CircularLinkedList.from_bytes(b"garbage")
+    
     def test_reverse(self):
         original = [self.list.get(i) for i in range(self.list.length())]
         self.list.reverse()
@@ -294,6 +420,635 @@ class TestCircularLinkedList(unittest.TestCase):
         self.assertEqual(test_list.get(0), 'B')
         self.assertEqual(test_list.get(1), 'D')
 
+    def test_extend_with_itself(self):
+        self.list.extend(self.list)
+        self.assertEqual(self.list.length(), 10)
+        self.assertEqual([self.list.get(i) for i in range(10)], list("ABCDEABCDE"))
+
+    def contents(self, lst):
+        return ''.join(lst.get(i) for i in range(lst.length()))
+
+    def test_extend_from(self):
+        self.list.extend_from("XYZ")
+        self.list.extend_from(['1', '2'])
+        self.list.extend_from(iter("!"))
+        self.list.extend_from("")
+        self.assertEqual(self.contents(self.list), "ABCDEXYZ12!")
+
+        empty_list = CircularLinkedList()
+        empty_list.extend_from("QR")
+        self.assertEqual(self.contents(empty_list), "QR")
+
+    def test_insert_many(self):
+        self.list.insert_many(0, "12")
+        self.list.insert_many(4, ['x', 'y'])
+        self.list.insert_many(self.list.length(), "!")
+        self.assertEqual(self.contents(self.list), "12ABxyCDE!")
+
+        with self.assertRaises(ValueError):
+            self.list.insert_many(-1, "Q")
+        with self.assertRaises(ValueError):
+            self.list.insert_many(100, "Q")
+
+    def test_delete_range(self):
+        self.list.delete_range(1, 3)
+        self.assertEqual(self.contents(self.list), "ADE")
+        self.list.delete_range(2, 3)
+        self.assertEqual(self.contents(self.list), "AD")
+        self.list.delete_range(1, 1)
+        self.assertEqual(self.contents(self.list), "AD")
+        self.list.append('F')
+        self.assertEqual(self.contents(self.list), "ADF")
+        self.list.delete_range(0, 3)
+        self.assertEqual(self.list.length(), 0)
+
+        with self.assertRaises(ValueError):
+            self.list.delete_range(-1, 0)
+        with self.assertRaises(ValueError):
+            self.list.delete_range(1, 0)
+        with self.assertRaises(ValueError):
+            self.list.delete_range(0, 1)
+
+    def test_bulk_validation_rejects_whole_batch(self):
+        for bad in (['X', 'YZ'], ['X', 1], ['X', '']):
+            with self.assertRaises(ValueError):
+                self.list.extend_from(bad)
+            with self.assertRaises(ValueError):
+                self.list.insert_many(0, bad)
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_find_with_bounds(self):
+        self.list.extend_from("ABCDE")
+        self.assertEqual(self.list.findFirst('B', 2), 6)
+        self.assertEqual(self.list.findFirst('B', 2, 6), -1)
+        self.assertEqual(self.list.findFirst('E', -1), 9)
+        self.assertEqual(self.list.findLast('B', 0, 6), 1)
+        self.assertEqual(self.list.findLast('A', 1), 5)
+        self.assertEqual(self.list.findLast('E', 0, -1), 4)
+        self.assertEqual(self.list.findFirst('A', 100), -1)
+        self.assertEqual(self.list.findLast('A', 6, 3), -1)
+
+    def test_count(self):
+        self.list.extend_from("AAB")
+        self.assertEqual(self.list.count('A'), 3)
+        self.assertEqual(self.list.count('E'), 1)
+        self.assertEqual(self.list.count('Z'), 0)
+        with self.assertRaises(ValueError):
+            self.list.count("AB")
+
+    def test_findSubsequence(self):
+        self.list.extend_from("CDX")
+        self.assertEqual(self.list.findSubsequence("CD"), 2)
+        self.assertEqual(self.list.findSubsequence(['D', 'X']), 6)
+        self.assertEqual(self.list.findSubsequence("DC"), -1)
+        self.assertEqual(self.list.findSubsequence("\u20ac"), -1)
+        self.assertEqual(self.list.findSubsequence(""), 0)
+        with self.assertRaises(ValueError):
+            self.list.findSubsequence(['AB'])
+
+    def test_search_on_large_list(self):
+        large_list = CircularLinkedList()
+        large_list.extend_from("a" * 100000 + "b" + "a" * 100000)
+        self.assertEqual(large_list.findFirst('b'), 100000)
+        self.assertEqual(large_list.findLast('b'), 100000)
+        self.assertEqual(large_list.findLast('a'), 200000)
+        self.assertEqual(large_list.count('a'), 200000)
+        self.assertEqual(large_list.findSubsequence("ab"), 99999)
+
+    def test_bounded_append_evicts_oldest(self):
+        ring = CircularLinkedList(maxlen=3)
+        ring.extend_from("ABCDE")
+        self.assertEqual(list(ring), list("CDE"))
+        ring.append('F')
+        self.assertEqual(list(ring), list("DEF"))
+        ring.insert('G', 3)
+        self.assertEqual(list(ring), list("EFG"))
+        ring.reverse()
+        ring.append('H')
+        self.assertEqual(list(ring), list("FEH"))
+        clone = ring.clone()
+        clone.append('I')
+        self.assertEqual(list(ring), list("FEH"))
+        self.assertEqual(list(clone), list("EHI"))
+        self.assertEqual(clone.maxlen, 3)
+
+        ring.delete(0)
+        ring.insert('J', 0)
+        self.assertEqual(list(ring), list("JEH"))
+        with self.assertRaises(ValueError):
+            ring.insert('K', 1)
+        with self.assertRaises(ValueError):
+            ring.insert_many(0, "K")
+        with self.assertRaises(ValueError):
+            ring.apply_edits([('insert', 'K', 0)])
+        with self.assertRaises(ValueError):
+            ring.cursor().insert_after('K')
+        self.assertEqual(list(ring), list("JEH"))
+        for bad in (0, -1, 2.5):
+            with self.assertRaises(ValueError):
+                CircularLinkedList(maxlen=bad)
+
+    def test_rotate(self):
+        self.list.rotate(2)
+        self.assertEqual(self.contents(self.list), "DEABC")
+        self.list.rotate(-3)
+        self.assertEqual(self.contents(self.list), "BCDEA")
+        self.list.rotate()
+        self.list.rotate(11)
+        self.assertEqual(self.contents(self.list), "EABCD")
+        self.list.reverse()
+        self.list.rotate(1)
+        self.assertEqual(self.contents(self.list), "EDCBA")
+        clone = self.list.clone()
+        clone.rotate(-1)
+        self.assertEqual(self.contents(self.list), "EDCBA")
+        self.assertEqual(self.contents(clone), "DCBAE")
+        self.list.append('F')
+        self.assertEqual(self.contents(self.list), "EDCBAF")
+
+        empty_list = CircularLinkedList()
+        empty_list.rotate(3)
+        self.assertEqual(empty_list.length(), 0)
+
+    def test_slice_views(self):
+        self.list.extend_from("FGH")
+        view = self.list[2:7]
+        self.assertEqual(len(view), 5)
+        self.assertEqual(''.join(view), "CDEFG")
+        self.assertEqual(view.get(1), 'D')
+        self.assertEqual(view[-1], 'G')
+        self.assertEqual(''.join(view[::2]), "CEG")
+        self.assertEqual(''.join(self.list[::-3]), "HEB")
+        self.assertEqual(view.findFirst('E'), 2)
+        self.assertEqual(view.findLast('A'), -1)
+        self.assertEqual(self.list[1::2].findFirst('F'), 2)
+        self.assertEqual(view.count('F'), 1)
+        self.assertEqual(view.findSubsequence("EF"), 2)
+        self.assertEqual(self.list[-1], 'H')
+        self.list.reverse()
+        self.assertEqual(''.join(self.list[1:4]), "GFE")
+        with self.assertRaises(ValueError):
+            self.list[8]
+        with self.assertRaises(ValueError):
+            self.list[1:4].get(3)
+
+    def test_views_detect_mutation(self):
+        view = self.list[1:4]
+        self.list.get(0)
+        self.list.findFirst('A')
+        self.assertEqual(''.join(view), "BCD")
+        self.list.append('F')
+        with self.assertRaises(ValueError):
+            view.get(0)
+        with self.assertRaises(ValueError):
+            list(view)
+        view = self.list[:]
+        self.list.reverse()
+        with self.assertRaises(ValueError):
+            len(view)
+        # Changing a clone leaves the original's views valid.
+        view = self.list[:2]
+        self.list.clone().delete(0)
+        self.assertEqual(''.join(view), "FE")
+
+    def test_views_detect_mutation_during_iteration(self):
+        lst = CircularLinkedList(pool_size=4)
+        lst.extend_from("ABCDEFGH")
+        elements = iter(lst[3:6])
+        self.assertEqual(next(elements), 'D')
+        lst.delete_range(0, 6)
+        with self.assertRaises(ValueError):
+            next(elements)
+        lst.extend_from("IJKL")
+        elements = iter(lst[1:4])
+        self.assertEqual(next(elements), 'H')
+        lst.delete(1)
+        with self.assertRaises(ValueError):
+            next(elements)
+
+    def test_slice_assignment(self):
+        self.list[1:3] = "xyz"
+        self.assertEqual(self.contents(self.list), "AxyzDE")
+        self.list[4:2] = "!"
+        self.assertEqual(self.contents(self.list), "Axyz!DE")
+        self.list[::2] = "1234"
+        self.assertEqual(self.contents(self.list), "1x2z3D4")
+        self.list[-1] = 'Q'
+        self.list[0] = 'P'
+        self.assertEqual(self.contents(self.list), "Px2z3DQ")
+        self.list[:] = self.list[::-1]
+        self.assertEqual(self.contents(self.list), "QD3z2xP")
+        for key, value in ((slice(None, None, 2), "ab"), (slice(0, 2), ['a', 'bc']), (3, "ab"), (7, 'a')):
+            with self.assertRaises(ValueError):
+                self.list[key] = value
+        self.assertEqual(self.contents(self.list), "QD3z2xP")
+
+    def test_slice_deletion(self):
+        self.list.extend_from("FGH")
+        del self.list[1:3]
+        self.assertEqual(self.contents(self.list), "ADEFGH")
+        del self.list[::-2]
+        self.assertEqual(self.contents(self.list), "AEG")
+        del self.list[-1]
+        del self.list[5:]
+        self.assertEqual(self.contents(self.list), "AE")
+        with self.assertRaises(ValueError):
+            del self.list[2]
+
+    def test_apply_edits(self):
+        # Indices refer to the list before the script.
+        self.list.apply_edits([('delete', 1), ('insert', 'x', 1), ('insert', 'y', 5),
+                               ('insert', 'z', 1), ('delete', 4), ('insert', 'w', 0)])
+        self.assertEqual(self.contents(self.list), "wAxzCDy")
+        self.list.apply_edits([('delete', i) for i in range(7)] + [('insert', 'Q', 7)])
+        self.assertEqual(self.contents(self.list), "Q")
+        self.list.apply_edits([])
+        self.assertEqual(self.contents(self.list), "Q")
+
+    def test_apply_edits_matches_reference(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            text = ''.join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            ops = []
+            deleted = set()
+            for _ in range(rng.randint(0, 8)):
+                if text and rng.random() < 0.5:
+                    index = rng.randrange(len(text))
+                    if index not in deleted:
+                        deleted.add(index)
+                        ops.append(('delete', index))
+                else:
+                    ops.append(('insert', rng.choice("XYZ"), rng.randint(0, len(text))))
+            expected = []
+            for index in range(len(text) + 1):
+                expected += [op[1] for op in ops if op[0] == 'insert' and op[2] == index]
+                if index < len(text) and index not in deleted:
+                    expected.append(text[index])
+            lst = self.list.clone()
+            lst.clear()
+            lst.extend_from(text[::-1])
+            lst.reverse()
+            lst.apply_edits(ops)
+            self.assertEqual(self.contents(lst), ''.join(expected))
+
+    def test_apply_edits_is_atomic(self):
+        for bad in ([('insert', 'X', 0), ('delete', 5)],
+                    [('delete', 0), ('delete', 0)],
+                    [('delete', 1), ('insert', 'XY', 0)],
+                    [('insert', 'X', 6)],
+                    [('move', 0)]):
+            with self.assertRaises(ValueError):
+                self.list.apply_edits(bad)
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_batch(self):
+        clone = self.list.clone()
+        with self.list.batch() as batch:
+            batch.delete(0)
+            batch.insert('Z', 5)
+            batch.insert('Y', 0)
+            # Nothing changes until the block ends.
+            self.assertEqual(self.contents(self.list), "ABCDE")
+        self.assertEqual(self.contents(self.list), "YBCDEZ")
+        self.assertEqual(self.contents(clone), "ABCDE")
+
+        with self.assertRaises(RuntimeError):
+            with self.list.batch() as batch:
+                batch.delete(0)
+                raise RuntimeError
+        self.assertEqual(self.contents(self.list), "YBCDEZ")
+
+    def test_iteration_protocol(self):
+        self.assertEqual(len(self.list), 5)
+        self.assertEqual(list(self.list), list("ABCDE"))
+        self.assertEqual(list(reversed(self.list)), list("EDCBA"))
+        self.assertEqual(list(CircularLinkedList()), [])
+        self.assertEqual(len(CircularLinkedList()), 0)
+
+    def test_cursor_traversal_wraps_around(self):
+        cursor = self.list.cursor(3)
+        self.assertEqual(cursor.peek(), 'D')
+        self.assertEqual([cursor.next() for _ in range(4)], list("DEAB"))
+        self.assertEqual(cursor.index, 2)
+        self.assertEqual(cursor.peek(), 'C')
+
+        with self.assertRaises(ValueError):
+            self.list.cursor(5)
+        with self.assertRaises(ValueError):
+            CircularLinkedList().cursor().peek()
+
+    def test_cursor_insert_after(self):
+        cursor = self.list.cursor(4)
+        cursor.insert_after('F')
+        self.assertEqual(self.list.tail.data, 'F')
+        cursor.next()
+        cursor.insert_after('G')
+        cursor = self.list.cursor(1)
+        cursor.insert_after('X')
+        self.assertEqual(list(self.list), list("ABXCDEFG"))
+        self.assertEqual(self.list.length(), 8)
+
+        empty_list = CircularLinkedList()
+        empty_cursor = empty_list.cursor()
+        empty_cursor.insert_after('Q')
+        empty_cursor.insert_after('R')
+        self.assertEqual(list(empty_list), list("QR"))
+
+        single = CircularLinkedList()
+        single.append('c')
+        cursor = single.cursor(0)
+        cursor.insert_after('a')
+        self.assertEqual(cursor.peek(), 'c')
+        self.assertEqual([cursor.next() for _ in range(3)], list("cac"))
+        self.assertEqual(list(single), list("ca"))
+
+    def test_cursor_remove(self):
+        cursor = self.list.cursor(1)
+        self.assertEqual(cursor.remove(), 'B')
+        self.assertEqual(cursor.peek(), 'C')
+        cursor = self.list.cursor(3)
+        self.assertEqual(cursor.remove(), 'E')
+        self.assertEqual(cursor.peek(), 'A')
+        self.assertEqual(self.list.tail.data, 'D')
+        self.list.append('Z')
+        self.assertEqual(list(self.list), list("ACDZ"))
+
+        while self.list.length():
+            cursor.remove()
+        self.assertIsNone(self.list.head)
+
+    def test_cycle(self):
+        self.assertEqual(''.join(islice(self.list.cycle(), 12)), "ABCDEABCDEAB")
+        self.assertEqual(list(CircularLinkedList().cycle()), [])
+
+    def test_cycle_survives_deleting_the_yielded_element(self):
+        for pool_size in (0, 4):
+            lst = CircularLinkedList(pool_size=pool_size)
+            lst.extend_from("abcd")
+            elements = lst.cycle()
+            self.assertEqual(next(elements), 'a')
+            lst.delete(0)
+            self.assertEqual(''.join(islice(elements, 5)), "bcdbc")
+            lst.delete(1)
+            self.assertEqual(''.join(islice(elements, 3)), "dbd")
+
+
+class TestCircularLinkedListComplexity(unittest.TestCase):
+    def _build(self, size):
+        lst = CircularLinkedList()
+        for _ in range(size):
+            lst.append('A')
+        return lst
+
+    def _pointer_reads(self, size, operation):
+        with mock.patch.object(circular, 'Node', CountingNode):
+            lst = self._build(size)
+            CountingNode.reads = 0
+            operation(lst)
+            return CountingNode.reads
+
+    def assertConstantCost(self, operation):
+        small = self._pointer_reads(10, operation)
+        large = self._pointer_reads(2000, operation)
+        self.assertEqual(small, large)
+
+    def test_append_is_constant(self):
+        self.assertConstantCost(lambda lst: lst.append('B'))
+
+    def test_length_is_constant(self):
+        self.assertConstantCost(lambda lst: lst.length())
+
+    def test_insert_at_head_and_tail_is_constant(self):
+        self.assertConstantCost(lambda lst: lst.insert('B', 0))
+        self.assertConstantCost(lambda lst: lst.insert('B', lst.length()))
+
+    def test_get_and_delete_at_ends_are_constant(self):
+        self.assertConstantCost(lambda lst: lst.get(0))
+        self.assertConstantCost(lambda lst: lst.get(lst.length() - 1))
+        self.assertConstantCost(lambda lst: lst.delete(0))
+
+    def test_delete_at_back_walks_the_ring(self):
+        size = 2000
+        reads = self._pointer_reads(size, lambda lst: lst.delete(size - 1))
+        self.assertGreaterEqual(reads, size - 1)
+        self.assertLessEqual(reads, size + 2)
+
+    def test_get_walks_at_most_once(self):
+        size = 2000
+        reads = self._pointer_reads(size, lambda lst: lst.get(size // 2))
+        self.assertLessEqual(reads, size // 2 + 2)
+
+    def test_full_pass_is_linear(self):
+        size = 2000
+        reads = self._pointer_reads(size, lambda lst: list(lst))
+        self.assertLessEqual(reads, size + 2)
+
+        def cursor_pass(lst):
+            cursor = lst.cursor()
+            for _ in range(size):
+                cursor.next()
+                cursor.insert_after('B')
+                cursor.next()
+
+        reads = self._pointer_reads(size, cursor_pass)
+        self.assertLessEqual(reads, 4 * size + 2)
+
+    def test_reverse_is_constant(self):
+        self.assertConstantCost(lambda lst: lst.reverse())
+
+    def test_reversed_ends_stay_constant(self):
+        def reversed_edits(lst):
+            lst.reverse()
+            lst.get(0)
+            lst.get(lst.length() - 1)
+            lst.append('B')
+            lst.insert('C', 0)
+            # Only the predecessor-free end can be deleted in O(1); while
+            # flipped that is the logical end.
+            lst.delete(lst.length() - 1)
+            lst.reverse()
+
+        self.assertConstantCost(reversed_edits)
+
+    def test_apply_edits_walks_once(self):
+        # One sweep up to the last edited position, however many edits.
+        edits = [('insert', 'B', i) for i in range(0, 10, 2)] + [('delete', i) for i in range(1, 10, 2)]
+        self.assertConstantCost(lambda lst: lst.apply_edits(edits))
+        size = 2000
+        reads = self._pointer_reads(size, lambda lst: lst.apply_edits(
+            [('delete', i) for i in range(0, size, 2)] + [('insert', 'B', size)]))
+        self.assertLessEqual(reads, 3 * size)
+
+    def test_bounded_append_is_constant(self):
+        def evict(lst):
+            lst.maxlen = lst.length()
+            lst.append('B')
+            lst.rotate(-1)
+
+        self.assertConstantCost(evict)
+
+    def test_slice_view_walks_once(self):
+        size = 2000
+        reads = self._pointer_reads(size, lambda lst: list(lst[size // 2:size // 2 + 100:3]))
+        self.assertLessEqual(reads, size // 2 + 100 + 2)
+
+    def test_sequential_access_resumes_from_finger(self):
+        size = 2000
+
+        def forward_pass(lst):
+            for i in range(size):
+                lst.get(i)
+
+        def edit_pass(lst):
+            # get(i), insert(x, i + 2), delete(i + 1) while moving right.
+            for i in range(0, size - 4, 3):
+                lst.get(i)
+                lst.insert('B', i + 2)
+                lst.delete(i + 1)
+
+        self.assertLessEqual(self._pointer_reads(size, forward_pass), 3 * size)
+        self.assertLessEqual(self._pointer_reads(size, edit_pass), 3 * size)
+
+    def test_finger_never_walks_further_than_the_tail(self):
+        size = 2000
+
+        def jump_back(lst):
+            lst.get(size - 2)
+            CountingNode.reads = 0
+            lst.get(10)
+
+        with mock.patch.object(circular, 'Node', CountingNode):
+            lst = self._build(size)
+            jump_back(lst)
+            self.assertLessEqual(CountingNode.reads, 12)
+
+    def test_finger_is_dropped_when_positions_move(self):
+        lst = self._build(0)
+        lst.extend_from("abcdefgh")
+        for mutate in (lambda: lst.delete(0), lambda: lst.rotate(-1), lambda: lst.deleteAll('c'),
+                       lambda: lst.insert_many(1, "XY"), lambda: lst.delete_range(0, 2),
+                       lambda: (lst.reverse(), lst.cursor(), lst.reverse())):
+            lst.get(4)
+            mutate()
+            expected = list(lst)
+            self.assertEqual([lst.get(i) for i in range(lst.length())], expected)
+
+    def test_cursor_applies_pending_reverse(self):
+        lst = self._build(3)
+        lst.append('B')
+        lst.reverse()
+        cursor = lst.cursor()
+        self.assertFalse(lst.flipped)
+        self.assertEqual([cursor.next() for _ in range(5)], list("BAAAB"))
+
+    def test_ring_stays_consistent(self):
+        lst = self._build(3)
+        lst.insert('B', 0)
+        lst.delete(lst.length() - 1)
+        lst.append('C')
+        self.assertIs(lst.tail.next, lst.head)
+        self.assertEqual(lst.tail.data, 'C')
+        self.assertEqual([lst.get(i) for i in range(lst.length())], list("BAAC"))
+
+
+
+class TestCircularLinkedListMemory(unittest.TestCase):
+    def test_nodes_have_no_instance_dict(self):
+        node = circular.Node('A')
+        self.assertFalse(hasattr(node, '__dict__'))
+
+    def test_bytes_per_element(self):
+        size = 100000
+        gc.collect()
+        tracemalloc.start()
+        try:
+            lst = CircularLinkedList()
+            lst.extend_from('a' * size)
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(lst.length(), size)
+        self.assertLess(allocated / size, 80)
+
+    def _churn(self, lst, rounds):
+        for i in range(rounds):
+            lst.delete(i % lst.length())
+            lst.insert('b', (i * 7) % lst.length())
+        lst.delete_range(0, 100)
+        lst.extend_from('c' * 100)
+        lst.deleteAll('b')
+        lst.extend_from('d' * (1000 - lst.length()))
+
+    def test_pool_recycles_nodes_under_churn(self):
+        created = []
+
+        class TrackedNode(circular.Node):
+            __slots__ = ()
+
+            def __init__(self, data):
+                created.append(1)
+                super().__init__(data)
+
+        with mock.patch.object(circular, 'Node', TrackedNode):
+            pooled = CircularLinkedList(pool_size=1000)
+            pooled.extend_from('a' * 1000)
+            plain = CircularLinkedList()
+            plain.extend_from('a' * 1000)
+
+            created.clear()
+            self._churn(pooled, 5000)
+            pooled_allocations = len(created)
+
+            created.clear()
+            self._churn(plain, 5000)
+            plain_allocations = len(created)
+
+        self.assertEqual(pooled_allocations, 0)
+        self.assertGreaterEqual(plain_allocations, 5000)
+        self.assertEqual(pooled.length(), 1000)
+
+    def test_pool_churn_does_not_grow_memory(self):
+        lst = CircularLinkedList(pool_size=1000)
+        lst.extend_from('a' * 1000)
+        self._churn(lst, 100)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            self._churn(lst, 500)
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(after - before, 4096)
+
+    def test_snapshots_do_not_copy(self):
+        lst = CircularLinkedList()
+        lst.extend_from('a' * 10000)
+        snapshots = []
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(1000):
+                snapshots.append(lst.clone())
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Copying would allocate 10 million nodes.
+        self.assertLess(after - before, 1_000_000)
+        lst.append('b')
+        self.assertEqual(snapshots[0].length(), 10000)
+
+    def test_pool_is_bounded(self):
+        lst = CircularLinkedList(pool_size=10)
+        lst.extend_from('a' * 100)
+        lst.clear()
+        self.assertEqual(len(lst.pool), 10)
+        lst.extend_from('xyz')
+        self.assertEqual(len(lst.pool), 7)
+        self.assertEqual(list(lst), list("xyz"))
+        self.assertTrue(all(node.data is None for node in lst.pool))
+
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,144 @@
+import unittest
+from linked_lists.gap_buffer import GapBufferList, random_walk_trace, run_trace
+
+
+class TestGapBufferList(unittest.TestCase):
+    def setUp(self):
+        self.list = GapBufferList()
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def contents(self, lst):
+        return ''.join(lst.get(i) for i in range(lst.length()))
+
+    def test_initial_empty_state(self):
+        empty_list = GapBufferList()
+        self.assertEqual(empty_list.length(), 0)
+        self.assertEqual(empty_list.cursor(), 0)
+
+    def test_append_and_get(self):
+        self.list.append('F')
+        self.assertEqual(self.list.get(5), 'F')
+        self.assertEqual(self.list.length(), 6)
+
+    def test_insert(self):
+        self.list.insert('Z', 2)
+        self.assertEqual(self.contents(self.list), "ABZCDE")
+        self.assertEqual(self.list.cursor(), 3)
+
+        self.list.insert('Y', 0)
+        self.assertEqual(self.contents(self.list), "YABZCDE")
+
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', -1)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 100)
+
+    def test_delete(self):
+        self.assertEqual(self.list.delete(1), 'B')
+        self.assertEqual(self.list.delete(0), 'A')
+        self.assertEqual(self.list.delete(2), 'E')
+        self.assertEqual(self.contents(self.list), "CD")
+
+        with self.assertRaises(ValueError):
+            self.list.delete(-1)
+        with self.assertRaises(ValueError):
+            self.list.delete(2)
+
+    def test_cursor_movement(self):
+        self.list.move_cursor(2)
+        self.assertEqual(self.list.cursor(), 2)
+        self.list.move_left()
+        self.list.insert('X', self.list.cursor())
+        self.list.move_right(2)
+        self.list.insert('Y', self.list.cursor())
+        self.assertEqual(self.contents(self.list), "AXBCYDE")
+
+        with self.assertRaises(ValueError):
+            self.list.move_cursor(8)
+        with self.assertRaises(ValueError):
+            self.list.move_left(10)
+
+    def test_edits_at_cursor_do_not_move_gap(self):
+        self.list.move_cursor(3)
+        buffer_size = len(self.list.buffer)
+        self.list.insert('X', 3)
+        self.list.delete(4)
+        self.assertEqual(self.list.cursor(), 4)
+        self.assertEqual(len(self.list.buffer), buffer_size)
+
+    def test_deleteAll(self):
+        self.list.insert('A', 3)
+        self.list.append('A')
+        self.list.deleteAll('A')
+        self.assertEqual(self.contents(self.list), "BCDE")
+        self.list.deleteAll('Z')
+        self.assertEqual(self.list.length(), 4)
+
+    def test_clone(self):
+        clone = self.list.clone()
+        self.assertEqual(self.contents(clone), "ABCDE")
+        clone.delete(0)
+        self.assertEqual(self.list.length(), 5)
+
+    def test_reverse(self):
+        self.list.move_cursor(1)
+        self.list.reverse()
+        self.assertEqual(self.contents(self.list), "EDCBA")
+        self.assertEqual(self.list.cursor(), 4)
+
+        empty_list = GapBufferList()
+        empty_list.reverse()
+        self.assertEqual(empty_list.length(), 0)
+
+    def test_find_operations(self):
+        self.list.append('C')
+        self.list.move_cursor(3)
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findLast('C'), 5)
+        self.assertEqual(self.list.findFirst('E'), 4)
+        self.assertEqual(self.list.findFirst('Z'), -1)
+        self.assertEqual(self.list.findLast('Z'), -1)
+
+    def test_clear_and_extend(self):
+        other = GapBufferList()
+        other.append('X')
+        other.append('Y')
+        other.move_cursor(1)
+        self.list.move_cursor(0)
+        self.list.extend(other)
+        self.assertEqual(self.contents(self.list), "ABCDEXY")
+
+        self.list.clear()
+        self.assertEqual(self.list.length(), 0)
+        self.list.append('Q')
+        self.assertEqual(self.contents(self.list), "Q")
+
+    def test_validation_errors(self):
+        with self.assertRaises(ValueError):
+            self.list.append(123)
+        with self.assertRaises(ValueError):
+            self.list.insert("AB", 0)
+        with self.assertRaises(ValueError):
+            self.list.findFirst("")
+        with self.assertRaises(ValueError):
+            self.list.deleteAll("AB")
+
+    def test_random_walk_matches_python_list(self):
+        lst = GapBufferList()
+        expected = []
+        for _ in range(200):
+            lst.append('a')
+            expected.append('a')
+        trace = random_walk_trace(200, 2000, seed=7)
+        run_trace(lst, trace)
+        for operation, index in trace:
+            if operation == 'insert':
+                expected.insert(index, 'x')
+            else:
+                expected.pop(index)
+        self.assertEqual(self.contents(lst), ''.join(expected))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
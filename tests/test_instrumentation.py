@@ -0,0 +1,131 @@
+import unittest
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+from linked_lists.instrumentation import disable_instrumentation, enable_instrumentation
+from linked_lists.rope import RopeList
+
+
+class TestInstrumentation(unittest.TestCase):
+    def build(self, factory):
+        lst = factory()
+        lst.extend_from("ABCDEFGHIJ")
+        return lst
+
+    def test_disabled_lists_use_plain_methods(self):
+        lst = self.build(CircularLinkedList)
+        self.assertNotIn('get', vars(lst))
+        enable_instrumentation(lst)
+        self.assertIn('get', vars(lst))
+        disable_instrumentation(lst)
+        self.assertNotIn('get', vars(lst))
+        self.assertIsNone(lst.instrumentation)
+        self.assertEqual(lst.get(3), 'D')
+
+    def test_other_list_types_are_rejected(self):
+        lst = RopeList()
+        lst.append('b')
+        with self.assertRaises(ValueError):
+            enable_instrumentation(lst)
+        self.assertEqual(lst.findFirst('b'), 0)
+        self.assertNotIn('findFirst', vars(lst))
+
+    def test_counts_calls_and_latency(self):
+        lst = self.build(ArrayBasedList)
+        stats = enable_instrumentation(lst)
+        for i in range(5):
+            lst.get(i)
+        lst.append('K')
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['get']['calls'], 5)
+        self.assertEqual(snapshot['append']['calls'], 1)
+        self.assertGreater(snapshot['get']['total_seconds'], 0)
+        self.assertLessEqual(snapshot['get']['p50'], snapshot['get']['p99'])
+        self.assertNotIn('delete', snapshot)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_circular_work_counts_nodes_traversed(self):
+        lst = self.build(CircularLinkedList)
+        stats = enable_instrumentation(lst)
+        lst.get(4)
+        lst.get(9)
+        # get(4) left the finger just before index 3, so this walks nowhere.
+        lst.insert('X', 3)
+        lst.findFirst('C')
+        lst.findFirst('J', start=5)
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['get']['work'], 4)
+        self.assertEqual(snapshot['insert']['work'], 0)
+        self.assertEqual(snapshot['findFirst']['work'], 3 + 6)
+
+        # A left-to-right pass steps on from the finger: two links per get
+        # instead of a walk from the head.
+        lst = CircularLinkedList()
+        lst.extend_from('a' * 2000)
+        stats = enable_instrumentation(lst)
+        for index in range(2000):
+            lst.get(index)
+        self.assertEqual(stats.snapshot()['get']['work'], 2 * 2000 - 5)
+
+        # On a reversed list the logical head is the physical tail.
+        lst = self.build(CircularLinkedList)
+        lst.reverse()
+        stats = enable_instrumentation(lst)
+        self.assertEqual(lst.get(0), 'J')
+        self.assertEqual(lst.get(8), 'B')
+        self.assertEqual(lst.delete(9), 'A')
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['get']['work'], 1)
+        self.assertEqual(snapshot['delete']['work'], 0)
+        disable_instrumentation(lst)
+        self.assertIsNone(lst.walked)
+
+    def test_edit_scripts_may_be_generators(self):
+        lst = CircularLinkedList()
+        lst.extend_from('a' * 1000)
+        stats = enable_instrumentation(lst)
+        lst.apply_edits(('delete', index) for index in (700, 750))
+        self.assertEqual(lst.length(), 998)
+        # 700 links to reach index 700, then 49 more past the deleted node.
+        self.assertEqual(stats.snapshot()['apply_edits']['work'], 749)
+
+    def test_array_work_counts_elements_shifted(self):
+        lst = self.build(ArrayBasedList)
+        stats = enable_instrumentation(lst)
+        lst.insert('X', 2)
+        lst.delete(0)
+        lst.findLast('A')
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['insert']['work'], 8)
+        self.assertEqual(snapshot['delete']['work'], 10)
+        self.assertEqual(snapshot['findLast']['work'], 10)
+
+    def test_nested_calls_are_recorded_once(self):
+        lst = self.build(CircularLinkedList)
+        stats = enable_instrumentation(lst)
+        lst.insert('Z', lst.length())
+        lst.clone()
+        snapshot = stats.snapshot()
+        self.assertEqual(set(snapshot), {'insert', 'clone'})
+
+    def test_callback_receives_every_call(self):
+        events = []
+        lst = self.build(ArrayBasedList)
+        enable_instrumentation(lst, callback=lambda *event: events.append(event))
+        lst.delete(5)
+        lst.findFirst('A')
+        self.assertEqual([name for name, _, _ in events], ['delete', 'findFirst'])
+        self.assertEqual(events[0][2], 4)
+
+    def test_failed_calls_raise_and_are_not_recorded(self):
+        lst = self.build(CircularLinkedList)
+        stats = enable_instrumentation(lst)
+        with self.assertRaises(ValueError):
+            lst.get(100)
+        self.assertNotIn('get', stats.snapshot())
+        self.assertEqual(lst.get(0), 'A')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,207 @@
+import os
+import random
+import tempfile
+import time
+import unittest
+import warnings
+from unittest import mock
+
+from linked_lists import mapped
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.mapped import HEADER, MappedList
+
+
+class TestMappedList(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'list.chrl')
+        self.list = MappedList(self.path)
+        self.addCleanup(self.list.close)
+        self.list.extend_from("ABCDE")
+
+    def test_initial_empty_state(self):
+        with MappedList() as empty_list:
+            self.assertEqual(empty_list.length(), 0)
+            self.assertEqual(list(empty_list), [])
+
+    def test_append_insert_get_delete(self):
+        self.list.append('F')
+        self.list.insert('Z', 2)
+        self.list.insert('Y', 0)
+        self.assertEqual(''.join(self.list), "YABZCDEF")
+        self.assertEqual(self.list.get(3), 'Z')
+        self.assertEqual(self.list.delete(3), 'Z')
+        self.assertEqual(self.list.delete(0), 'Y')
+        self.assertEqual(''.join(self.list), "ABCDEF")
+
+        with self.assertRaises(ValueError):
+            self.list.get(6)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 7)
+        with self.assertRaises(ValueError):
+            self.list.delete(-1)
+        with self.assertRaises(ValueError):
+            self.list.append("AB")
+
+    def test_searches(self):
+        self.list.extend_from("ABC")
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findFirst('C', 3), 7)
+        self.assertEqual(self.list.findLast('A'), 5)
+        self.assertEqual(self.list.findLast('A', 0, 5), 0)
+        self.assertEqual(self.list.findFirst('Z'), -1)
+        self.assertEqual(self.list.count('B'), 2)
+        self.assertEqual(self.list.findSubsequence("EAB"), 4)
+        self.assertEqual(self.list.findSubsequence("\U0001F600"), -1)
+
+    def test_bulk_operations(self):
+        self.list.extend_from("ABA")
+        self.list.deleteAll('A')
+        self.assertEqual(''.join(self.list), "BCDEB")
+        self.list.insert_many(1, "xyz")
+        self.list.delete_range(0, 2)
+        self.assertEqual(''.join(self.list), "yzCDEB")
+        self.list.reverse()
+        self.assertEqual(''.join(self.list), "BEDCzy")
+        self.list.extend(self.list)
+        self.assertEqual(''.join(self.list), "BEDCzyBEDCzy")
+        plain = ArrayBasedList()
+        plain.extend_from("qr")
+        self.list.extend(plain)
+        self.assertEqual(self.list.findLast('r'), 13)
+        self.list.clear()
+        self.assertEqual(self.list.length(), 0)
+
+    def test_clone_is_independent(self):
+        with self.list.clone() as clone:
+            clone.delete(0)
+            self.assertEqual(''.join(clone), "BCDE")
+            self.assertEqual(''.join(self.list), "ABCDE")
+
+    def test_reopen_keeps_contents(self):
+        self.list.extend_from("Ж\U0001F600")
+        self.list.close()
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 7 * 4)
+        with MappedList(self.path) as reopened:
+            self.assertEqual(''.join(reopened), "ABCDEЖ\U0001F600")
+            reopened.append('!')
+        with MappedList(self.path) as reopened:
+            self.assertEqual(reopened.get(7), '!')
+
+    def test_dropped_list_releases_its_file(self):
+        path = os.path.join(self.directory.name, 'dropped.chrl')
+        lst = MappedList(path)
+        lst.extend_from("xyz")
+        handle = lst.file
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', ResourceWarning)
+            del lst
+        self.assertTrue(handle.closed)
+        self.assertEqual(os.path.getsize(path), HEADER.size + 3 * 4)
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.directory.name, 'other')
+        with open(other, 'wb') as handle:
+            handle.write(b'not a list' * 10)
+        with self.assertRaises(ValueError):
+            MappedList(other)
+        with self.assertRaises(ValueError):
+            MappedList(width=3)
+
+    def test_code_unit_widths(self):
+        for width, fits, too_wide in ((1, 'é', 'Ж'),
+                                      (2, 'Ж', '\U0001F600'),
+                                      (4, '\U0001F600', None)):
+            with MappedList(width=width) as lst:
+                lst.extend_from("ab" + fits)
+                self.assertEqual(lst.get(2), fits)
+                self.assertEqual(lst.findFirst(fits), 2)
+                if too_wide is not None:
+                    with self.assertRaises(ValueError):
+                        lst.append(too_wide)
+                    self.assertEqual(lst.findFirst(too_wide), -1)
+                    lst.deleteAll(too_wide)
+                self.assertEqual(lst.length(), 3)
+
+    def test_misaligned_matches_are_skipped(self):
+        # U+4100 is stored as 00 41, so the bytes of 'A' (41 00) appear
+        # across the unit boundary of "䄀\u0000".
+        with MappedList(width=2) as lst:
+            lst.extend_from("䄀\u0000A")
+            self.assertEqual(lst.findFirst('A'), 2)
+            self.assertEqual(lst.findLast('A', 0, 2), -1)
+
+    def test_growth_is_geometric(self):
+        resizes = []
+        with MappedList(width=1) as lst:
+            original = lst._resize
+            with mock.patch.object(lst, '_resize', side_effect=lambda units: (resizes.append(units), original(units))):
+                for _ in range(100000):
+                    lst.append('a')
+            self.assertEqual(lst.length(), 100000)
+        self.assertLessEqual(len(resizes), 6)
+
+    def test_chunked_passes(self):
+        with mock.patch.object(mapped, 'CHUNK_UNITS', 7):
+            with MappedList(width=2) as lst:
+                text = ''.join(chr(ord('a') + i % 5) for i in range(50))
+                lst.extend_from(text)
+                self.assertEqual(lst.count('a'), 10)
+                lst.reverse()
+                self.assertEqual(''.join(lst), text[::-1])
+                lst.deleteAll('b')
+                self.assertEqual(''.join(lst), text[::-1].replace('b', ''))
+
+    def test_buffer_is_zero_copy(self):
+        view = self.list.buffer()
+        self.assertEqual(view.tolist(), [ord(char) for char in "ABCDE"])
+        view[0] = ord('Q')
+        view.release()
+        self.assertEqual(self.list.get(0), 'Q')
+
+    def test_growing_while_buffer_is_held(self):
+        view = self.list.buffer()
+        with self.assertRaises(BufferError):
+            self.list.extend_from('b' * 4096)
+        view.release()
+        self.assertEqual(self.list.get(0), 'A')
+        self.assertEqual(self.list.delete(4), 'E')
+        self.list.extend_from('b' * 4096)
+        self.assertEqual(self.list.length(), 4100)
+        self.assertEqual(self.list.get(4099), 'b')
+
+    def test_large_file_opens_without_reading(self):
+        size = 1 << 28
+        large = os.path.join(self.directory.name, 'large.chrl')
+        with open(large, 'wb') as handle:
+            handle.write(HEADER.pack(mapped.MAGIC, mapped.VERSION, 1, 0, size, 0))
+            handle.truncate(HEADER.size + size)
+        start = time.perf_counter()
+        lst = MappedList(large)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        try:
+            self.assertEqual(lst.length(), size)
+            self.assertEqual(lst.get(size - 1), '\x00')
+            self.assertEqual(lst.findFirst('a', size - 10), -1)
+        finally:
+            lst.close()
+
+    def test_random_edits_match_python_list(self):
+        rng = random.Random(16)
+        with MappedList(width=2) as lst:
+            expected = []
+            for step in range(1000):
+                char = "abЖ"[step % 3]
+                if expected and rng.random() < 0.4:
+                    index = rng.randrange(len(expected))
+                    self.assertEqual(lst.delete(index), expected.pop(index))
+                else:
+                    index = rng.randint(0, len(expected))
+                    lst.insert(char, index)
+                    expected.insert(index, char)
+            self.assertEqual(list(lst), expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+import unittest
+
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.parallel import ParallelScanner
+
+
+class TestParallelScanner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scanner = ParallelScanner(max_workers=2, threshold=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.scanner.close()
+
+    def build(self, text, **options):
+        lst = ArrayBasedList(**options)
+        lst.extend_from(text)
+        return lst
+
+    def assertMatchesSerial(self, lst):
+        for element in "abzЖ":
+            self.assertEqual(self.scanner.findFirst(lst, element), lst.findFirst(element))
+            self.assertEqual(self.scanner.findLast(lst, element), lst.findLast(element))
+            self.assertEqual(self.scanner.count(lst, element), lst.count(element))
+        expected = lst.clone()
+        expected.deleteAll('b')
+        self.scanner.deleteAll(lst, 'b')
+        self.assertEqual(lst._text(), expected._text())
+
+    def test_matches_serial_results(self):
+        text = "xxaxbxxbЖxxxab" * 37 + "q\U0001F600"
+        for options in ({}, {'compact': True}):
+            self.assertMatchesSerial(self.build(text, **options))
+            self.assertMatchesSerial(self.build(text.replace("Ж", "y"), **options))
+            flipped = self.build(text, **options)
+            flipped.reverse()
+            self.assertMatchesSerial(flipped)
+            self.assertTrue(flipped.flipped)
+
+    def test_deleteAll_keeps_storage_kind(self):
+        lst = self.build("abcb" * 100, compact=True)
+        self.scanner.deleteAll(lst, 'b')
+        self.assertIsInstance(lst.items, bytearray)
+        self.assertEqual(lst._text(), "ac" * 100)
+        self.scanner.deleteAll(lst, 'z')
+        self.assertEqual(lst.length(), 200)
+
+    def test_clones_are_left_alone(self):
+        lst = self.build("abab" * 50)
+        clone = lst.clone()
+        self.scanner.deleteAll(lst, 'a')
+        self.assertEqual(lst._text(), "b" * 100)
+        self.assertEqual(clone._text(), "abab" * 50)
+
+    def test_small_and_indexed_lists_run_serially(self):
+        with ParallelScanner(max_workers=2) as scanner:
+            lst = self.build("abc")
+            self.assertEqual(scanner.findLast(lst, 'c'), 2)
+            scanner.deleteAll(lst, 'a')
+            self.assertIsNone(scanner.executor)
+        indexed = self.build("abcabc", indexed=True)
+        self.assertEqual(self.scanner.count(indexed, 'a'), 2)
+        self.scanner.deleteAll(indexed, 'a')
+        self.assertEqual(indexed.positions, {'b': [0, 2], 'c': [1, 3]})
+
+    def test_block_is_reused_until_the_list_changes(self):
+        with ParallelScanner(max_workers=2, threshold=0) as scanner:
+            lst = self.build("abcabc" * 20, compact=True)
+            self.assertEqual(scanner.count(lst, 'a'), 40)
+            block = scanner.block
+            self.assertEqual(scanner.findLast(lst, 'c'), 119)
+            self.assertIs(scanner.block, block)
+            scanner.deleteAll(lst, 'z')
+            self.assertIs(scanner.block, block)
+            lst.append('a')
+            self.assertEqual(scanner.count(lst, 'a'), 41)
+            self.assertIsNot(scanner.block, block)
+            # Another list at the same version gets its own copy.
+            other = self.build("xyz" * 40, compact=True)
+            self.assertEqual(other.version, 1)
+            self.assertEqual(scanner.count(other, 'a'), 0)
+            lst.reverse()
+            self.assertEqual(scanner.findFirst(lst, 'c'), 1)
+            lst._materialize()
+            self.assertEqual(scanner.findFirst(lst, 'c'), 1)
+            scanner.deleteAll(lst, 'b')
+            self.assertIsNone(scanner.block)
+            self.assertEqual(scanner.count(lst, 'b'), 0)
+            self.assertEqual(lst._text(), "ac" * 40 + "a")
+        self.assertIsNone(scanner.block)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.scanner.findFirst(self.build("abc"), "ab")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
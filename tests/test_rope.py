@@ -0,0 +1,143 @@
+import random
+import unittest
+from linked_lists.rope import Branch, RopeList
+
+
+def check_balanced(test, node):
+    if isinstance(node, Branch):
+        test.assertLessEqual(abs(node.left.height - node.right.height), 1)
+        test.assertEqual(node.size, node.left.size + node.right.size)
+        check_balanced(test, node.left)
+        check_balanced(test, node.right)
+
+
+class TestRopeList(unittest.TestCase):
+    def setUp(self):
+        self.list = RopeList()
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def contents(self, lst):
+        return ''.join(lst.get(i) for i in range(lst.length()))
+
+    def test_initial_empty_state(self):
+        self.assertEqual(RopeList().length(), 0)
+
+    def test_append_and_get(self):
+        self.list.append('F')
+        self.assertEqual(self.list.get(5), 'F')
+        self.assertEqual(self.list.length(), 6)
+
+    def test_insert(self):
+        self.list.insert('Z', 2)
+        self.list.insert('Y', 0)
+        self.list.insert('W', 7)
+        self.assertEqual(self.contents(self.list), "YABZCDEW")
+
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', -1)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 100)
+
+    def test_delete(self):
+        self.assertEqual(self.list.delete(1), 'B')
+        self.assertEqual(self.list.delete(0), 'A')
+        self.assertEqual(self.list.delete(2), 'E')
+        self.assertEqual(self.contents(self.list), "CD")
+
+        with self.assertRaises(ValueError):
+            self.list.delete(-1)
+        with self.assertRaises(ValueError):
+            self.list.delete(2)
+
+    def test_deleteAll(self):
+        self.list.append('A')
+        self.list.deleteAll('A')
+        self.assertEqual(self.contents(self.list), "BCDE")
+        self.list.deleteAll('Z')
+        self.assertEqual(self.list.length(), 4)
+
+    def test_clone_shares_structure(self):
+        clone = self.list.clone()
+        self.assertIs(clone.root, self.list.root)
+        clone.delete(0)
+        clone.append('Z')
+        self.assertEqual(self.contents(self.list), "ABCDE")
+        self.assertEqual(self.contents(clone), "BCDEZ")
+
+    def test_reverse(self):
+        self.list.reverse()
+        self.assertEqual(self.contents(self.list), "EDCBA")
+        empty_list = RopeList()
+        empty_list.reverse()
+        self.assertEqual(empty_list.length(), 0)
+
+    def test_find_operations(self):
+        self.list.append('C')
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findLast('C'), 5)
+        self.assertEqual(self.list.findFirst('Z'), -1)
+        self.assertEqual(self.list.findLast('Z'), -1)
+        self.assertEqual(RopeList().findLast('A'), -1)
+
+    def test_clear_and_extend(self):
+        other = RopeList()
+        other.append('X')
+        other.append('Y')
+        self.list.extend(other)
+        self.list.extend(self.list)
+        self.assertEqual(self.contents(self.list), "ABCDEXYABCDEXY")
+        self.assertEqual(self.contents(other), "XY")
+
+        self.list.clear()
+        self.assertEqual(self.list.length(), 0)
+
+    def test_extend_from(self):
+        self.list.extend_from("FG")
+        self.list.extend_from(['H'])
+        self.list.extend_from("")
+        self.assertEqual(self.list._text(), "ABCDEFGH")
+        with self.assertRaises(ValueError):
+            self.list.extend_from(['I', 'JK'])
+        self.assertEqual(self.list.length(), 8)
+
+    def test_validation_errors(self):
+        with self.assertRaises(ValueError):
+            self.list.append(123)
+        with self.assertRaises(ValueError):
+            self.list.insert("AB", 0)
+        with self.assertRaises(ValueError):
+            self.list.findLast("")
+
+    def test_random_edits_stay_balanced(self):
+        rng = random.Random(3)
+        lst = RopeList()
+        expected = []
+        for step in range(3000):
+            if expected and rng.random() < 0.3:
+                index = rng.randrange(len(expected))
+                self.assertEqual(lst.delete(index), expected.pop(index))
+            else:
+                index = rng.randint(0, len(expected))
+                char = chr(ord('a') + step % 26)
+                lst.insert(char, index)
+                expected.insert(index, char)
+        self.assertEqual(self.contents(lst), ''.join(expected))
+        check_balanced(self, lst.root)
+
+    def test_extend_stays_balanced(self):
+        big = RopeList()
+        for _ in range(2000):
+            big.append('a')
+        small = RopeList()
+        small.append('b')
+        for _ in range(5):
+            small.extend(big)
+            big.extend(small)
+        check_balanced(self, small.root)
+        check_balanced(self, big.root)
+        self.assertEqual(big.findFirst('b'), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+import random
+import unittest
+from linked_lists.skip_list import MAX_LEVEL, IndexableSkipList
+
+
+def check_widths(test, lst):
+    # Every link must skip exactly the number of positions between its ends.
+    positions = {id(lst.head): 0}
+    node = lst.head.next[0]
+    position = 1
+    while node is not None:
+        positions[id(node)] = position
+        node = node.next[0]
+        position += 1
+
+    node = lst.head
+    while node is not None:
+        for level in range(len(node.next)):
+            target = node.next[level]
+            end = positions[id(target)] if target is not None else lst.size + 1
+            test.assertEqual(node.width[level], end - positions[id(node)])
+        node = node.next[0]
+
+
+class TestIndexableSkipList(unittest.TestCase):
+    def setUp(self):
+        self.list = IndexableSkipList()
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def test_initial_empty_state(self):
+        self.assertEqual(IndexableSkipList().length(), 0)
+
+    def test_append_and_get(self):
+        self.list.append('F')
+        self.assertEqual(self.list.get(5), 'F')
+        self.assertEqual(self.list.length(), 6)
+        self.assertEqual(list(self.list), list("ABCDEF"))
+
+    def test_insert(self):
+        self.list.insert('Z', 2)
+        self.list.insert('Y', 0)
+        self.list.insert('W', 7)
+        self.assertEqual(list(self.list), list("YABZCDEW"))
+        check_widths(self, self.list)
+
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', -1)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 100)
+
+    def test_delete(self):
+        self.assertEqual(self.list.delete(1), 'B')
+        self.assertEqual(self.list.delete(0), 'A')
+        self.assertEqual(self.list.delete(2), 'E')
+        self.assertEqual(list(self.list), list("CD"))
+        check_widths(self, self.list)
+
+        with self.assertRaises(ValueError):
+            self.list.delete(-1)
+        with self.assertRaises(ValueError):
+            self.list.delete(2)
+
+    def test_boundary_indices(self):
+        self.assertEqual(self.list.get(0), 'A')
+        self.assertEqual(self.list.get(4), 'E')
+        with self.assertRaises(ValueError):
+            self.list.get(5)
+        with self.assertRaises(ValueError):
+            IndexableSkipList().get(0)
+
+    def test_deleteAll(self):
+        self.list.append('A')
+        self.list.deleteAll('A')
+        self.assertEqual(list(self.list), list("BCDE"))
+        check_widths(self, self.list)
+
+    def test_clone(self):
+        clone = self.list.clone()
+        clone.delete(0)
+        self.assertEqual(list(clone), list("BCDE"))
+        self.assertEqual(list(self.list), list("ABCDE"))
+
+    def test_reverse(self):
+        self.list.reverse()
+        self.assertEqual(list(self.list), list("EDCBA"))
+        self.assertEqual(self.list.get(4), 'A')
+
+    def test_find_operations(self):
+        self.list.append('C')
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findLast('C'), 5)
+        self.assertEqual(self.list.findFirst('Z'), -1)
+        self.assertEqual(self.list.findLast('Z'), -1)
+
+    def test_clear_and_extend(self):
+        other = IndexableSkipList()
+        other.append('X')
+        other.append('Y')
+        self.list.extend(other)
+        self.list.extend(self.list)
+        self.assertEqual(''.join(self.list), "ABCDEXYABCDEXY")
+        check_widths(self, self.list)
+
+        self.list.clear()
+        self.assertEqual(self.list.length(), 0)
+        self.list.append('Q')
+        self.assertEqual(self.list.get(0), 'Q')
+
+    def test_validation_errors(self):
+        with self.assertRaises(ValueError):
+            self.list.append(123)
+        with self.assertRaises(ValueError):
+            self.list.insert("AB", 0)
+        with self.assertRaises(ValueError):
+            self.list.findFirst("")
+
+    def test_random_levels_are_bounded(self):
+        levels = [self.list._random_level() for _ in range(1000)]
+        self.assertTrue(all(1 <= level <= MAX_LEVEL for level in levels))
+        self.assertGreater(levels.count(1), 300)
+
+    def test_random_edits_match_python_list(self):
+        rng = random.Random(5)
+        expected = []
+        lst = IndexableSkipList()
+        for step in range(2000):
+            if expected and rng.random() < 0.4:
+                index = rng.randrange(len(expected))
+                self.assertEqual(lst.delete(index), expected.pop(index))
+            else:
+                index = rng.randint(0, len(expected))
+                char = chr(ord('a') + step % 26)
+                lst.insert(char, index)
+                expected.insert(index, char)
+        self.assertEqual(list(lst), expected)
+        self.assertEqual([lst.get(i) for i in range(len(expected))], expected)
+        check_widths(self, lst)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
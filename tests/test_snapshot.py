@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from linked_lists import snapshot
+from linked_lists.mapped import MappedList
+from linked_lists.snapshot import HEADER
+
+
+class TestSnapshotFormat(unittest.TestCase):
+    def test_narrowest_width_is_used(self):
+        self.assertEqual(snapshot.encode(""), (1, b""))
+        self.assertEqual(snapshot.encode("aé"), (1, b"a\xe9"))
+        self.assertEqual(snapshot.encode("aЖ"), (2, "aЖ".encode('utf-16-le')))
+        self.assertEqual(snapshot.encode("a\U0001F600")[0], 4)
+        self.assertEqual(snapshot.encode("a\ud800")[0], 4)
+
+    def test_round_trip(self):
+        for text in ("", "hello", "aЖb", "a\U0001F600", "\ud800x"):
+            for checksum in (True, False):
+                data = snapshot.pack(*snapshot.encode(text), checksum)
+                self.assertEqual(len(data), HEADER.size + len(snapshot.encode(text)[1]))
+                self.assertEqual(snapshot.decode(*snapshot.unpack(data)), text)
+
+    def test_header_fields(self):
+        data = snapshot.pack(*snapshot.encode("aЖb"))
+        magic, version, width, flags, length, _ = HEADER.unpack_from(data)
+        self.assertEqual((magic, version, width, flags, length),
+                         (snapshot.MAGIC, snapshot.VERSION, 2, snapshot.FLAG_CHECKSUM, 3))
+
+    def test_corruption_is_detected(self):
+        data = bytearray(snapshot.pack(*snapshot.encode("hello")))
+        data[-1] ^= 1
+        with self.assertRaisesRegex(ValueError, "checksum"):
+            snapshot.unpack(data)
+        unchecked = bytearray(snapshot.pack(*snapshot.encode("hello"), checksum=False))
+        unchecked[-1] ^= 1
+        self.assertEqual(snapshot.decode(*snapshot.unpack(unchecked)), "helln")
+
+    def test_invalid_snapshots(self):
+        data = snapshot.pack(*snapshot.encode("hello"))
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            snapshot.unpack(data[:-1])
+        with self.assertRaisesRegex(ValueError, "Not a character list"):
+            snapshot.unpack(b"XXXX" + data[4:])
+        with self.assertRaisesRegex(ValueError, "Not a character list"):
+            snapshot.unpack(data[:10])
+        with self.assertRaisesRegex(ValueError, "version"):
+            snapshot.unpack(data[:4] + bytes([snapshot.VERSION + 1]) + data[5:])
+
+    def test_mapped_list_opens_saved_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'list.chrl')
+            snapshot.save(path, *snapshot.encode("abЖ"))
+            with MappedList(path) as lst:
+                self.assertEqual(''.join(lst), "abЖ")
+                lst.append('c')
+            self.assertEqual(snapshot.decode(*snapshot.unpack(snapshot.load(path))), "abЖc")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+
+from linked_lists import streaming
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+
+
+async def produce(items):
+    for item in items:
+        yield item
+
+
+class RecordingTransport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def pause_reading(self):
+        self.calls.append('pause')
+
+    def resume_reading(self):
+        self.calls.append('resume')
+
+
+def contents(lst) -> str:
+    return ''.join(lst.get(i) for i in range(lst.length()))
+
+
+class TestStreaming(unittest.TestCase):
+    factories = (ArrayBasedList, lambda: ArrayBasedList(compact=True), CircularLinkedList)
+
+    def test_aextend_accepts_characters_and_chunks(self):
+        for factory in self.factories:
+            lst = factory()
+            lst.append('>')
+            asyncio.run(lst.aextend(produce(["a", "bc", "", "Ж" * 10, "d"]), batch_size=4))
+            self.assertEqual(contents(lst), ">abc" + "Ж" * 10 + "d")
+
+    def test_aextend_rejects_non_strings(self):
+        lst = CircularLinkedList()
+        with self.assertRaises(ValueError):
+            asyncio.run(lst.aextend(produce(["ab", 3])))
+
+    def test_aextend_yields_to_the_loop(self):
+        async def scenario():
+            ticks = []
+            lst = ArrayBasedList()
+            stop = asyncio.Event()
+
+            async def ticker():
+                while not stop.is_set():
+                    ticks.append(lst.length())
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await lst.aextend(produce(["x" * 10000]), batch_size=1000)
+            stop.set()
+            await task
+            return ticks
+
+        ticks = asyncio.run(scenario())
+        # The ticker saw the list grow batch by batch.
+        self.assertGreaterEqual(len(set(ticks)), 9)
+        self.assertTrue(all(tick % 1000 == 0 for tick in ticks))
+
+    def test_async_for_reads_a_snapshot(self):
+        async def scenario(lst):
+            seen = []
+            async for char in lst:
+                if not seen:
+                    lst.append('!')
+                seen.append(char)
+            return ''.join(seen)
+
+        for factory in self.factories:
+            lst = factory()
+            lst.extend_from("abc" * 3000)
+            lst.reverse()
+            self.assertEqual(asyncio.run(scenario(lst)), "cba" * 3000)
+            self.assertEqual(lst.length(), 9001)
+
+    def test_stream_ingestion_reassembles_split_characters(self):
+        async def scenario():
+            reader = asyncio.StreamReader()
+            data = "héllo Ж \U0001F600".encode('utf-8')
+            for byte in data:
+                reader.feed_data(bytes([byte]))
+            reader.feed_eof()
+            lst = CircularLinkedList()
+            await streaming.ingest_stream(lst, reader, batch_size=2)
+            return lst
+
+        self.assertEqual(''.join(asyncio.run(scenario())), "héllo Ж \U0001F600")
+
+    def test_stream_ingestion_applies_backpressure(self):
+        async def scenario():
+            reader = asyncio.StreamReader(limit=64)
+            transport = RecordingTransport()
+            reader.set_transport(transport)
+            reader.feed_data(b"a" * 1000)
+            reader.feed_eof()
+            lst = ArrayBasedList(compact=True)
+            await streaming.ingest_stream(lst, reader, encoding='latin-1', batch_size=32)
+            return lst, transport.calls
+
+        lst, calls = asyncio.run(scenario())
+        self.assertEqual(lst.length(), 1000)
+        self.assertEqual(calls[:2], ['pause', 'resume'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,303 @@
+import asyncio
+import random
+import sys
+import threading
+import unittest
+
+from linked_lists.array_based import ArrayBasedList
+from linked_lists.circular import CircularLinkedList
+from linked_lists.gap_buffer import GapBufferList
+from linked_lists.rope import RopeList
+from linked_lists.threadsafe import ConcurrentCircularList, ConcurrentList, RWLock
+
+THREADS = 8
+OPERATIONS = 1500
+
+
+def hammer(lst, seed: int, errors: list) -> None:
+    # Random mix of reads and writes; index errors are expected since other
+    # threads change the length between calls.
+    rng = random.Random(seed)
+    try:
+        for step in range(OPERATIONS):
+            action = rng.random()
+            char = "abcd"[step % 4]
+            try:
+                if action < 0.3:
+                    lst.append(char)
+                elif action < 0.5:
+                    lst.insert(char, rng.randint(0, max(len(lst) - 1, 0)))
+                elif action < 0.65:
+                    lst.delete(rng.randint(0, max(len(lst) - 1, 0)))
+                elif action < 0.7:
+                    lst.deleteAll('d')
+                elif action < 0.8:
+                    lst.get(rng.randint(0, max(len(lst) - 1, 0)))
+                else:
+                    lst.findFirst(char)
+                    lst.findLast(char)
+            except ValueError:
+                pass
+    except Exception as error:
+        errors.append(error)
+
+
+def run_threads(target, *args) -> list:
+    # A short switch interval makes threads interleave inside operations.
+    errors = []
+    threads = [threading.Thread(target=target, args=args + (seed, errors)) for seed in range(THREADS)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return errors
+
+
+class TestRWLock(unittest.TestCase):
+    def test_readers_share_the_lock(self):
+        lock = RWLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def reader():
+            with lock.read():
+                barrier.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(barrier.broken)
+
+    def test_writer_excludes_readers(self):
+        lock = RWLock()
+        entered = threading.Event()
+        lock.acquire_write()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), entered.set(), lock.release_read()))
+        reader.start()
+        self.assertFalse(entered.wait(0.1))
+        lock.release_write()
+        self.assertTrue(entered.wait(5))
+        reader.join()
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = RWLock()
+        lock.acquire_read()
+        wrote = threading.Event()
+        writer = threading.Thread(target=lambda: (lock.acquire_write(), wrote.set(), lock.release_write()))
+        writer.start()
+        while not lock.waiting_writers:
+            pass
+        read = threading.Event()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), read.set(), lock.release_read()))
+        reader.start()
+        self.assertFalse(read.wait(0.1))
+        lock.release_read()
+        self.assertTrue(wrote.wait(5))
+        self.assertTrue(read.wait(5))
+        writer.join()
+        reader.join()
+
+
+class TestConcurrentList(unittest.TestCase):
+    def assertRingConsistent(self, lst):
+        if not lst.size:
+            self.assertIsNone(lst.tail)
+            return
+        node = lst.tail
+        for _ in range(lst.size):
+            node = node.next
+        self.assertIs(node, lst.tail)
+        self.assertEqual(len(list(lst)), lst.size)
+
+    def test_stress_circular(self):
+        lst = ConcurrentList(CircularLinkedList())
+        lst.extend_from("abcd" * 50)
+        self.assertEqual(run_threads(hammer, lst), [])
+        self.assertRingConsistent(lst.list)
+
+    def test_stress_array(self):
+        lst = ConcurrentList(ArrayBasedList(indexed=True))
+        lst.extend_from("abcd" * 50)
+        self.assertEqual(run_threads(hammer, lst), [])
+        inner = lst.list
+        text = ''.join(inner.get(i) for i in range(inner.length()))
+        self.assertEqual(inner.count('a'), text.count('a'))
+
+    def test_wrapper_api(self):
+        lst = ConcurrentList(CircularLinkedList())
+        lst.extend_from("abc")
+        lst.insert('x', 0)
+        self.assertEqual(list(lst), list("xabc"))
+        self.assertEqual(lst.findFirst('b'), 2)
+        clone = lst.clone()
+        clone.append('d')
+        lst.extend(clone)
+        lst.extend(lst)
+        self.assertEqual(''.join(lst), "xabcxabcdxabcxabcd")
+        self.assertEqual(len(lst), 18)
+        with self.assertRaises(AttributeError):
+            lst.cursor()
+
+    def test_later_list_methods(self):
+        lst = ConcurrentList(CircularLinkedList())
+        lst.extend_from("abcdef")
+        lst.apply_edits([('delete', 0), ('insert', 'x', 6)])
+        with lst.batch() as batch:
+            batch.insert('y', 0)
+        lst.rotate(1)
+        self.assertEqual(''.join(lst), "xybcdef")
+        self.assertEqual(lst[1], 'y')
+        self.assertEqual(lst[1:4], list("ybc"))
+        lst[0:2] = "Q"
+        del lst[::2]
+        self.assertEqual(''.join(lst), "bdf")
+
+        async def chunks():
+            yield "gh"
+            yield "i"
+
+        asyncio.run(lst.aextend(chunks(), batch_size=2))
+        self.assertEqual(''.join(lst), "bdfghi")
+
+    def test_iterates_every_list_type(self):
+        for inner in (ArrayBasedList(), ArrayBasedList(compact=True), GapBufferList(), RopeList()):
+            lst = ConcurrentList(inner)
+            for char in "abc":
+                lst.append(char)
+            lst.reverse()
+            self.assertEqual(''.join(lst), "cba")
+
+
+class TestConcurrentCircularList(unittest.TestCase):
+    def setUp(self):
+        self.list = ConcurrentCircularList()
+        self.list.extend_from("ABCDE")
+
+    def assertRingConsistent(self, lst):
+        node = lst.sentinel
+        count = 0
+        while node.next is not lst.sentinel:
+            node = node.next
+            self.assertIsNotNone(node.next)
+            self.assertFalse(node.lock.locked())
+            count += 1
+        self.assertIs(node, lst.tail)
+        self.assertEqual(count, lst.size)
+
+    def test_api(self):
+        self.list.insert('Z', 2)
+        self.list.append('A')
+        self.assertEqual(list(self.list), list("ABZCDEA"))
+        self.assertEqual(self.list.get(2), 'Z')
+        self.assertEqual(self.list.delete(6), 'A')
+        self.assertEqual(self.list.findFirst('C'), 3)
+        self.list.append('C')
+        self.assertEqual(self.list.findLast('C'), 6)
+        self.assertEqual(self.list.count('C'), 2)
+        self.list.deleteAll('C')
+        self.assertEqual(list(self.list), list("ABZDE"))
+        self.assertRingConsistent(self.list)
+
+        with self.assertRaises(ValueError):
+            self.list.get(5)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 6)
+        with self.assertRaises(ValueError):
+            self.list.delete(5)
+        with self.assertRaises(ValueError):
+            self.list.append("AB")
+        with self.assertRaises(ValueError):
+            self.list.extend_from(["A", 1])
+        self.assertRingConsistent(self.list)
+
+    def test_whole_ring_methods(self):
+        clone = self.list.clone()
+        self.list.reverse()
+        self.assertEqual(list(self.list), list("EDCBA"))
+        self.assertRingConsistent(self.list)
+        self.list.append('Z')
+        self.list.extend(self.list)
+        self.assertEqual(self.list._text(), "EDCBAZEDCBAZ")
+        self.assertEqual(self.list.findSubsequence("AZE"), 4)
+        self.assertEqual(self.list.findSubsequence(["B", "Z"]), -1)
+        self.list.extend(clone)
+        self.assertEqual(self.list.length(), 17)
+        self.assertRingConsistent(self.list)
+        self.list.clear()
+        self.assertEqual(list(self.list), [])
+        self.assertRingConsistent(self.list)
+        self.list.reverse()
+        self.list.append('Q')
+        self.assertEqual(list(self.list), ['Q'])
+        self.assertEqual(list(clone), list("ABCDE"))
+        self.assertRingConsistent(clone)
+
+    def test_whole_ring_methods_under_load(self):
+        def worker(lst, seed, errors):
+            # Whole-ring passes mixed with appends and edits at the front.
+            rng = random.Random(seed)
+            try:
+                for _ in range(OPERATIONS // 5):
+                    action = rng.random()
+                    try:
+                        if action < 0.05:
+                            lst.reverse()
+                        elif action < 0.07:
+                            lst.clear()
+                        elif action < 0.1:
+                            clone = lst.clone()
+                            self.assertEqual(len(clone._text()), clone.length())
+                        elif action < 0.6:
+                            lst.append('a')
+                        elif action < 0.8:
+                            lst.insert('b', 1)
+                        else:
+                            lst.delete(0)
+                    except ValueError:
+                        pass
+            except Exception as error:
+                errors.append(error)
+
+        self.assertEqual(run_threads(worker, self.list), [])
+        self.assertRingConsistent(self.list)
+        self.assertEqual(len(self.list._text()), self.list.length())
+
+    def test_delete_everything(self):
+        for _ in range(5):
+            self.list.delete(0)
+        self.assertIs(self.list.tail, self.list.sentinel)
+        self.list.append('Q')
+        self.assertEqual(list(self.list), ['Q'])
+        self.list.deleteAll('Q')
+        self.assertEqual(self.list.length(), 0)
+        self.assertRingConsistent(self.list)
+
+    def test_writers_in_other_regions_proceed(self):
+        self.list.extend_from("x" * 20)
+        # Hold the lock of a node far down the ring, as a slow writer there
+        # would; an edit near the front must still go through.
+        far = self.list.sentinel
+        for _ in range(15):
+            far = far.next
+        with far.lock:
+            writer = threading.Thread(target=lambda: (self.list.insert('N', 1), self.list.delete(0)))
+            writer.start()
+            writer.join(5)
+            self.assertFalse(writer.is_alive())
+        self.assertEqual(self.list.get(0), 'N')
+
+    def test_stress(self):
+        self.list.extend_from("abcd" * 50)
+        self.assertEqual(run_threads(hammer, self.list), [])
+        self.assertRingConsistent(self.list)
+        self.assertEqual(len(list(self.list)), self.list.length())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,195 @@
+import random
+import unittest
+from itertools import islice
+from unittest import mock
+
+from linked_lists import unrolled
+from linked_lists.unrolled import UnrolledCircularList
+
+
+def check_ring(test, lst):
+    blocks = list(lst._blocks())
+    test.assertEqual(len(blocks), lst.blocks)
+    test.assertEqual(sum(len(block.text) for block in blocks), lst.size)
+    if blocks:
+        test.assertIs(blocks[-1], lst.tail)
+        test.assertIs(lst.tail.next, blocks[0])
+    for block in blocks:
+        test.assertTrue(0 < len(block.text) <= unrolled.BLOCK_SIZE)
+
+
+class TestUnrolledCircularList(unittest.TestCase):
+    def setUp(self):
+        self.list = UnrolledCircularList()
+        for char in "ABCDE":
+            self.list.append(char)
+
+    def contents(self, lst):
+        return ''.join(lst)
+
+    def test_initial_empty_state(self):
+        empty_list = UnrolledCircularList()
+        self.assertEqual(empty_list.length(), 0)
+        self.assertIsNone(empty_list.head)
+        self.assertEqual(list(empty_list), [])
+
+    def test_append_and_get(self):
+        self.list.append('F')
+        self.assertEqual(self.list.get(5), 'F')
+        self.assertEqual(len(self.list), 6)
+        self.assertEqual(self.list.blocks, 1)
+
+    def test_insert(self):
+        self.list.insert('Z', 2)
+        self.list.insert('Y', 0)
+        self.list.insert('W', 7)
+        self.assertEqual(self.contents(self.list), "YABZCDEW")
+
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', -1)
+        with self.assertRaises(ValueError):
+            self.list.insert('Q', 100)
+
+    def test_delete(self):
+        self.assertEqual(self.list.delete(1), 'B')
+        self.assertEqual(self.list.delete(0), 'A')
+        self.assertEqual(self.list.delete(2), 'E')
+        self.assertEqual(self.contents(self.list), "CD")
+        self.list.delete(0)
+        self.list.delete(0)
+        self.assertIsNone(self.list.tail)
+
+        with self.assertRaises(ValueError):
+            self.list.delete(0)
+
+    def test_blocks_reduce_node_count(self):
+        lst = UnrolledCircularList()
+        lst.extend_from('a' * 3200)
+        self.assertEqual(lst.blocks, 3200 // unrolled.BLOCK_SIZE)
+        check_ring(self, lst)
+
+    def test_deleteAll(self):
+        self.list.extend_from("AXA")
+        self.list.deleteAll('A')
+        self.assertEqual(self.contents(self.list), "BCDEX")
+        self.list.deleteAll('Z')
+        self.assertEqual(self.list.length(), 5)
+
+    def test_clone(self):
+        clone = self.list.clone()
+        clone.delete(0)
+        clone.append('Z')
+        self.assertEqual(self.contents(clone), "BCDEZ")
+        self.assertEqual(self.contents(self.list), "ABCDE")
+
+    def test_reverse(self):
+        self.list.extend_from("FGHIJ" * 20)
+        expected = self.contents(self.list)[::-1]
+        self.list.reverse()
+        self.assertEqual(self.contents(self.list), expected)
+        self.assertEqual(''.join(reversed(self.list)), expected[::-1])
+        check_ring(self, self.list)
+
+    def test_search(self):
+        self.list.extend_from("ABCDE" * 10)
+        self.assertEqual(self.list.findFirst('C'), 2)
+        self.assertEqual(self.list.findFirst('C', 3), 7)
+        self.assertEqual(self.list.findFirst('C', 3, 7), -1)
+        self.assertEqual(self.list.findLast('C'), 52)
+        self.assertEqual(self.list.findLast('C', 0, 52), 47)
+        self.assertEqual(self.list.count('E'), 11)
+        self.assertEqual(self.list.findSubsequence("EA"), 4)
+        self.assertEqual(self.list.findFirst('Z'), -1)
+
+    def test_search_after_short_first_block(self):
+        lst = UnrolledCircularList()
+        lst.extend_from('a' * 32 + 'b' + 'a' * 31)
+        lst.delete_range(0, 22)
+        self.assertLess(len(lst.head.text), unrolled.BLOCK_SIZE)
+        self.assertEqual(lst.findFirst('b'), 10)
+        self.assertEqual(lst.findFirst('b', 5, 11), 10)
+        self.assertEqual(lst.findFirst('b', 11), -1)
+        self.assertEqual(lst.findFirst('b', 0, 10), -1)
+        self.assertEqual(lst.findLast('b'), 10)
+        self.assertEqual(lst.findLast('b', 5, 11), 10)
+        self.assertEqual(lst.findLast('b', 11), -1)
+        self.assertEqual(lst.findLast('a', 0, 10), 9)
+        self.assertEqual(lst.findLast('a', -3, -1), 40)
+
+    def test_findLast_searches_block_by_block(self):
+        lst = UnrolledCircularList()
+        lst.extend_from('ab' * 100)
+        lst.delete_range(0, 5)
+        with mock.patch.object(lst, '_text', side_effect=AssertionError):
+            self.assertEqual(lst.findLast('a'), 193)
+            self.assertEqual(lst.findLast('b', 0, 60), 58)
+            self.assertEqual(lst.findLast('z'), -1)
+
+    def test_cursor_and_cycle(self):
+        cursor = self.list.cursor(4)
+        self.assertEqual(cursor.next(), 'E')
+        self.assertEqual(cursor.peek(), 'A')
+        cursor.insert_after('X')
+        self.assertEqual(cursor.remove(), 'A')
+        self.assertEqual(cursor.peek(), 'X')
+        self.assertEqual(''.join(islice(self.list.cycle(), 7)), "XBCDEXB")
+
+    def test_bulk_operations(self):
+        self.list.insert_many(2, "xyz")
+        self.list.extend_from(['1', '2'])
+        self.assertEqual(self.contents(self.list), "ABxyzCDE12")
+        self.list.delete_range(1, 6)
+        self.assertEqual(self.contents(self.list), "ADE12")
+        with self.assertRaises(ValueError):
+            self.list.delete_range(3, 9)
+        with self.assertRaises(ValueError):
+            self.list.extend_from(['ab'])
+
+    def test_clear_and_extend(self):
+        other = UnrolledCircularList()
+        other.extend_from("XY")
+        self.list.extend(other)
+        self.list.extend(self.list)
+        self.assertEqual(self.contents(self.list), "ABCDEXYABCDEXY")
+        self.list.clear()
+        self.assertEqual(self.list.length(), 0)
+
+    def test_validation_errors(self):
+        with self.assertRaises(ValueError):
+            self.list.append(123)
+        with self.assertRaises(ValueError):
+            self.list.insert("AB", 0)
+        with self.assertRaises(ValueError):
+            self.list.findLast("")
+
+    def test_random_edits_with_small_blocks(self):
+        rng = random.Random(11)
+        with mock.patch.object(unrolled, 'BLOCK_SIZE', 4):
+            lst = UnrolledCircularList()
+            expected = []
+            for step in range(3000):
+                roll = rng.random()
+                char = chr(ord('a') + step % 26)
+                if expected and roll < 0.35:
+                    index = rng.randrange(len(expected))
+                    self.assertEqual(lst.delete(index), expected.pop(index))
+                elif expected and roll < 0.4:
+                    start = rng.randrange(len(expected))
+                    stop = min(len(expected), start + rng.randint(0, 9))
+                    lst.delete_range(start, stop)
+                    del expected[start:stop]
+                elif roll < 0.45:
+                    index = rng.randint(0, len(expected))
+                    lst.insert_many(index, char * 6)
+                    expected[index:index] = char * 6
+                else:
+                    index = rng.randint(0, len(expected))
+                    lst.insert(char, index)
+                    expected.insert(index, char)
+                check_ring(self, lst)
+            self.assertEqual(list(lst), expected)
+            self.assertEqual([lst.get(i) for i in range(len(expected))], expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)